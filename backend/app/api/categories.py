@@ -1,10 +1,11 @@
 # backend/app/api/categories.py
 
 from fastapi import APIRouter, Depends, HTTPException, Path
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.services.post_service import CategoryService
+from app.services.response_cache import response_cache, CATEGORIES_TAG, category_tag
 from app.schemas import (
     CategoryCreate, CategoryUpdate, Category, BaseResponse
 )
@@ -15,11 +16,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 @router.get("/", response_model=List[Category])
-async def get_categories(db: Session = Depends(get_db)):
+async def get_categories(db: AsyncSession = Depends(get_async_db)):
     """카테고리 목록 조회"""
+    async def load():
+        categories = await CategoryService.get_categories(db=db)
+        return [Category.model_validate(category) for category in categories]
+    
     try:
-        categories = CategoryService.get_categories(db=db)
-        return categories
+        return await response_cache.fetch("categories.list", {}, [CATEGORIES_TAG], load)
     except Exception as e:
         logger.error(f"카테고리 목록 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="카테고리 목록 조회에 실패했습니다.")
@@ -27,14 +31,19 @@ async def get_categories(db: Session = Depends(get_db)):
 @router.get("/{category_id}", response_model=Category)
 async def get_category(
     category_id: int = Path(..., description="카테고리 ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """카테고리 상세 조회"""
-    try:
-        category = CategoryService.get_category(db=db, category_id=category_id)
+    async def load():
+        category = await CategoryService.get_category(db=db, category_id=category_id)
         if not category:
             raise HTTPException(status_code=404, detail="카테고리를 찾을 수 없습니다.")
-        return category
+        return Category.model_validate(category)
+    
+    try:
+        return await response_cache.fetch(
+            "categories.detail", {"category_id": category_id}, [category_tag(category_id)], load
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -44,11 +53,11 @@ async def get_category(
 @router.post("/", response_model=Category, status_code=201)
 async def create_category(
     category_data: CategoryCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """새 카테고리 생성"""
     try:
-        category = CategoryService.create_category(db=db, category_data=category_data)
+        category = await CategoryService.create_category(db=db, category_data=category_data)
         return category
     except Exception as e:
         logger.error(f"카테고리 생성 실패: {str(e)}")
@@ -58,11 +67,11 @@ async def create_category(
 async def update_category(
     category_id: int = Path(..., description="카테고리 ID"),
     category_data: CategoryUpdate = ...,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """카테고리 수정"""
     try:
-        updated_category = CategoryService.update_category(
+        updated_category = await CategoryService.update_category(
             db=db, category_id=category_id, category_data=category_data
         )
         if not updated_category:
@@ -77,11 +86,11 @@ async def update_category(
 @router.delete("/{category_id}", response_model=BaseResponse)
 async def delete_category(
     category_id: int = Path(..., description="카테고리 ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """카테고리 삭제"""
     try:
-        success = CategoryService.delete_category(db=db, category_id=category_id)
+        success = await CategoryService.delete_category(db=db, category_id=category_id)
         if not success:
             raise HTTPException(status_code=404, detail="카테고리를 찾을 수 없습니다.")
         
@@ -0,0 +1,43 @@
+# backend/app/api/keywords.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.core.database import get_async_db
+from app.services.keyword_service import keyword_index
+from app.services.response_cache import response_cache, POSTS_TAG
+from app.schemas import KeywordCount, TopKeywordsResponse
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/keywords", tags=["keywords"])
+
+@router.get("/top", response_model=TopKeywordsResponse)
+async def get_top_keywords(
+    category_id: Optional[int] = Query(None, description="카테고리 ID (생략하면 전체)"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 키워드 수"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    요약 키워드 중 게시물 수가 많은 순서
+
+    키워드 색인(post_keywords)에서 집계하므로 요약 JSON을 읽지 않습니다.
+    대체 요약(fallback)의 키워드는 포함하지 않습니다.
+    해당 키워드의 게시물 목록은 GET /posts?keyword= 로 조회합니다.
+    """
+    async def load():
+        keywords = await keyword_index.top_keywords(db, category_id=category_id, limit=limit)
+        return TopKeywordsResponse(
+            category_id=category_id,
+            keywords=[KeywordCount(keyword=name, post_count=count) for name, count in keywords]
+        )
+
+    try:
+        # 요약 저장시 POSTS_TAG가 무효화되므로 같은 태그 사용
+        return await response_cache.fetch(
+            "keywords.top", {"category_id": category_id, "limit": limit}, [POSTS_TAG], load
+        )
+    except Exception as e:
+        logger.error(f"상위 키워드 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail="상위 키워드 조회에 실패했습니다.")
@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter, Body
 from app.services.llm_service import llm_service
+from app.services.summary_cache import summary_cache
+from app.utils.helpers import event_stream_response
 import asyncio
 
 router = APIRouter()
@@ -15,3 +17,46 @@ async def ask_llm(prompt: str = Body(..., example="서울의 봄날씨를 시적
     """
     answer = await llm_service.ask_llm(prompt)
     return {"answer": answer}
+
+@router.post("/ask-llm/stream", summary="LLM 자연어 질의응답 (스트리밍)", tags=["llm"])
+async def ask_llm_stream(prompt: str = Body(..., example="서울의 봄날씨를 시적으로 묘사해줘")):
+    """
+    /ask-llm/ 의 Server-Sent Events 버전입니다.
+    - token 이벤트: 생성된 텍스트 조각 ({"text": ...})
+    - done 이벤트: 전체 답변 ({"answer": ...})
+    - error 이벤트: 실패 안내 ({"message": ...})
+    """
+    return event_stream_response(llm_service.stream_answer(prompt))
+
+@router.get("/summary-cache/stats", summary="요약 캐시 통계", tags=["llm"])
+async def get_summary_cache_stats():
+    """
+    요약 캐시의 적중/실패 카운터와 현재 크기를 반환합니다.
+    """
+    return summary_cache.stats()
+
+@router.get("/llm/coalescing/stats", summary="LLM 요청 합치기 통계", tags=["llm"])
+async def get_llm_coalescing_stats():
+    """
+    동시에 들어온 같은 요약/질문 요청을 합친 횟수를 반환합니다.
+    - calls: 실제 LLM 호출 수, coalesced: 합류해서 절약한 호출 수
+    - superseded: 새 미리보기 요청으로 대체된 수, cancelled: 기다리는 요청이 없어 취소한 호출 수
+    """
+    return llm_service.coalescing_stats()
+
+@router.get("/llm/providers", summary="LLM 공급자 선택 설정", tags=["llm"])
+async def get_llm_providers():
+    """
+    요약/질문에 사용하는 LLM 공급자를 반환합니다.
+    - default: 기본 공급자, short_input: 짧은 입력(short_input_tokens 이하)용 공급자
+    - failover: 실패시 시도하는 공급자, ask: 자유 질문에 시도하는 순서
+    """
+    return llm_service.provider_routing()
+
+@router.get("/llm/scheduler/stats", summary="LLM 호출 스케줄러 통계", tags=["llm"])
+async def get_llm_scheduler_stats():
+    """
+    우선순위별 호출 한도 통과/거절 수, 평균 대기 시간, 대기열 길이, 버킷 잔량을 반환합니다.
+    - interactive: 미리보기, 자유 질문 / background: 요약 워커, 요약 재생성
+    """
+    return llm_service.scheduler_stats()
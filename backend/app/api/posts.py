@@ -1,29 +1,44 @@
 # backend/app/api/posts.py
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from sqlalchemy.orm import Session
-from typing import Optional, List
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Path
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+from typing import Optional, List, Union
+from app.core.database import get_async_db
 from app.services.post_service import PostService
 from app.services.llm_service import llm_service
+from app.services.summary_worker import summary_worker
+from app.services.category_registry import category_registry
+from app.services.semantic_service import semantic_index
+from app.services.response_cache import response_cache, POSTS_TAG, CATEGORIES_TAG, post_tag
 from app.schemas import (
-    PostCreate, PostUpdate, PostList, PostDetail, 
-    LLMSummaryRequest, LLMSummaryResponse
+    PostCreate, PostUpdate, PostList, PostCompactList, PostDetail, 
+    LLMSummaryRequest, LLMSummaryResponse, SummaryStatusResponse,
+    PostBulkCreate, PostBulkResponse, SemanticSearchItem, SemanticSearchResponse
 )
+from app.models.post import SummaryStatus
+from app.utils.helpers import event_stream_response, ndjson_stream_response
+from app.utils.single_flight import SupersededError
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
-@router.get("/", response_model=PostList)
+@router.get("/", response_model=Union[PostList, PostCompactList])
 async def get_posts(
     skip: int = Query(0, ge=0, description="건너뛸 게시물 수"),
     limit: int = Query(20, ge=1, le=100, description="조회할 게시물 수"),
     category_id: Optional[int] = Query(None, description="카테고리 ID로 필터링"),
     search: Optional[str] = Query(None, description="제목/내용 검색어"),
     status: Optional[str] = Query(None, description="상태별 필터링"),
-    db: Session = Depends(get_db)
+    keyword: Optional[str] = Query(None, max_length=50, description="요약 키워드로 필터링"),
+    pagination: str = Query("offset", pattern="^(offset|cursor)$", description="페이징 방식 (offset/cursor)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (cursor 방식)"),
+    total_mode: str = Query("exact", pattern="^(exact|estimate|none)$", description="total 계산 방식 (exact/estimate/none)"),
+    view: str = Query("full", pattern="^(full|compact)$", description="응답 형태 (full/compact)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     게시물 목록 조회 (검색/필터링/페이징 지원)
@@ -33,42 +48,188 @@ async def get_posts(
     - **category_id**: 특정 카테고리의 게시물만 조회
     - **search**: 제목이나 내용에서 검색
     - **status**: 게시물 상태로 필터링 (draft/published/archived)
+    - **keyword**: 요약 키워드가 일치하는 게시물만 조회 (대소문자 무시, 키워드 색인 사용)
+    - **pagination**: cursor로 지정하면 skip 대신 cursor로 다음 페이지를 조회
+      (깊은 페이지도 일정한 속도, 검색과는 함께 사용할 수 없음)
+    - **cursor**: 이전 응답의 next_cursor 값
+    - **total_mode**: exact는 정확한 total, estimate는 검색 결과 수를 잠시 캐시해 재사용,
+      none은 total을 계산하지 않음 (무한 스크롤 등)
+      (프로세스 내 검색 엔진에서 검색 결과가 SEARCH_MAX_RESULTS개를 넘으면 truncated=true이고
+      total은 그 후보 안의 개수)
+    - **view**: compact이면 본문 전체 대신 발췌문, 요약문, 앞쪽 키워드만 반환
+      (전체 내용은 GET /posts/{post_id} 로 조회)
     """
-    try:
-        posts, total = PostService.get_posts_with_summaries(
+    compact = view == "compact"
+    use_cursor = pagination == "cursor" or cursor is not None
+    if use_cursor and search:
+        raise HTTPException(status_code=400, detail="검색은 cursor 페이징을 지원하지 않습니다.")
+    
+    async def load():
+        if use_cursor:
+            posts, next_cursor = await PostService.get_posts_by_cursor(
+                db=db,
+                limit=limit,
+                cursor=cursor,
+                category_id=category_id,
+                status=status,
+                compact=compact,
+                keyword=keyword
+            )
+            total = await PostService.count_posts(
+                db=db, category_id=category_id, status=status, total_mode=total_mode, keyword=keyword
+            )
+            
+            return _post_list(
+                posts,
+                compact,
+                total=total,
+                size=len(posts),
+                next_cursor=next_cursor
+            )
+        
+        posts, total, truncated = await PostService.get_posts_with_summaries(
             db=db,
             skip=skip,
             limit=limit,
             category_id=category_id,
             search=search,
-            status=status
+            status=status,
+            total_mode=total_mode,
+            compact=compact,
+            keyword=keyword
         )
         
         page = (skip // limit) + 1
         
-        return PostList(
-            posts=posts,
+        return _post_list(
+            posts,
+            compact,
             total=total,
+            truncated=truncated,
             page=page,
             size=len(posts)
         )
+    
+    params = {
+        "skip": skip, "limit": limit, "category_id": category_id, "search": search,
+        "status": status, "keyword": keyword, "cursor": cursor, "use_cursor": use_cursor,
+        "total_mode": total_mode, "view": view
+    }
+    try:
+        return await response_cache.fetch("posts.list", params, [POSTS_TAG], load)
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"게시물 목록 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="게시물 목록 조회에 실패했습니다.")
 
+def _post_list(posts, compact: bool, **fields) -> Union[PostList, PostCompactList]:
+    if compact:
+        return PostCompactList(posts=[PostService.to_list_item(post) for post in posts], **fields)
+    return PostList(posts=posts, **fields)
+
+@router.get("/export")
+async def export_posts(
+    category_id: Optional[int] = Query(None, description="카테고리 ID로 필터링"),
+    status: Optional[str] = Query(None, description="상태별 필터링"),
+    updated_since: Optional[datetime] = Query(None, description="이 시각 이후 수정된 게시물만 (ISO 8601)"),
+    after_id: Optional[int] = Query(None, ge=0, description="이 ID 다음부터 (중단된 내보내기 이어받기)"),
+    gzip: bool = Query(False, description="gzip 압축 여부")
+):
+    """
+    게시물 전체 내보내기 (NDJSON 스트리밍, 분석/백업용)
+
+    한 줄에 게시물 하나(카테고리 이름, 요약 포함)를 id 오름차순으로 보냅니다.
+    서버 측 커서로 일정량씩 읽어 바로 전송하므로 전체 크기와 무관하게 메모리 사용량이 일정합니다.
+    - **updated_since**: 게시물이나 요약이 이 시각 이후 수정된 것만 (증분 백업)
+    - **after_id**: 받은 마지막 id를 넘기면 그 다음부터 이어서 내보냄
+    - **gzip**: true면 .ndjson.gz 파일로 압축
+
+    내보낸 파일은 import_data.py로 그대로 다시 적재할 수 있습니다.
+    """
+    try:
+        query = PostService.build_export_query(
+            category_id=category_id, status=status, updated_since=updated_since, after_id=after_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filename = f"posts-{datetime.now():%Y%m%d-%H%M%S}.ndjson"
+    return ndjson_stream_response(_logged_export(query), filename, compress=gzip)
+
+async def _logged_export(query):
+    """응답을 보내기 시작한 뒤의 오류는 상태 코드로 알릴 수 없으므로 기록 후 중단"""
+    exported = 0
+    try:
+        async for record in PostService.export_posts(query):
+            exported += 1
+            yield record
+    except Exception as e:
+        logger.error(f"게시물 내보내기 중단 ({exported}건 전송 후): {str(e)}")
+        raise
+    logger.info(f"게시물 내보내기 완료 - {exported}건")
+
+@router.get("/semantic-search", response_model=SemanticSearchResponse)
+async def semantic_search(
+    q: str = Query(..., min_length=1, max_length=500, description="검색 문장"),
+    limit: int = Query(20, ge=1, le=100, description="조회할 게시물 수"),
+    category_id: Optional[int] = Query(None, description="카테고리 ID로 필터링"),
+    status: Optional[str] = Query(None, description="상태별 필터링"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    의미 검색 (외부 API 없이 프로세스 내 벡터 색인 사용)
+
+    제목/요약/본문의 문자 n-gram TF-IDF를 SVD로 줄인 벡터와 질의 벡터의
+    코사인 유사도 순으로 compact 형태의 게시물을 반환합니다.
+    검색어가 그대로 들어 있지 않아도 비슷한 표현(어간, 합성어 일부 등)이 많은 게시물을 찾습니다.
+    색인은 앱 시작시 백그라운드에서 만들어지므로 그 전에는 빈 결과를 반환합니다.
+    """
+    if not semantic_index.enabled:
+        raise HTTPException(status_code=404, detail="의미 검색이 비활성화되어 있습니다.")
+
+    async def load():
+        results = await PostService.semantic_search(
+            db=db, query=q, limit=limit, category_id=category_id, status=status
+        )
+        return SemanticSearchResponse(
+            query=q,
+            posts=[
+                SemanticSearchItem(**PostService.to_list_item(post), score=round(score, 4))
+                for post, score in results
+            ],
+            size=len(results),
+            index="ivf" if semantic_index.uses_ivf else "exact"
+        )
+
+    params = {"q": q, "limit": limit, "category_id": category_id, "status": status}
+    try:
+        return await response_cache.fetch("posts.semantic_search", params, [POSTS_TAG], load)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"의미 검색 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail="의미 검색에 실패했습니다.")
+
 @router.get("/{post_id}", response_model=PostDetail)
 async def get_post(
     post_id: int = Path(..., description="게시물 ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """게시물 상세 조회 (LLM 요약 포함)"""
-    try:
-        post = PostService.get_post_with_summary(db=db, post_id=post_id)
+    async def load():
+        post = await PostService.get_post_with_summary(db=db, post_id=post_id)
         if not post:
             raise HTTPException(status_code=404, detail="게시물을 찾을 수 없습니다.")
-        
-        return post
+        return PostDetail.model_validate(post)
+    
+    try:
+        # 카테고리 정보도 포함되므로 카테고리 변경시에도 무효화
+        return await response_cache.fetch(
+            "posts.detail", {"post_id": post_id}, [post_tag(post_id), CATEGORIES_TAG], load
+        )
         
     except HTTPException:
         raise
@@ -79,53 +240,85 @@ async def get_post(
 @router.post("/", response_model=PostDetail, status_code=201)
 async def create_post(
     post_data: PostCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    새 게시물 생성 (LLM 자동 요약 포함)
+    새 게시물 생성 (LLM 자동 요약은 백그라운드에서 처리)
     
     - **auto_summarize**: True일 경우 LLM이 자동으로 요약/하이라이트/키워드를 생성
+    - 게시물은 즉시 저장되어 summary_status=pending으로 반환됩니다
+    - 요약 완료 여부는 GET /posts/{post_id}/summary-status 로 확인합니다
     - 요약 생성에 실패해도 게시물은 정상적으로 저장됩니다
     """
     try:
-        # 카테고리 존재 확인
-        from app.services.post_service import CategoryService
-        category = CategoryService.get_category(db=db, category_id=post_data.category_id)
-        if not category:
+        # 카테고리 존재 확인 (메모리)
+        if not await category_registry.ensure(post_data.category_id):
             raise HTTPException(status_code=400, detail="존재하지 않는 카테고리입니다.")
         
-        # 게시물 생성 (LLM 요약 포함)
+        # 게시물 생성 (LLM 요약 작업 예약)
         post = await PostService.create_post(db=db, post_data=post_data)
         
         # 생성된 게시물을 요약과 함께 조회
-        created_post = PostService.get_post_with_summary(db=db, post_id=post.id)
+        created_post = await PostService.get_post_with_summary(db=db, post_id=post.id)
         
         return created_post
         
     except HTTPException:
         raise
+    except IntegrityError as e:
+        # 메모리 목록에 남아 있던 카테고리가 다른 프로세스에서 삭제된 경우 (외래 키 위반)
+        if not await category_registry.ensure(post_data.category_id, refresh=True):
+            raise HTTPException(status_code=400, detail="존재하지 않는 카테고리입니다.")
+        logger.error(f"게시물 생성 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail="게시물 생성에 실패했습니다.")
     except Exception as e:
         logger.error(f"게시물 생성 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="게시물 생성에 실패했습니다.")
 
+@router.post("/bulk", response_model=PostBulkResponse, status_code=201)
+async def bulk_create_posts(
+    bulk_data: PostBulkCreate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    게시물 일괄 생성 (최대 1000개)
+    
+    - 카테고리 검증과 게시물 저장을 각각 한 번의 쿼리로 처리합니다
+    - 요약은 백그라운드 워커 풀에서 동시 실행 수를 제한해 처리됩니다
+    - 존재하지 않는 카테고리 등 항목별 실패는 results에 표시되고 나머지는 저장됩니다
+    """
+    try:
+        results = await PostService.bulk_create_posts(db=db, posts_data=bulk_data.posts)
+        created = sum(1 for result in results if result["success"])
+        
+        return PostBulkResponse(
+            total=len(results),
+            created=created,
+            failed=len(results) - created,
+            results=results
+        )
+        
+    except Exception as e:
+        logger.error(f"게시물 일괄 생성 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail="게시물 일괄 생성에 실패했습니다.")
+
 @router.put("/{post_id}", response_model=PostDetail)
 async def update_post(
     post_id: int = Path(..., description="게시물 ID"),
     post_data: PostUpdate = ...,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     게시물 수정 (필요시 LLM 요약 재생성)
     
     - **regenerate_summary**: True일 경우 LLM 요약을 강제로 재생성
     - 내용(content)이 변경되면 자동으로 요약도 재생성됩니다
+    - 요약 재생성은 백그라운드에서 처리되며 summary_status=pending으로 반환됩니다
     """
     try:
-        # 카테고리 변경시 존재 확인
+        # 카테고리 변경시 존재 확인 (메모리)
         if post_data.category_id:
-            from app.services.post_service import CategoryService
-            category = CategoryService.get_category(db=db, category_id=post_data.category_id)
-            if not category:
+            if not await category_registry.ensure(post_data.category_id):
                 raise HTTPException(status_code=400, detail="존재하지 않는 카테고리입니다.")
         
         # 게시물 수정
@@ -134,12 +327,18 @@ async def update_post(
             raise HTTPException(status_code=404, detail="게시물을 찾을 수 없습니다.")
         
         # 수정된 게시물을 요약과 함께 조회
-        result = PostService.get_post_with_summary(db=db, post_id=post_id)
+        result = await PostService.get_post_with_summary(db=db, post_id=post_id)
         
         return result
         
     except HTTPException:
         raise
+    except IntegrityError as e:
+        # 메모리 목록에 남아 있던 카테고리가 다른 프로세스에서 삭제된 경우 (외래 키 위반)
+        if post_data.category_id and not await category_registry.ensure(post_data.category_id, refresh=True):
+            raise HTTPException(status_code=400, detail="존재하지 않는 카테고리입니다.")
+        logger.error(f"게시물 수정 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail="게시물 수정에 실패했습니다.")
     except Exception as e:
         logger.error(f"게시물 수정 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="게시물 수정에 실패했습니다.")
@@ -147,11 +346,11 @@ async def update_post(
 @router.delete("/{post_id}", status_code=204)
 async def delete_post(
     post_id: int = Path(..., description="게시물 ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """게시물 삭제 (LLM 요약도 함께 삭제됨)"""
     try:
-        success = PostService.delete_post(db=db, post_id=post_id)
+        success = await PostService.delete_post(db=db, post_id=post_id)
         if not success:
             raise HTTPException(status_code=404, detail="게시물을 찾을 수 없습니다.")
         
@@ -163,55 +362,76 @@ async def delete_post(
         logger.error(f"게시물 삭제 실패: {str(e)}")
         raise HTTPException(status_code=500, detail="게시물 삭제에 실패했습니다.")
 
+@router.get("/{post_id}/summary-status", response_model=SummaryStatusResponse)
+async def get_summary_status(
+    post_id: int = Path(..., description="게시물 ID"),
+    wait: float = Query(0, ge=0, le=30, description="요약 작업이 끝날 때까지 최대 대기할 시간(초, 롱 폴링)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    게시물의 백그라운드 요약 작업 상태를 조회합니다.
+    
+    - **wait**: 0보다 크면 작업이 pending 상태일 때 완료될 때까지 최대 wait초 대기합니다
+    """
+    try:
+        post = await PostService.get_post(db=db, post_id=post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="게시물을 찾을 수 없습니다.")
+        
+        if wait and post.summary_status == SummaryStatus.PENDING:
+            # 대기 중에는 세션을 닫아 커넥션을 반납
+            await db.close()
+            await summary_worker.wait_for_post(post_id, timeout=wait)
+            post = await PostService.get_post(db=db, post_id=post_id)
+            if not post:
+                raise HTTPException(status_code=404, detail="게시물을 찾을 수 없습니다.")
+        
+        return SummaryStatusResponse(
+            post_id=post_id,
+            summary_status=post.summary_status,
+            job=await db.run_sync(summary_worker.get_latest_job, post_id)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"요약 상태 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail="요약 상태 조회에 실패했습니다.")
+
 @router.post("/{post_id}/regenerate-summary", response_model=LLMSummaryResponse)
 async def regenerate_summary(
     post_id: int = Path(..., description="게시물 ID"),
-    db: Session = Depends(get_db)
+    force: bool = Query(False, description="요약 캐시를 무시하고 LLM을 다시 호출"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     게시물의 LLM 요약을 강제로 재생성합니다.
     
     기존 요약이 만족스럽지 않거나 LLM 모델이 업데이트되었을 때 사용합니다.
+    내용이 그대로면 캐시된 요약을 사용하며, **force**=true면 새로 생성합니다.
     """
     try:
         # 게시물 존재 확인
-        post = PostService.get_post_with_summary(db=db, post_id=post_id)
+        post = await PostService.get_post(db=db, post_id=post_id)
         if not post:
             raise HTTPException(status_code=404, detail="게시물을 찾을 수 없습니다.")
         
-        # 카테고리 정보 조회
-        category_name = post.category.name if post.category else "기타"
+        # 카테고리 이름 (메모리)
+        category_name = category_registry.name_of(post.category_id)
         
         # LLM 요약 재생성
         summary_data = await llm_service.regenerate_summary(
             post_id=post_id,
             title=post.title,
             content=post.content,
-            category=category_name
+            category=category_name,
+            use_cache=not force
         )
         
         # 데이터베이스 업데이트
-        from app.models.summary import Summary
-        existing_summary = db.query(Summary).filter(Summary.post_id == post_id).first()
-        
-        if existing_summary:
-            existing_summary.summary = summary_data["summary"]
-            existing_summary.highlights = summary_data["highlights"]
-            existing_summary.keywords = summary_data["keywords"]
-            existing_summary.confidence_score = summary_data["confidence_score"]
-            existing_summary.model_version = summary_data.get("model_version", "gpt-3.5-turbo")
-        else:
-            new_summary = Summary(
-                post_id=post_id,
-                summary=summary_data["summary"],
-                highlights=summary_data["highlights"],
-                keywords=summary_data["keywords"],
-                model_version=summary_data.get("model_version", "gpt-3.5-turbo"),
-                confidence_score=summary_data["confidence_score"]
-            )
-            db.add(new_summary)
-        
-        db.commit()
+        summary = await db.run_sync(PostService.save_summary, post, summary_data)
+        await db.commit()
+        PostService.summary_saved(post_id, post.title, post.content, summary.search_text)
         
         return LLMSummaryResponse(**summary_data)
         
@@ -223,22 +443,48 @@ async def regenerate_summary(
 
 @router.post("/preview-summary", response_model=LLMSummaryResponse)
 async def preview_summary(
-    request: LLMSummaryRequest
+    request: LLMSummaryRequest,
+    client_id: Optional[str] = Header(None, alias="X-Client-Id", description="미리보기 요청자 식별값 (편집 화면/탭 단위)")
 ):
     """
     게시물을 저장하기 전에 LLM 요약을 미리 확인할 수 있습니다.
     
     이 엔드포인트는 요약 결과만 반환하며 데이터베이스에 저장하지 않습니다.
+    같은 입력의 동시 요청은 LLM 호출 하나를 공유합니다.
+    **X-Client-Id** 헤더를 보내면 같은 값의 새 미리보기가 들어올 때 이전 요청은 409로 끝나고
+    더 이상 필요 없는 LLM 호출은 취소됩니다.
     """
     try:
         summary_data = await llm_service.generate_summary(
             title=request.title,
             content=request.content,
-            category=request.category
+            category=request.category,
+            owner=("preview", client_id) if client_id else None
         )
         
         return LLMSummaryResponse(**summary_data)
         
+    except SupersededError:
+        raise HTTPException(status_code=409, detail="새 미리보기 요청으로 대체되었습니다.")
     except Exception as e:
         logger.error(f"요약 미리보기 실패: {str(e)}")
-        raise HTTPException(status_code=500, detail="요약 생성에 실패했습니다.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="요약 생성에 실패했습니다.")
+
+@router.post("/preview-summary/stream")
+async def preview_summary_stream(
+    request: LLMSummaryRequest
+):
+    """
+    요약 미리보기 (Server-Sent Events 스트리밍)
+    
+    LLM이 생성하는 동안 값이 완성되는 즉시 이벤트로 전달합니다.
+    - summary: {"text": 요약}
+    - highlight / keyword: {"index": 순번, "text": 내용}
+    - confidence_score: {"value": 점수}
+    - done: /preview-summary 응답과 같은 형식의 최종 결과 (실패시 대체 요약)
+    """
+    return event_stream_response(llm_service.stream_summary(
+        title=request.title,
+        content=request.content,
+        category=request.category
+    ))
@@ -0,0 +1,47 @@
+# backend/app/api/stats.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.core.database import get_async_db
+from app.services.stats_service import stats_service
+from app.services.response_cache import response_cache, POSTS_TAG
+from app.schemas import StatsResponse
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+@router.get("", response_model=StatsResponse)
+async def get_stats(
+    days: int = Query(30, ge=1, le=365, description="일별 추이/키워드 집계 기간 (일)"),
+    category_id: Optional[int] = Query(None, description="카테고리 ID (생략하면 전체)"),
+    keyword_limit: int = Query(10, ge=0, le=100, description="키워드 추이 개수"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    문서 통계 및 분석 (대시보드용)
+
+    - **totals / by_status / by_category**: 전체 게시물 수, 요약 수, 대체 요약 비율, 평균 신뢰도
+    - **daily**: 최근 days일의 일별 값 (게시물 작성일 기준, 게시물이 없는 날도 0으로 포함)
+    - **keywords**: 최근 days일 게시물에 많이 나온 요약 키워드와 직전 기간 대비 수
+
+    집계 테이블만 읽으므로 게시물 수와 무관하게 빠르게 응답합니다.
+    """
+    async def load():
+        return StatsResponse(**await stats_service.overview(
+            db, days=days, category_id=category_id, keyword_limit=keyword_limit
+        ))
+
+    try:
+        # 게시물/요약 쓰기시 POSTS_TAG가 무효화되므로 같은 태그 사용
+        return await response_cache.fetch(
+            "stats.overview",
+            {"days": days, "category_id": category_id, "keyword_limit": keyword_limit},
+            [POSTS_TAG],
+            load
+        )
+    except Exception as e:
+        logger.error(f"통계 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail="통계 조회에 실패했습니다.")
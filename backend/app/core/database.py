@@ -1,10 +1,15 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, func, insert, inspect, text, Select, Table
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from typing import AsyncGenerator, Dict, Generator, List, Optional, Sequence
 import logging
 
 from .config import settings
+from .metrics import instrument_engine
+from .sql_profiler import profile_engine
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +30,63 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기 드라이버 (API 계층용)
+ASYNC_DRIVERS = {
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+def to_async_url(url: str) -> str:
+    """동기 DB URL을 같은 DB의 비동기 드라이버 URL로 변환"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"비동기 드라이버를 알 수 없는 DB입니다: {backend}")
+    return parsed.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+# 비동기 엔진 (API 요청 처리용 - 이벤트 루프를 막지 않음)
+# 동기 엔진은 스크립트(init_db_data.py 등)와 백그라운드 스레드 작업에서 계속 사용
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+    pool_recycle=300,
+    echo=settings.DEBUG,
+)
+
+# 비동기 세션 팩토리 (커밋 후 속성 접근시 지연 로딩 I/O가 일어나지 않도록 expire 안 함)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+def enforce_foreign_keys(engine: Engine):
+    """
+    SQLite는 연결마다 PRAGMA foreign_keys를 켜야 외래 키(ON DELETE CASCADE 포함)를 적용함
+    (MySQL InnoDB는 항상 적용 - 게시물 삭제시 키워드 연결 등은 DB가 함께 지움)
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+enforce_foreign_keys(engine)
+enforce_foreign_keys(async_engine.sync_engine)
+
+# SQL 문장 수/실행 시간 및 커넥션 풀 지표 (/metrics)
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+
+# 요청별 SQL 기록 (SQL_PROFILER_ENABLED 미들웨어, capture_sql)
+profile_engine(engine)
+profile_engine(async_engine.sync_engine)
+
 # 모델 베이스 클래스
 Base = declarative_base()
 
@@ -43,6 +105,152 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션 의존성
+    API 라우터에서 사용
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Database session error: {e}")
+            await db.rollback()
+            raise
+
+def insert_rows_returning_ids(db: Session, table: Table, rows: List[Dict]) -> List[int]:
+    """
+    여러 행을 한 번의 INSERT 문으로 추가하고 생성된 ID를 입력 순서대로 반환
+    
+    - RETURNING을 지원하는 DB(SQLite 3.35+, MariaDB 등): INSERT ... RETURNING
+    - MySQL: 다중 VALUES INSERT 후 LAST_INSERT_ID()부터 @@auto_increment_increment 간격으로 계산
+      (행 수가 정해진 "simple insert"는 InnoDB가 잠금 모드와 무관하게 한 번에 값을 할당하며,
+      interleaved 모드(innodb_autoinc_lock_mode=2)의 빈 번호는 INSERT ... SELECT 같은
+      "bulk insert"에서만 생김. 다중 프라이머리/Galera처럼 increment가 1보다 크면 그 간격만큼 건너뜀)
+    """
+    if not rows:
+        return []
+    
+    dialect = db.get_bind().dialect
+    if dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = db.execute(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.scalars().all())
+    
+    result = db.execute(insert(table).values(rows))
+    first_id = result.lastrowid
+    step = db.execute(text("SELECT @@auto_increment_increment")).scalar() or 1
+    return list(range(first_id, first_id + len(rows) * step, step))
+
+UPSERT_DIALECTS = {
+    "mysql": mysql.insert,
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+def upsert_rows(
+    db: Session,
+    table: Table,
+    rows: List[Dict],
+    key_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None
+):
+    """
+    여러 행을 한 번의 executemany로 추가하고, 키가 겹치는 행은 update_columns만 갱신
+    (update_columns를 비우면 기존 행을 그대로 둠)
+
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE (갱신할 컬럼이 없으면 INSERT IGNORE)
+    - SQLite/PostgreSQL: INSERT ... ON CONFLICT (key_columns) DO UPDATE / DO NOTHING
+    """
+    if not rows:
+        return
+    
+    dialect = db.get_bind().dialect.name
+    make_insert = UPSERT_DIALECTS.get(dialect)
+    if make_insert is None:
+        raise ValueError(f"upsert를 지원하지 않는 DB입니다: {dialect}")
+    
+    statement = make_insert(table)
+    source = statement.inserted if dialect == "mysql" else statement.excluded
+    values = {column: source[column] for column in update_columns or ()}
+    # onupdate는 upsert의 UPDATE 절에 자동으로 붙지 않으므로 직접 지정
+    if values and "updated_at" in table.c:
+        values.setdefault("updated_at", func.now())
+    
+    if dialect == "mysql":
+        if values:
+            statement = statement.on_duplicate_key_update(values)
+        else:
+            statement = statement.prefix_with("IGNORE")
+    elif values:
+        statement = statement.on_conflict_do_update(index_elements=list(key_columns), set_=values)
+    else:
+        statement = statement.on_conflict_do_nothing(index_elements=list(key_columns))
+    db.execute(statement, rows)
+
+def increment_rows(
+    db: Session,
+    table: Table,
+    rows: List[Dict],
+    key_columns: Sequence[str],
+    counter_columns: Sequence[str]
+):
+    """
+    여러 행을 한 번의 executemany로 추가하고, 키가 겹치는 행은 counter_columns에 값을 더함
+    (집계 테이블 증감용 - 음수를 넣으면 빼기)
+    """
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    make_insert = UPSERT_DIALECTS.get(dialect)
+    if make_insert is None:
+        raise ValueError(f"upsert를 지원하지 않는 DB입니다: {dialect}")
+
+    statement = make_insert(table)
+    if dialect == "mysql":
+        statement = statement.on_duplicate_key_update(
+            {column: table.c[column] + statement.inserted[column] for column in counter_columns}
+        )
+    else:
+        statement = statement.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={column: table.c[column] + statement.excluded[column] for column in counter_columns}
+        )
+    db.execute(statement, rows)
+
+def increment_from_select(
+    db: Session,
+    table: Table,
+    columns: Sequence[str],
+    query: Select,
+    key_columns: Sequence[str],
+    counter_columns: Sequence[str]
+):
+    """
+    increment_rows와 같지만 더할 행을 SELECT 결과로 받음 (INSERT ... SELECT 한 문장)
+    원본 행을 파이썬으로 읽지 않으므로 같은 트랜잭션에서 바뀐 값을 그대로 반영합니다.
+    (SQLite는 ON CONFLICT와 구분하려면 SELECT에 WHERE가 있어야 함)
+    """
+    dialect = db.get_bind().dialect.name
+    make_insert = UPSERT_DIALECTS.get(dialect)
+    if make_insert is None:
+        raise ValueError(f"upsert를 지원하지 않는 DB입니다: {dialect}")
+
+    statement = make_insert(table).from_select(list(columns), query)
+    if dialect == "mysql":
+        statement = statement.on_duplicate_key_update(
+            {column: table.c[column] + statement.inserted[column] for column in counter_columns}
+        )
+    else:
+        statement = statement.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={column: table.c[column] + statement.excluded[column] for column in counter_columns}
+        )
+    db.execute(statement)
+
 def create_tables():
     """
     모든 테이블 생성
@@ -55,6 +263,55 @@ def create_tables():
         logger.error(f"❌ 테이블 생성 실패: {e}")
         raise
 
+def add_missing_columns():
+    """
+    기존 테이블에 없는 컬럼 추가
+    create_all은 이미 있는 테이블을 변경하지 않으므로, 모델에 새로 추가된
+    (NULL 허용 또는 기본값이 있는) 컬럼을 ALTER TABLE로 보완합니다.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                if column.server_default is not None:
+                    default = column.server_default.arg
+                    if isinstance(default, str):
+                        ddl += f" DEFAULT '{default}'"
+                    else:
+                        ddl += f" DEFAULT {default.compile(dialect=engine.dialect)}"
+                elif not column.nullable:
+                    logger.warning(f"⚠️ 기본값 없는 NOT NULL 컬럼은 자동 추가하지 않습니다: {table.name}.{column.name}")
+                    continue
+                connection.execute(text(ddl))
+                logger.info(f"✅ 컬럼 추가: {table.name}.{column.name}")
+
+def add_missing_indexes():
+    """
+    기존 테이블에 없는 색인 추가
+    create_all은 이미 있는 테이블에 새 색인을 만들지 않으므로 보완합니다.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            index.create(bind=engine)
+            logger.info(f"✅ 색인 추가: {table.name}.{index.name}")
+
 def check_db_connection():
     """
     데이터베이스 연결 확인
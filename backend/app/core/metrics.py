@@ -0,0 +1,267 @@
+# backend/app/core/metrics.py
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+import threading
+import time
+
+# 지연 시간 히스토그램 기본 구간 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DB_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()  # 요약 워커 스레드에서도 기록
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labelvalues, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+        # 라벨별 [구간별 개수..., +Inf 개수], 합계
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[labelvalues] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labelvalues, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class Gauge(_Metric):
+    """수집 시점에 콜백으로 값을 읽는 게이지 (기록 비용 없음)"""
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Iterable[Tuple[LabelValues, float]]]] = None
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.collect = collect
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labelvalues, value in (self.collect() if self.collect else []):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+class MetricsRegistry:
+    """
+    Prometheus 텍스트 형식(0.0.4) 지표 모음
+
+    외부 라이브러리 없이 카운터/히스토그램/게이지만 지원합니다.
+    기록은 dict 갱신 한 번과 잠금 한 번이며, 게이지는 /metrics 수집 시점에만 계산합니다.
+    enabled=False이면 각 기록 지점에서 바로 반환합니다.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4"
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labelnames))
+
+    def histogram(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help_text, labelnames, buckets))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = (), collect=None) -> Gauge:
+        return self.register(Gauge(name, help_text, labelnames, collect))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry(enabled=settings.METRICS_ENABLED)
+
+# ----------------------------------------------------------------------
+# HTTP
+# ----------------------------------------------------------------------
+
+http_request_duration = metrics.histogram(
+    "seeq_http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 완료까지)",
+    ("method", "route", "status")
+)
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 처리 시간 기록 (순수 ASGI 미들웨어)
+    라벨은 실제 경로가 아니라 라우트 템플릿(/api/v1/posts/{post_id})을 사용합니다.
+    스트리밍 응답은 마지막 본문 조각을 보낸 시점까지 측정합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = ["500"]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status[0]
+            )
+
+# ----------------------------------------------------------------------
+# LLM
+# ----------------------------------------------------------------------
+
+llm_call_duration = metrics.histogram(
+    "seeq_llm_call_duration_seconds", "LLM 호출 시간 (스트리밍은 마지막 조각까지)",
+    ("model", "mode", "outcome")
+)
+llm_tokens = metrics.counter(
+    "seeq_llm_tokens_total", "LLM 사용 토큰 수 (응답 usage 기준, 스트리밍 제외)", ("model", "kind")
+)
+llm_parse_failures = metrics.counter(
+    "seeq_llm_parse_failures_total", "LLM 요약 응답 JSON 파싱 실패 수"
+)
+llm_summaries = metrics.counter(
+    "seeq_llm_summaries_total", "요약 결과 출처별 수 (llm/cache/fallback) - fallback 비율 계산용", ("source",)
+)
+
+# ----------------------------------------------------------------------
+# DB
+# ----------------------------------------------------------------------
+
+db_query_duration = metrics.histogram(
+    "seeq_db_query_duration_seconds", "SQL 문장 실행 시간", ("engine", "statement"), buckets=DB_BUCKETS
+)
+
+_pools: Dict[str, Engine] = {}
+
+def _collect_pool(attribute: str):
+    def collect():
+        for name, engine in _pools.items():
+            reader = getattr(engine.pool, attribute, None)
+            if reader is not None:
+                yield (name,), reader()
+    return collect
+
+metrics.gauge(
+    "seeq_db_pool_checked_out", "사용 중인 DB 커넥션 수", ("engine",), _collect_pool("checkedout")
+)
+metrics.gauge(
+    "seeq_db_pool_overflow", "풀 크기를 넘어 추가로 연 커넥션 수 (음수면 아직 열지 않은 기본 커넥션 수)",
+    ("engine",), _collect_pool("overflow")
+)
+metrics.gauge(
+    "seeq_db_pool_size", "DB 커넥션 풀 크기", ("engine",), _collect_pool("size")
+)
+
+def instrument_engine(engine: Engine, name: str):
+    """SQLAlchemy 이벤트로 문장 수/실행 시간 기록 및 풀 게이지 등록 (비동기 엔진은 sync_engine 전달)"""
+    _pools[name] = engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if metrics.enabled:
+            conn.info.setdefault("seeq_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("seeq_query_started")
+        if started:
+            db_query_duration.observe(
+                time.perf_counter() - started.pop(), name, statement.split(None, 1)[0].upper()
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 버림
+        connection = context.connection
+        started = connection.info.get("seeq_query_started") if connection is not None else None
+        if started:
+            started.pop()
@@ -0,0 +1,200 @@
+# backend/app/core/sql_profiler.py
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+import json
+import logging
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_POSTCOMPILE = re.compile(r"\(?__\[POSTCOMPILE_\w+\]\)?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))*\s*\)")
+
+@lru_cache(maxsize=1024)
+def normalize_statement(statement: str) -> str:
+    """
+    SQL 문장 모양 (리터럴과 IN 목록 길이를 지운 형태)
+    같은 모양이 한 요청에서 반복되면 N+1 후보로 봅니다.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _POSTCOMPILE.sub("(?)", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return " ".join(shape.split())
+
+class SQLProfile:
+    """한 요청(또는 capture_sql 구간)에서 실행된 SQL 문장과 실행 시간"""
+
+    def __init__(self):
+        self.queries: List[Tuple[str, float]] = []  # (문장, 초)
+        self._lock = threading.Lock()  # to_thread/스레드풀 경로에서도 기록
+
+    def record(self, statement: str, seconds: float):
+        with self._lock:
+            self.queries.append((statement, seconds))
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(seconds for _, seconds in self.queries)
+
+    def shapes(self) -> List[Dict]:
+        """문장 모양별 실행 횟수/시간 (횟수 많은 순)"""
+        grouped: Dict[str, List[float]] = defaultdict(list)
+        for statement, seconds in self.queries:
+            grouped[normalize_statement(statement)].append(seconds)
+        return sorted(
+            (
+                {"statement": shape, "count": len(times), "total_ms": round(sum(times) * 1000, 3)}
+                for shape, times in grouped.items()
+            ),
+            key=lambda item: (-item["count"], -item["total_ms"])
+        )
+
+    def repeated(self) -> List[Dict]:
+        """두 번 이상 실행된 문장 모양"""
+        return [shape for shape in self.shapes() if shape["count"] > 1]
+
+    def n_plus_one(self, threshold: Optional[int] = None) -> List[Dict]:
+        """같은 모양의 SELECT가 threshold번 이상 실행된 경우 (행마다 추가 조회하는 N+1 패턴)"""
+        threshold = threshold or settings.SQL_PROFILER_N_PLUS_ONE_THRESHOLD
+        return [
+            shape for shape in self.shapes()
+            if shape["count"] >= threshold and shape["statement"].upper().startswith("SELECT")
+        ]
+
+    def summary(self) -> Dict:
+        return {
+            "queries": self.count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "n_plus_one": self.n_plus_one(),
+            "repeated": self.repeated(),
+            "statements": [
+                {"statement": " ".join(statement.split()), "ms": round(seconds * 1000, 3)}
+                for statement, seconds in self.queries
+            ]
+        }
+
+_current_profile: ContextVar[Optional[SQLProfile]] = ContextVar("sql_profile", default=None)
+
+@contextmanager
+def capture_sql() -> Iterator[SQLProfile]:
+    """
+    구간 안에서 실행된 SQL 기록 (스크립트/점검용)
+
+        with capture_sql() as profile:
+            ...
+        assert profile.count <= 3
+    """
+    profile = SQLProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+def profile_engine(engine: Engine):
+    """
+    SQL 기록 이벤트 등록 (비동기 엔진은 sync_engine 전달)
+    기록 중인 구간이 없으면 ContextVar 조회 한 번으로 끝납니다.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_profile.get() is not None:
+            conn.info.setdefault("seeq_profile_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("seeq_profile_started")
+        profile = _current_profile.get()
+        if started:
+            seconds = time.perf_counter() - started.pop()
+            if profile is not None:
+                profile.record(statement, seconds)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        connection = context.connection
+        started = connection.info.get("seeq_profile_started") if connection is not None else None
+        if started:
+            started.pop()
+
+class SQLProfilerMiddleware:
+    """
+    요청별 SQL 기록 (SQL_PROFILER_ENABLED=True일 때만 등록하는 디버그용 ASGI 미들웨어)
+
+    - 응답 헤더: X-SQL-Queries(문장 수), X-SQL-Time-Ms(실행 시간 합), X-SQL-N-Plus-One(N+1 의심 모양 수)
+      헤더는 응답 시작 시점까지의 문장만 반영합니다 (스트리밍 본문 중 실행된 문장은 보고서에만 포함)
+    - SQL_PROFILER_REPORT_PATH를 지정하면 요청마다 JSON 한 줄로 전체 내역을 추가 기록
+    - N+1 의심 패턴은 경고 로그로도 남김
+    """
+
+    def __init__(self, app, report_path: Optional[str] = None):
+        self.app = app
+        self.report_path = settings.SQL_PROFILER_REPORT_PATH if report_path is None else report_path
+        self._report_lock = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = SQLProfile()
+        token = _current_profile.set(profile)
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.extend([
+                    (b"x-sql-queries", str(profile.count).encode()),
+                    (b"x-sql-time-ms", f"{profile.total_seconds * 1000:.3f}".encode()),
+                    (b"x-sql-n-plus-one", str(len(profile.n_plus_one())).encode())
+                ])
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            self._report(scope, status[0], profile)
+
+    def _report(self, scope, status: int, profile: SQLProfile):
+        route = scope.get("route")
+        summary = profile.summary()
+        for shape in summary["n_plus_one"]:
+            logger.warning(
+                f"N+1 의심: {scope['method']} {scope['path']} - "
+                f"같은 SELECT {shape['count']}회 실행: {shape['statement'][:200]}"
+            )
+        if not self.report_path:
+            return
+        entry = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route.path if route is not None else None,
+            "status": status,
+            **summary
+        }
+        try:
+            with self._report_lock, open(self.report_path, "a", encoding="utf-8") as report:
+                report.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.error(f"SQL 보고서 기록 실패: {str(e)}")
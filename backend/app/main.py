@@ -1,14 +1,28 @@
 # backend/app/main.py
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
-from app.core.database import engine, get_db
+from app.core.database import engine, async_engine, get_db, add_missing_columns, add_missing_indexes
 from app.models import category, post, summary  # 모든 모델 import
-from app.api import posts, categories, llm
+from app.api import posts, categories, keywords, llm, stats
 from app.core.config import settings
+from app.core.metrics import metrics, MetricsMiddleware
+from app.core.sql_profiler import SQLProfilerMiddleware
 from app.schemas import HealthCheck
+from app.services.llm_providers import llm_router
+from app.services.summary_cache import summary_cache
+from app.services.summary_worker import summary_worker
+from app.services.search_service import search_service
+from app.services.semantic_service import semantic_index
+from app.services.related_service import related_service
+from app.services.count_service import post_count_service
+from app.services.keyword_service import keyword_index
+from app.services.stats_service import stats_service
+from app.services.category_registry import category_registry
+from app.services.response_cache import response_cache
 from datetime import datetime
+import asyncio
 import logging
 
 # 로깅 설정
@@ -32,32 +46,103 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+
+# 라우트별 처리 시간 지표 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
+# 요청별 SQL 기록 및 N+1 감지 (디버그용)
+if settings.SQL_PROFILER_ENABLED:
+    app.add_middleware(SQLProfilerMiddleware)
 app.include_router(llm.router, prefix="/api/v1")
 
+async def _run_startup_step(description: str, step) -> bool:
+    """
+    시작 단계 하나 실행 (동기 함수/코루틴 함수 모두 가능)
+    실패해도 로그만 남기고 다음 단계와 요약 워커는 계속 시작하도록 성공 여부만 반환
+    """
+    try:
+        result = step()
+        if asyncio.iscoroutine(result):
+            await result
+        return True
+    except Exception:
+        logger.exception(f"앱 시작 단계 실패 - {description}")
+        return False
+
 # 데이터베이스 테이블 생성
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작시 실행되는 이벤트"""
-    try:
-        # 데이터베이스 테이블 생성
-        logger.info("데이터베이스 테이블 생성 중...")
-        category.Base.metadata.create_all(bind=engine)
-        post.Base.metadata.create_all(bind=engine)
-        summary.Base.metadata.create_all(bind=engine)
-        logger.info("데이터베이스 테이블 생성 완료")
-        
-        # OpenAI API 설정 확인
-        if not settings.OPENAI_API_KEY:
-            logger.warning("OpenAI API 키가 설정되지 않았습니다!")
-        else:
-            logger.info("OpenAI API 키 설정 확인 완료")
-            
-    except Exception as e:
-        logger.error(f"앱 시작 중 오류 발생: {str(e)}")
+    """
+    앱 시작시 실행되는 이벤트
+
+    테이블 생성과 요약 워커 시작이 실패하면 앱을 시작하지 않고,
+    그 외 준비 단계(색인/집계 등)는 단계별로 실패를 기록한 뒤 나머지를 계속 진행합니다.
+    """
+    # 데이터베이스 테이블 생성 (실패하면 시작 중단)
+    logger.info("데이터베이스 테이블 생성 중...")
+    category.Base.metadata.create_all(bind=engine)
+    post.Base.metadata.create_all(bind=engine)
+    summary.Base.metadata.create_all(bind=engine)
+    add_missing_columns()
+    add_missing_indexes()
+    logger.info("데이터베이스 테이블 생성 완료")
+    
+    steps = [
+        # 만료된 요약 캐시 정리
+        ("요약 캐시 정리", summary_cache.purge_expired),
+        # 카테고리 목록 메모리 로드 (이후 주기적으로 변경 확인)
+        ("카테고리 목록 로드", category_registry.start),
+        # 게시물 수 카운터 재계산
+        ("게시물 수 카운터 재계산", lambda: asyncio.to_thread(post_count_service.rebuild)),
+        # 키워드 색인이 비어 있으면 기존 요약에서 채움 (테이블을 새로 만든 경우)
+        ("키워드 색인 채우기", lambda: asyncio.to_thread(keyword_index.backfill_if_empty)),
+        # 통계 집계 (비어 있으면 전체 계산) 및 주기적 정리 시작
+        ("통계 집계", stats_service.start),
+        # 검색 색인 준비 (MySQL FULLTEXT 색인 생성 또는 프로세스 내 색인 구성)
+        ("검색 색인 준비", lambda: asyncio.to_thread(search_service.prepare)),
+        # 프로세스 내 검색 색인이면 다른 워커 프로세스의 변경 반영 시작
+        ("검색 색인 동기화 시작", search_service.start_sync),
+        # 의미 검색 색인 구성 (백그라운드 스레드 - 시작을 기다리지 않음)
+        ("의미 검색 색인 구성", semantic_index.start),
+        # 관련 게시물 주기적 갱신 (의미 검색 색인이 준비되면 비어 있는 경우 전체 계산)
+        ("관련 게시물 갱신 시작", related_service.start),
+    ]
+    failed = []
+    for description, step in steps:
+        if not await _run_startup_step(description, step):
+            failed.append(description)
+    
+    # 백그라운드 요약 워커 시작 (앞 단계 실패와 무관, 실패하면 시작 중단)
+    await summary_worker.start(settings.SUMMARY_WORKER_COUNT)
+    
+    if failed:
+        logger.error(f"일부 시작 단계가 실패해 해당 기능이 제한됩니다: {', '.join(failed)}")
+    
+    # OpenAI API 설정 확인
+    if not settings.OPENAI_API_KEY:
+        logger.warning("OpenAI API 키가 설정되지 않았습니다!")
+    else:
+        logger.info("OpenAI API 키 설정 확인 완료")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """앱 종료시 실행되는 이벤트"""
+    await summary_worker.stop()
+    await category_registry.stop()
+    await stats_service.stop()
+    await related_service.stop()
+    
+    # 공유 LLM 커넥션 풀 정리
+    await llm_router.close()
+    
+    # 비동기 DB 커넥션 풀 정리
+    await async_engine.dispose()
 
 # API 라우터 등록
 app.include_router(posts.router, prefix="/api/v1")
 app.include_router(categories.router, prefix="/api/v1")
+app.include_router(keywords.router, prefix="/api/v1")
+app.include_router(stats.router, prefix="/api/v1")
 
 # 헬스체크 엔드포인트
 @app.get("/health", response_model=HealthCheck)
@@ -83,6 +168,16 @@ async def health_check():
         openai=openai_status
     )
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표 (HTTP/LLM/DB)"""
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+@app.get("/api/v1/response-cache/stats", tags=["cache"])
+async def get_response_cache_stats():
+    """조회 API 응답 캐시의 적중/실패/무효화 카운터와 현재 크기"""
+    return response_cache.stats()
+
 # 루트 엔드포인트
 @app.get("/")
 async def root():
@@ -4,16 +4,32 @@
 """
 
 from .category import Category
-from .post import Post, PostStatus
+from .keyword import Keyword, PostKeyword
+from .post import Post, PostStatus, SummaryStatus
+from .post_counter import PostCounter
+from .related import RelatedPost
+from .stats import PostDailyStat, KeywordDailyStat
 from .summary import Summary  
+from .summary_cache import SummaryCacheEntry
+from .summary_job import SummaryJob, JobStatus
 from .tag import Tag
 
 # 모든 모델을 __all__에 등록
 __all__ = [
     "Category",
+    "Keyword",
+    "PostKeyword",
     "Post", 
     "PostStatus",
+    "SummaryStatus",
+    "PostCounter",
+    "RelatedPost",
+    "PostDailyStat",
+    "KeywordDailyStat",
     "Summary",
+    "SummaryCacheEntry",
+    "SummaryJob",
+    "JobStatus",
     "Tag",
     "post_tags"
 ]
\ No newline at end of file
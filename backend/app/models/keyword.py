@@ -0,0 +1,44 @@
+# backend/app/models/keyword.py
+
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from sqlalchemy.dialects import mysql
+from app.core.database import Base
+
+# MySQL 기본 콜레이션(utf8mb4_0900_ai_ci)은 악센트/전각을 구분하지 않아 "café"와 "cafe"가
+# 같은 행이 되므로 정규화한 이름 그대로 구분하도록 바이너리 콜레이션 사용
+KeywordNameType = String(50).with_variant(mysql.VARCHAR(50, collation="utf8mb4_bin"), "mysql")
+
+class Keyword(Base):
+    """요약 키워드 사전 (정규화한 이름 기준으로 한 행)"""
+
+    __tablename__ = "keywords"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(KeywordNameType, unique=True, nullable=False, comment="키워드 (소문자, 앞뒤 공백 제거)")
+
+    def __repr__(self):
+        return f"<Keyword(id={self.id}, name='{self.name}')>"
+
+class PostKeyword(Base):
+    """
+    게시물-키워드 연결 (Summary.keywords에서 파생 - 요약 저장과 같은 트랜잭션에서 갱신)
+
+    category_id는 카테고리별 상위 키워드를 posts 조인 없이 색인만으로 집계하기 위해
+    게시물의 카테고리를 복사해 둔 값입니다 (게시물 카테고리 변경시 함께 갱신).
+    """
+
+    __tablename__ = "post_keywords"
+    __table_args__ = (
+        # 키워드로 게시물 찾기
+        Index("ix_post_keywords_keyword_post", "keyword_id", "post_id"),
+        # 카테고리별 키워드 집계
+        Index("ix_post_keywords_category_keyword", "category_id", "keyword_id"),
+    )
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    keyword_id = Column(Integer, ForeignKey("keywords.id", ondelete="CASCADE"), primary_key=True)
+    category_id = Column(Integer, nullable=False, comment="게시물 카테고리 (집계용 복사본)")
+    position = Column(Integer, nullable=False, default=0, comment="요약 키워드 목록에서의 순서")
+
+    def __repr__(self):
+        return f"<PostKeyword(post_id={self.post_id}, keyword_id={self.keyword_id})>"
@@ -1,7 +1,8 @@
 # backend/app/models/post.py
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Enum, Index
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import relationship, query_expression
 from sqlalchemy.sql import func
 from app.core.database import Base
 import enum
@@ -11,8 +12,28 @@ class PostStatus(str, enum.Enum):
     PUBLISHED = "published" 
     ARCHIVED = "archived"
 
+class SummaryStatus(str, enum.Enum):
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+# SQLite의 CURRENT_TIMESTAMP(초 단위)와 같은 형식으로 바인딩해야
+# 커서 페이징의 created_at 비교가 문자열 비교에서도 정확함
+CreatedAtType = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite"
+)
+
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 목록 정렬/커서 페이징용 (created_at DESC, id DESC)
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        # 의미 검색 색인의 다른 프로세스 변경 반영용 (updated_at 이후 수정된 게시물)
+        Index("ix_posts_updated_at", "updated_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
@@ -21,13 +42,30 @@ class Post(Base):
     image_url = Column(String(500), nullable=True)
     status = Column(Enum(PostStatus), default=PostStatus.PUBLISHED, nullable=False)
     user_id = Column(Integer, nullable=True)  # 향후 확장용
+    summary_status = Column(Enum(SummaryStatus), nullable=True, comment="LLM 요약 상태 (요약 미요청시 NULL)")
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(CreatedAtType, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # 목록 compact 보기에서 본문 대신 읽는 앞부분 (with_expression으로 채움, 그 외에는 None)
+    content_head = query_expression()
+    
     # 관계 설정
     category = relationship("Category", back_populates="posts")
     summary = relationship("Summary", back_populates="post", uselist=False, cascade="all, delete-orphan")
+    # 미리 계산한 관련 게시물 (related_service가 Core 문장으로 갱신하므로 읽기 전용)
+    related_posts = relationship(
+        "RelatedPost",
+        foreign_keys="RelatedPost.post_id",
+        order_by="RelatedPost.rank",
+        viewonly=True
+    )
+    # 이 게시물을 관련 게시물로 둔 행 (삭제시 다시 계산할 게시물 - 행은 ON DELETE CASCADE로 삭제)
+    referrers = relationship(
+        "RelatedPost",
+        foreign_keys="RelatedPost.related_post_id",
+        viewonly=True
+    )
     
     def __repr__(self):
         return f"<Post(id={self.id}, title='{self.title}', status='{self.status}')>"
\ No newline at end of file
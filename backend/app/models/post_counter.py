@@ -0,0 +1,17 @@
+# backend/app/models/post_counter.py
+
+from sqlalchemy import Column, Integer, ForeignKey, Enum
+from app.core.database import Base
+from app.models.post import PostStatus
+
+class PostCounter(Base):
+    """(카테고리, 상태)별 게시물 수 - 게시물 쓰기와 같은 트랜잭션에서 갱신"""
+
+    __tablename__ = "post_counters"
+
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(Enum(PostStatus), primary_key=True)
+    count = Column(Integer, default=0, nullable=False, comment="게시물 수")
+
+    def __repr__(self):
+        return f"<PostCounter(category_id={self.category_id}, status='{self.status}', count={self.count})>"
@@ -0,0 +1,31 @@
+# backend/app/models/related.py
+
+from sqlalchemy import Column, Integer, Float, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+
+class RelatedPost(Base):
+    """
+    게시물별 관련 게시물 상위 k개 (related_service가 미리 계산해 저장)
+
+    점수 = 요약 키워드 겹침(코사인) x RELATED_KEYWORD_WEIGHT + 의미 검색 벡터 유사도 x 나머지 가중치
+    게시물 상세 조회는 이 테이블을 같은 쿼리에서 조인해 읽으므로 요청마다 전체와 비교하지 않습니다.
+    """
+
+    __tablename__ = "related_posts"
+    __table_args__ = (
+        # 이 게시물을 관련 게시물로 둔 게시물 찾기 (변경/삭제시 다시 계산할 대상)
+        Index("ix_related_posts_related_post", "related_post_id"),
+    )
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    related_post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, nullable=False, comment="순위 (0부터)")
+    score = Column(Float, nullable=False, comment="관련도 (0~1)")
+    shared_keywords = Column(Integer, nullable=False, default=0, comment="겹치는 요약 키워드 수")
+
+    # 관련 게시물 (상세 조회에서 제목 등 일부 컬럼만 조인)
+    related_post = relationship("Post", foreign_keys=[related_post_id])
+
+    def __repr__(self):
+        return f"<RelatedPost(post_id={self.post_id}, related_post_id={self.related_post_id}, score={self.score})>"
@@ -0,0 +1,44 @@
+# backend/app/models/stats.py
+
+from sqlalchemy import Column, Integer, Float, Date, Enum, Index
+from app.core.database import Base
+from app.models.post import PostStatus
+
+class PostDailyStat(Base):
+    """
+    (게시일, 카테고리, 상태)별 게시물/요약 집계 - 통계 API는 이 테이블만 읽음
+
+    게시물 쓰기/요약 저장과 같은 트랜잭션에서 증감하고(stats_service),
+    주기적 정리 작업이 최근 기간을 원본에서 다시 계산해 어긋난 값을 바로잡습니다.
+    요약 값은 게시물의 현재 요약 기준입니다 (재생성하면 이전 요약 값을 빼고 새 값을 더함).
+    """
+
+    __tablename__ = "post_daily_stats"
+
+    day = Column(Date, primary_key=True, comment="게시물 작성일")
+    category_id = Column(Integer, primary_key=True)
+    status = Column(Enum(PostStatus), primary_key=True)
+    post_count = Column(Integer, nullable=False, default=0, comment="게시물 수")
+    summary_count = Column(Integer, nullable=False, default=0, comment="요약이 있는 게시물 수")
+    fallback_count = Column(Integer, nullable=False, default=0, comment="대체 요약(fallback) 수")
+    confidence_sum = Column(Float, nullable=False, default=0.0, comment="LLM 요약 신뢰도 합계 - 대체 요약 제외 (평균 = 합계 / (요약 수 - 대체 요약 수))")
+
+    def __repr__(self):
+        return f"<PostDailyStat(day={self.day}, category_id={self.category_id}, status='{self.status}', posts={self.post_count})>"
+
+class KeywordDailyStat(Base):
+    """(게시물 작성일, 카테고리, 키워드)별 게시물 수 - 기간별 키워드 추이"""
+
+    __tablename__ = "keyword_daily_stats"
+    __table_args__ = (
+        # 카테고리 없이 기간으로 집계
+        Index("ix_keyword_daily_stats_day_keyword", "day", "keyword_id"),
+    )
+
+    day = Column(Date, primary_key=True, comment="게시물 작성일")
+    category_id = Column(Integer, primary_key=True)
+    keyword_id = Column(Integer, primary_key=True)
+    post_count = Column(Integer, nullable=False, default=0, comment="게시물 수")
+
+    def __repr__(self):
+        return f"<KeywordDailyStat(day={self.day}, keyword_id={self.keyword_id}, posts={self.post_count})>"
@@ -15,14 +15,15 @@ class Summary(Base):
     summary = Column(Text, nullable=False, comment="LLM 생성 요약")
     highlights = Column(JSON, nullable=True, comment="핵심 포인트 배열")
     keywords = Column(JSON, nullable=True, comment="키워드 배열")
+    search_text = Column(Text, nullable=True, comment="검색용 텍스트 (요약+하이라이트+키워드, FULLTEXT 색인)")
     
     # LLM 메타데이터
-    model_version = Column(String(50), nullable=True, default="gpt-3.5-turbo", comment="사용된 LLM 모델")
+    model_version = Column(String(50), nullable=True, comment="사용된 LLM 공급자/모델 (예: gpt-3.5-turbo, local:llama3, extractive, fallback)")
     confidence_score = Column(Float, nullable=True, comment="요약 신뢰도 점수 (0-100)")
     
     # 생성 정보
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
     
     # 관계 설정
     post = relationship("Post", back_populates="summary")
@@ -0,0 +1,21 @@
+# backend/app/models/summary_cache.py
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class SummaryCacheEntry(Base):
+    """LLM 요약 결과 캐시 (내용 해시 기반, 영구 저장 계층)"""
+
+    __tablename__ = "summary_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), unique=True, nullable=False, comment="(제목, 내용, 카테고리, 프롬프트 버전, 모델) SHA-256")
+    payload = Column(JSON, nullable=False, comment="요약 결과 (summary/highlights/keywords/confidence_score)")
+    model_version = Column(String(50), nullable=True, comment="사용된 LLM 모델")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime, nullable=False, index=True, comment="만료일시 (UTC)")
+
+    def __repr__(self):
+        return f"<SummaryCacheEntry(id={self.id}, key='{self.cache_key[:12]}')>"
@@ -0,0 +1,36 @@
+# backend/app/models/summary_job.py
+
+from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime, Enum, Boolean
+from sqlalchemy.sql import func
+from app.core.database import Base
+import enum
+
+class JobStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+class SummaryJob(Base):
+    """백그라운드 요약 작업"""
+
+    __tablename__ = "summary_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(Enum(JobStatus), default=JobStatus.PENDING, nullable=False, index=True)
+    force_refresh = Column(Boolean, default=False, nullable=False, comment="요약 캐시 무시 여부")
+
+    # 재시도 정보
+    attempts = Column(Integer, default=0, nullable=False, comment="시도 횟수")
+    max_attempts = Column(Integer, default=3, nullable=False, comment="최대 시도 횟수")
+    last_error = Column(Text, nullable=True, comment="마지막 오류 메시지")
+    run_after = Column(DateTime, nullable=False, index=True, comment="실행 가능 시각 (UTC, 백오프)")
+    heartbeat_at = Column(DateTime, nullable=True, comment="처리 중인 워커가 마지막으로 갱신한 시각 (UTC, 임대)")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<SummaryJob(id={self.id}, post_id={self.post_id}, status='{self.status}')>"
@@ -1,8 +1,8 @@
 # backend/app/schemas/__init__.py
 
-from pydantic import BaseModel, Field, ConfigDict
-from datetime import datetime
-from typing import Optional, List
+from pydantic import AliasPath, BaseModel, Field, ConfigDict
+from datetime import date, datetime
+from typing import Optional, List, Dict
 from enum import Enum
 
 # Enums
@@ -11,6 +11,17 @@ class PostStatus(str, Enum):
     PUBLISHED = "published"
     ARCHIVED = "archived"
 
+class SummaryStatus(str, Enum):
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
 # Category Schemas
 class CategoryBase(BaseModel):
     name: str = Field(..., max_length=100, description="카테고리명")
@@ -35,7 +46,7 @@ class SummaryBase(BaseModel):
     summary: str = Field(..., description="LLM 생성 요약")
     highlights: Optional[List[str]] = Field(default=[], description="핵심 포인트 목록")
     keywords: Optional[List[str]] = Field(default=[], description="키워드 목록")
-    model_version: Optional[str] = Field(default="gpt-3.5-turbo", description="사용된 LLM 모델")
+    model_version: Optional[str] = Field(default=None, description="사용된 LLM 공급자/모델")
     confidence_score: Optional[float] = Field(default=0.0, ge=0, le=100, description="요약 신뢰도 점수")
 
 class SummaryCreate(SummaryBase):
@@ -67,6 +78,9 @@ class PostBase(BaseModel):
 class PostCreate(PostBase):
     auto_summarize: bool = Field(default=True, description="자동 요약 생성 여부")
 
+class PostBulkCreate(BaseModel):
+    posts: List[PostCreate] = Field(..., min_length=1, max_length=1000, description="생성할 게시물 목록 (최대 1000개)")
+
 class PostUpdate(BaseModel):
     title: Optional[str] = Field(None, max_length=255)
     content: Optional[str] = None
@@ -80,6 +94,7 @@ class Post(PostBase):
     
     id: int
     user_id: Optional[int] = None
+    summary_status: Optional[SummaryStatus] = Field(None, description="LLM 요약 상태 (pending/ready/failed)")
     created_at: datetime
     updated_at: datetime
     
@@ -95,13 +110,117 @@ class PostWithSummary(Post):
 class PostList(BaseModel):
     """게시물 목록 응답"""
     posts: List[PostWithSummary]
-    total: int
-    page: int
+    total: Optional[int] = None  # total_mode=none이면 None
+    truncated: bool = Field(False, description="검색 결과가 SEARCH_MAX_RESULTS개에서 잘려 total이 하한값인지")
+    page: Optional[int] = None
+    size: int
+    next_cursor: Optional[str] = None
+    
+class PostListItem(BaseModel):
+    """게시물 목록 compact 항목 (본문 전체 대신 발췌문)"""
+    id: int
+    title: str
+    excerpt: str = Field(..., description="본문 앞부분 발췌문")
+    category_id: int
+    category_name: Optional[str] = None
+    image_url: Optional[str] = None
+    status: PostStatus
+    summary_status: Optional[SummaryStatus] = None
+    summary: Optional[str] = Field(None, description="요약문")
+    keywords: List[str] = Field(default=[], description="앞쪽 키워드 몇 개")
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class PostCompactList(BaseModel):
+    """게시물 목록 응답 (view=compact)"""
+    posts: List[PostListItem]
+    total: Optional[int] = None
+    truncated: bool = Field(False, description="검색 결과가 SEARCH_MAX_RESULTS개에서 잘려 total이 하한값인지")
+    page: Optional[int] = None
     size: int
+    next_cursor: Optional[str] = None
+
+class SemanticSearchItem(PostListItem):
+    """의미 검색 결과 항목"""
+    score: float = Field(..., description="질의와의 코사인 유사도 (-1~1)")
+
+class SemanticSearchResponse(BaseModel):
+    """의미 검색 응답"""
+    query: str
+    posts: List[SemanticSearchItem]
+    size: int
+    index: str = Field(..., description="검색 방식 (exact: 전체 비교, ivf: 근사 검색)")
+
+class RelatedPostItem(BaseModel):
+    """관련 게시물 (미리 계산한 목록)"""
+    model_config = ConfigDict(from_attributes=True)
     
+    id: int = Field(..., validation_alias="related_post_id")
+    title: str = Field(..., validation_alias=AliasPath("related_post", "title"))
+    category_id: int = Field(..., validation_alias=AliasPath("related_post", "category_id"))
+    score: float = Field(..., description="관련도 (키워드 겹침 + 본문/요약 유사도, 0~1)")
+    shared_keywords: int = Field(0, description="겹치는 요약 키워드 수")
+
 class PostDetail(PostWithSummary):
     """게시물 상세 응답"""
-    pass
+    related_posts: List[RelatedPostItem] = Field(default=[], description="관련 게시물 (관련도 순)")
+
+class PostBulkItemResult(BaseModel):
+    """게시물 일괄 생성 항목별 결과"""
+    index: int = Field(..., description="요청 목록에서의 위치")
+    success: bool
+    post_id: Optional[int] = None
+    summary_status: Optional[SummaryStatus] = None
+    error: Optional[str] = None
+
+class PostBulkResponse(BaseModel):
+    """게시물 일괄 생성 응답"""
+    total: int
+    created: int
+    failed: int
+    results: List[PostBulkItemResult]
+
+# 키워드 Schemas
+class KeywordCount(BaseModel):
+    """키워드별 게시물 수"""
+    keyword: str
+    post_count: int
+
+class TopKeywordsResponse(BaseModel):
+    """상위 키워드 응답"""
+    category_id: Optional[int] = None
+    keywords: List[KeywordCount]
+
+# 통계 Schemas
+class StatsMetrics(BaseModel):
+    """게시물/요약 집계 값"""
+    posts: int = Field(..., description="게시물 수")
+    summaries: int = Field(..., description="요약이 있는 게시물 수")
+    fallback_summaries: int = Field(..., description="대체 요약(LLM 실패) 수")
+    fallback_rate: float = Field(..., description="대체 요약 비율 (0~1)")
+    avg_confidence: Optional[float] = Field(None, description="LLM 요약 평균 신뢰도 (대체 요약 제외)")
+
+class CategoryStats(StatsMetrics):
+    category_id: int
+
+class DailyStats(StatsMetrics):
+    day: date
+
+class KeywordTrend(BaseModel):
+    keyword: str
+    post_count: int = Field(..., description="기간 내 게시물 수")
+    previous_count: int = Field(..., description="직전 같은 길이 기간의 게시물 수")
+
+class StatsResponse(BaseModel):
+    """문서 통계 응답"""
+    category_id: Optional[int] = None
+    days: int
+    totals: StatsMetrics
+    by_status: Dict[str, int]
+    by_category: List[CategoryStats]
+    daily: List[DailyStats]
+    keywords: List[KeywordTrend]
+    compacted_at: Optional[datetime] = Field(None, description="마지막 집계 정리 시각 (UTC)")
 
 # LLM 관련 Schemas
 class LLMSummaryRequest(BaseModel):
@@ -114,8 +233,30 @@ class LLMSummaryResponse(BaseModel):
     highlights: List[str] = Field(..., description="추출된 하이라이트")
     keywords: List[str] = Field(..., description="추출된 키워드")
     confidence_score: float = Field(..., description="신뢰도 점수")
+    model_version: Optional[str] = Field(None, description="실제 사용한 LLM 공급자/모델 (대체 요약은 fallback)")
     regenerated: bool = Field(default=False, description="재생성 여부")
 
+# 요약 작업 Schemas
+class SummaryJob(BaseModel):
+    """백그라운드 요약 작업"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    post_id: int
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    run_after: datetime
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+class SummaryStatusResponse(BaseModel):
+    """게시물 요약 상태 응답"""
+    post_id: int
+    summary_status: Optional[SummaryStatus] = None
+    job: Optional[SummaryJob] = None
+
 # Response Schemas
 class BaseResponse(BaseModel):
     """기본 응답 스키마"""
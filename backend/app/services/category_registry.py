@@ -0,0 +1,130 @@
+# backend/app/services/category_registry.py
+
+from typing import Dict, Optional, Tuple
+from sqlalchemy import func, select
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.category import Category
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATEGORY_NAME = "기타"
+
+class CategoryRegistry:
+    """
+    프로세스 내 카테고리 목록 (ID → 이름)
+
+    카테고리는 작고 거의 바뀌지 않으므로 게시물 생성/수정/요약 경로의
+    카테고리 검증과 이름 조회를 DB 없이 메모리에서 처리합니다.
+    - 앱 시작시 전체 로드
+    - CategoryService 쓰기 후 즉시 반영 (put/remove)
+    - 다른 프로세스의 변경은 주기적인 버전 확인(행 수, 최대 ID, 최대 수정 시각)으로 반영
+    - 모르는 ID는 다시 로드해 한 번 더 확인 (최소 간격 제한)
+
+    조회는 스냅샷 dict를 통째로 교체하는 방식이라 워커 스레드에서 읽어도 안전합니다.
+    """
+
+    MIN_RELOAD_INTERVAL_SECONDS = 1.0
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._names: Dict[int, str] = {}
+        self._fingerprint: Optional[Tuple] = None
+        self._loaded = False
+        self._last_reload = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # 조회 (DB 접근 없음)
+    # ------------------------------------------------------------------
+
+    def name_of(self, category_id: Optional[int], default: str = DEFAULT_CATEGORY_NAME) -> str:
+        """카테고리 이름 (없으면 default)"""
+        return self._names.get(category_id, default)
+
+    async def ensure(self, category_id: int, refresh: bool = False) -> bool:
+        """
+        카테고리 존재 확인
+        메모리에 없으면 다른 프로세스에서 막 생성되었을 수 있으므로 다시 로드해 확인합니다.
+        refresh=True면 메모리에 있어도 다시 로드합니다 (다른 프로세스에서 삭제되어
+        게시물 저장이 외래 키 위반으로 실패한 뒤 확인할 때).
+        """
+        if refresh:
+            await asyncio.to_thread(self.reload)
+            return category_id in self._names
+        if category_id in self._names:
+            return True
+        if time.monotonic() - self._last_reload >= self.MIN_RELOAD_INTERVAL_SECONDS:
+            await asyncio.to_thread(self.reload)
+        return category_id in self._names
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def put(self, category_id: int, name: str):
+        """카테고리 생성/수정 반영 (커밋 후 호출)"""
+        names = dict(self._names)
+        names[category_id] = name
+        self._names = names
+
+    def remove(self, category_id: int):
+        """카테고리 삭제 반영 (커밋 후 호출)"""
+        names = dict(self._names)
+        names.pop(category_id, None)
+        self._names = names
+
+    def reload(self):
+        """DB에서 전체 다시 로드"""
+        with SessionLocal() as db:
+            fingerprint = self._read_fingerprint(db)
+            self._names = dict(db.execute(select(Category.id, Category.name)).all())
+        self._fingerprint = fingerprint
+        self._loaded = True
+        self._last_reload = time.monotonic()
+
+    def refresh_if_changed(self) -> bool:
+        """버전(행 수, 최대 ID, 최대 수정 시각)이 바뀌었으면 다시 로드"""
+        with SessionLocal() as db:
+            fingerprint = self._read_fingerprint(db)
+        if self._loaded and fingerprint == self._fingerprint:
+            return False
+        self.reload()
+        return True
+
+    @staticmethod
+    def _read_fingerprint(db) -> Tuple:
+        return tuple(db.execute(
+            select(func.count(Category.id), func.max(Category.id), func.max(Category.updated_at))
+        ).one())
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """전체 로드 후 주기적 버전 확인 시작 (앱 시작시 호출)"""
+        await asyncio.to_thread(self.reload)
+        logger.info(f"카테고리 목록 로드 완료 - {len(self._names)}개")
+        if self.refresh_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                if await asyncio.to_thread(self.refresh_if_changed):
+                    logger.info(f"카테고리 목록 갱신 - {len(self._names)}개")
+            except Exception as e:
+                logger.error(f"카테고리 목록 갱신 실패: {str(e)}")
+
+category_registry = CategoryRegistry(refresh_seconds=settings.CATEGORY_REGISTRY_REFRESH_SECONDS)
@@ -0,0 +1,146 @@
+# backend/app/services/count_service.py
+
+from collections import Counter, OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal, upsert_rows
+from app.models.category import Category
+from app.models.post import Post, PostStatus
+from app.models.post_counter import PostCounter
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+def as_post_status(status: Union[str, PostStatus]) -> PostStatus:
+    """문자열/스키마 enum을 모델 PostStatus로 변환 (잘못된 값이면 ValueError)"""
+    try:
+        return PostStatus(getattr(status, "value", status))
+    except ValueError:
+        raise ValueError(f"잘못된 게시물 상태입니다: {status}")
+
+class PostCountService:
+    """
+    게시물 목록 total 계산
+
+    - 필터(카테고리/상태)만 있는 목록: post_counters 테이블의 카운터 합
+      (PostService 쓰기 경로에서 같은 트랜잭션으로 갱신되므로 정확함)
+    - 검색어가 있는 목록: COUNT 쿼리 (joinedload 없이),
+      estimate 모드에서는 짧은 TTL 캐시 사용
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._search_counts: "OrderedDict[Hashable, Tuple[float, int]]" = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # 카운터 갱신 (커밋은 호출하는 쪽에서 수행)
+    # ------------------------------------------------------------------
+
+    def adjust(self, db: Session, category_id: int, status: Union[str, PostStatus], delta: int):
+        """(카테고리, 상태) 카운터 증감"""
+        self.apply(db, Counter({(category_id, as_post_status(status)): delta}))
+
+    def apply(self, db: Session, deltas: Dict[Tuple[int, PostStatus], int]):
+        """여러 (카테고리, 상태) 카운터를 한 번에 증감"""
+        for (category_id, status), delta in deltas.items():
+            if not delta:
+                continue
+            updated = db.execute(
+                update(PostCounter)
+                .where(PostCounter.category_id == category_id, PostCounter.status == status)
+                .values(count=PostCounter.count + delta)
+            ).rowcount
+            if not updated:
+                # 카운터 행은 카테고리 생성/재계산 시 미리 만들어지므로 보통 오지 않음
+                db.execute(insert(PostCounter).values(
+                    category_id=category_id, status=status, count=delta
+                ))
+
+    def init_category(self, db: Session, category_id: int):
+        """새 카테고리의 상태별 카운터 행 생성"""
+        db.execute(insert(PostCounter), [
+            {"category_id": category_id, "status": status, "count": 0}
+            for status in PostStatus
+        ])
+
+    def remove_category(self, db: Session, category_id: int):
+        db.execute(delete(PostCounter).where(PostCounter.category_id == category_id))
+
+    def rebuild(self) -> int:
+        """
+        posts 테이블에서 카운터 재계산 (앱 시작시 호출)
+        PostService를 거치지 않은 쓰기(초기 데이터 스크립트 등)도 여기서 보정됩니다.
+
+        카운터 행을 먼저 잠근(SELECT ... FOR UPDATE) 뒤 같은 트랜잭션에서 세고 upsert하므로,
+        다른 프로세스의 게시물 쓰기는 재계산 전에 커밋되어 COUNT에 포함되거나
+        잠금이 풀린 뒤 apply로 증감되어 어느 쪽도 사라지지 않습니다.
+        """
+        with SessionLocal() as db:
+            db.execute(select(PostCounter.category_id).with_for_update()).all()
+            counts = {
+                (category_id, status): count
+                for category_id, status, count in db.execute(
+                    select(Post.category_id, Post.status, func.count(Post.id))
+                    .group_by(Post.category_id, Post.status)
+                )
+            }
+            category_ids = db.execute(select(Category.id)).scalars().all()
+
+            rows = [
+                {"category_id": category_id, "status": status, "count": counts.get((category_id, status), 0)}
+                for category_id in category_ids
+                for status in PostStatus
+            ]
+            upsert_rows(db, PostCounter.__table__, rows, ["category_id", "status"], ["count"])
+            db.commit()
+            self._search_counts.clear()
+            return sum(counts.values())
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def filter_count(
+        self,
+        db: Session,
+        category_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """카테고리/상태 필터에 해당하는 게시물 수 (카운터 합산)"""
+        query = select(func.coalesce(func.sum(PostCounter.count), 0))
+        if category_id:
+            query = query.where(PostCounter.category_id == category_id)
+        if status:
+            query = query.where(PostCounter.status == as_post_status(status))
+        return int(db.execute(query).scalar_one())
+
+    def search_count(self, db: Session, key: Hashable, conditions: List, estimate: bool) -> int:
+        """
+        검색 조건에 해당하는 게시물 수
+        estimate=True이면 TTL 동안 캐시된 값을 재사용합니다. (새 글이 바로 반영되지 않을 수 있음)
+        """
+        if estimate:
+            entry = self._search_counts.get(key)
+            if entry is not None:
+                expires_at, count = entry
+                if expires_at > time.monotonic():
+                    self._search_counts.move_to_end(key)
+                    return count
+                del self._search_counts[key]
+
+        count = db.execute(select(func.count(Post.id)).where(*conditions)).scalar_one()
+
+        self._search_counts[key] = (time.monotonic() + self.ttl_seconds, count)
+        self._search_counts.move_to_end(key)
+        while len(self._search_counts) > self.max_size:
+            self._search_counts.popitem(last=False)
+        return count
+
+post_count_service = PostCountService(
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+    max_size=settings.COUNT_CACHE_MAX_SIZE
+)
@@ -0,0 +1,81 @@
+# backend/app/services/document_changes.py
+
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Set, Tuple
+from sqlalchemy import func, literal, or_, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import engine
+from app.models.post import Post, CreatedAtType
+from app.models.summary import Summary
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 마지막으로 반영한 (게시물, 요약) 수정 시각
+Marks = Tuple[Optional[datetime], Optional[datetime]]
+
+# 수정 시각은 커밋보다 앞서 기록되므로 마지막으로 본 시각보다 조금 앞부터 다시 읽음
+OVERLAP = timedelta(seconds=5)
+
+def document_query():
+    """색인할 게시물 문서 (제목, 본문, 요약 검색 텍스트)"""
+    return (
+        select(Post.id, Post.title, Post.content, Summary.search_text)
+        .outerjoin(Summary, Summary.post_id == Post.id)
+    )
+
+def read_marks(db: Session) -> Marks:
+    """게시물/요약의 마지막 수정 시각 (색인 구성/동기화 전에 읽어 다음 동기화 기준으로 사용)"""
+    return (
+        db.execute(select(func.max(Post.updated_at))).scalar(),
+        db.execute(select(func.max(Summary.updated_at))).scalar()
+    )
+
+def fetch_changes(marks: Marks, known: Set[int]) -> Tuple[Marks, List, List[int]]:
+    """
+    프로세스 내 색인이 다른 워커 프로세스의 변경을 따라잡기 위한 조회
+    - 바뀐 게시물: posts/summaries의 updated_at이 marks(에서 OVERLAP을 뺀 시각) 이후인 문서
+    - 삭제된 게시물: 게시물 수가 색인(known + 바뀐 게시물)보다 적을 때만 ID 전체를 비교
+    (다음 기준 시각, 바뀐 문서 행, 삭제된 게시물 ID) 반환 - 같은 문서를 다시 반영해도 결과는 같음
+    """
+    with Session(engine) as db:
+        # 바뀐 행을 읽기 전에 기준 시각을 먼저 읽어야 그 사이 변경을 다음 주기에 다시 봄
+        next_marks = read_marks(db)
+        changed = db.execute(document_query().where(or_(*_changed_conditions(marks)))).all()
+        post_count = db.execute(select(func.count(Post.id))).scalar_one()
+        removed: List[int] = []
+        if post_count < len(known.union(row.id for row in changed)):
+            existing = set(db.execute(select(Post.id)).scalars())
+            removed = sorted(known - existing)
+    return next_marks, changed, removed
+
+def _changed_conditions(marks: Marks) -> List:
+    """기준 시각 이후 수정된 게시물 조건 (기준이 없으면 - 테이블이 비어 있었으면 - 전체)"""
+    conditions = []
+    for column, mark in zip((Post.updated_at, Summary.updated_at), marks):
+        # SQLite는 CURRENT_TIMESTAMP 형식(초 단위) 문자열로 비교해야 정확함
+        conditions.append(
+            column.is_not(None) if mark is None
+            else column >= literal(mark - OVERLAP, CreatedAtType)
+        )
+    return conditions
+
+def start_sync_loop(name: str, sync: Callable[[], int]):
+    """INDEX_SYNC_SECONDS마다 sync를 호출하는 백그라운드 스레드 시작 (0이면 시작하지 않음 - 단일 프로세스 전용)"""
+    if settings.INDEX_SYNC_SECONDS <= 0:
+        return
+
+    def loop():
+        while True:
+            time.sleep(settings.INDEX_SYNC_SECONDS)
+            try:
+                synced = sync()
+                if synced:
+                    logger.debug(f"{name} 동기화 - 게시물 {synced}건")
+            except Exception as e:
+                logger.error(f"{name} 동기화 실패: {str(e)}")
+
+    threading.Thread(target=loop, name=f"{name}-sync", daemon=True).start()
@@ -0,0 +1,426 @@
+# backend/app/services/import_service.py
+
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal, insert_rows_returning_ids, upsert_rows
+from app.models.category import Category
+from app.models.post import Post, PostStatus, SummaryStatus
+from app.models.summary import Summary
+from app.models.tag import Tag
+from app.services.keyword_service import keyword_index
+from app.services.llm_service import LLMService
+from app.services.search_service import build_summary_search_text
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("categories", "tags", "posts", "summaries")
+# JSONL의 type 필드 값 (단수형도 허용)
+KIND_ALIASES = {
+    "category": "categories", "categories": "categories",
+    "tag": "tags", "tags": "tags",
+    "post": "posts", "posts": "posts",
+    "summary": "summaries", "summaries": "summaries",
+}
+IMPORTED_MODEL_VERSION = "import"
+SUMMARY_UPDATE_COLUMNS = ["summary", "highlights", "keywords", "search_text", "confidence_score", "model_version"]
+
+class ImportRecordError(ValueError):
+    """입력 행 형식 오류 (해당 행만 건너뜀)"""
+
+def detect_kind(path: str) -> Optional[str]:
+    """파일 이름으로 종류 추정 (posts.jsonl, categories-2024.csv.gz 등)"""
+    name = os.path.basename(path).lower()
+    for kind in KINDS:
+        if name.startswith(kind) or name.startswith(kind.rstrip("s")):
+            return kind
+    return None
+
+# ----------------------------------------------------------------------
+# 행 변환
+# ----------------------------------------------------------------------
+
+def _text(record: Dict, field: str, max_length: Optional[int] = None, required: bool = False) -> Optional[str]:
+    value = record.get(field)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        if required:
+            raise ImportRecordError(f"필수 필드 누락: {field}")
+        return None
+    value = str(value)
+    if max_length is not None and len(value) > max_length:
+        raise ImportRecordError(f"{field} 길이가 {max_length}자를 넘습니다")
+    return value
+
+def _int(record: Dict, field: str) -> Optional[int]:
+    value = record.get(field)
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ImportRecordError(f"{field}는 정수여야 합니다: {value!r}")
+
+def _list(value) -> List[str]:
+    """JSON 배열 또는 CSV용 '|' 구분 문자열"""
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    value = str(value)
+    if value.startswith("["):
+        try:
+            return [str(item) for item in json.loads(value)]
+        except json.JSONDecodeError:
+            raise ImportRecordError(f"목록 형식이 올바르지 않습니다: {value[:40]}")
+    return [item.strip() for item in value.split("|") if item.strip()]
+
+def category_row(record: Dict) -> Dict:
+    return {
+        "name": _text(record, "name", 50, required=True),
+        "description": _text(record, "description", 200)
+    }
+
+def tag_row(record: Dict) -> Dict:
+    return {
+        "name": _text(record, "name", 50, required=True),
+        "color": _text(record, "color", 7)
+    }
+
+def summary_row(record: Dict, post_id: Optional[int]) -> Dict:
+    summary = _text(record, "summary", required=True)
+    highlights = _list(record.get("highlights"))
+    keywords = _list(record.get("keywords"))
+    try:
+        confidence = float(record.get("confidence_score") or 0)
+    except (TypeError, ValueError):
+        raise ImportRecordError(f"confidence_score는 숫자여야 합니다: {record.get('confidence_score')!r}")
+    return {
+        "post_id": post_id,
+        "summary": summary,
+        "highlights": highlights,
+        "keywords": keywords,
+        "search_text": build_summary_search_text(summary, highlights, keywords),
+        "confidence_score": max(0.0, min(100.0, confidence)),
+        "model_version": _text(record, "model_version", 50) or IMPORTED_MODEL_VERSION
+    }
+
+def post_row(record: Dict) -> Tuple[Dict, Optional[str], Optional[Dict]]:
+    """(게시물 행, 카테고리 이름, 함께 들어온 요약 행) - 카테고리 ID는 나중에 채움"""
+    status = record.get("status") or PostStatus.PUBLISHED.value
+    try:
+        status = PostStatus(status)
+    except ValueError:
+        raise ImportRecordError(f"알 수 없는 상태입니다: {status!r}")
+
+    row = {
+        "title": _text(record, "title", 255, required=True),
+        "content": _text(record, "content", required=True),
+        "category_id": _int(record, "category_id"),
+        "image_url": _text(record, "image_url", 500),
+        "status": status,
+    }
+    post_id = _int(record, "id")
+    if post_id is not None:
+        row["id"] = post_id
+    created_at = record.get("created_at")
+    if created_at:
+        try:
+            row["created_at"] = datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+        except ValueError:
+            raise ImportRecordError(f"created_at 형식이 올바르지 않습니다: {created_at!r}")
+
+    # 둘 다 있으면 (내보내기 파일 등) 다른 DB에서도 맞도록 이름을 우선
+    category_name = _text(record, "category", 50)
+    if category_name is not None:
+        row["category_id"] = None
+    elif row["category_id"] is None:
+        raise ImportRecordError("category 또는 category_id가 필요합니다")
+
+    # 요약: {"summary": {...}} 또는 summary/highlights/keywords 평면 필드 (CSV)
+    nested = record.get("summary")
+    summary = None
+    if isinstance(nested, dict):
+        summary = summary_row(nested, post_id)
+    elif nested:
+        summary = summary_row(record, post_id)
+    return row, category_name, summary
+
+# ----------------------------------------------------------------------
+# 입력 읽기 (재개용 바이트 위치 포함)
+# ----------------------------------------------------------------------
+
+def _open_binary(path: str):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+def read_records(path: str, offset: int = 0) -> Iterator[Tuple[Dict, int]]:
+    """
+    (레코드, 이 레코드 다음 바이트 위치) 순서대로 반환
+    CSV는 첫 줄 헤더를 읽은 뒤 offset으로 이동합니다.
+    """
+    is_csv = ".csv" in os.path.basename(path).lower()
+    with _open_binary(path) as raw:
+        header = None
+        if is_csv:
+            header = next(csv.reader([raw.readline().decode("utf-8-sig")]))
+            offset = max(offset, raw.tell())
+        raw.seek(offset)
+
+        if not is_csv:
+            while True:
+                line = raw.readline()
+                if not line:
+                    return
+                position = raw.tell()
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield ImportRecordError(f"JSON 형식 오류: {e}"), position
+                    continue
+                yield record, position
+        else:
+            # 따옴표 안 줄바꿈이 있는 행은 여러 줄을 이어 읽음
+            buffer = ""
+            while True:
+                line = raw.readline()
+                if not line:
+                    return
+                buffer += line.decode("utf-8")
+                if buffer.count('"') % 2:
+                    continue
+                position = raw.tell()
+                text, buffer = buffer, ""
+                if not text.strip():
+                    continue
+                values = next(csv.reader(io.StringIO(text)))
+                yield dict(zip(header, values)), position
+
+# ----------------------------------------------------------------------
+# 일괄 적재
+# ----------------------------------------------------------------------
+
+class BulkImporter:
+    """
+    카테고리/태그/게시물/요약 일괄 적재
+
+    - 종류별로 batch_size행씩 모아 한 번의 executemany(upsert)로 저장하고 배치마다 커밋
+      · 카테고리/태그: 이름 기준 upsert (설명/색상 갱신)
+      · 게시물: id가 있으면 id 기준 upsert, 없으면 추가 (함께 들어온 요약은 생성된 ID로 연결)
+      · 요약: post_id 기준 upsert, 게시물 summary_status=ready, 키워드 색인 교체
+    - 게시물의 category(이름)는 메모리 사전으로 ID를 찾고, 없는 카테고리는 배치 단위로 생성
+    - 커밋한 뒤 파일별 바이트 위치를 상태 파일에 기록하므로 중단된 지점부터 재개 가능
+      (id 없는 게시물은 커밋 직후 중단되면 마지막 배치가 중복될 수 있음)
+    - 형식이 잘못된 행은 건너뛰고 max_errors를 넘으면 중단
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 5000,
+        state_path: Optional[str] = None,
+        max_errors: int = 100,
+        progress: Optional[Callable[[str, int, float], None]] = None
+    ):
+        self.batch_size = batch_size
+        self.state_path = state_path
+        self.max_errors = max_errors
+        self.progress = progress
+        self.state: Dict[str, Dict] = {}
+        self.counts = {kind: 0 for kind in KINDS}
+        self.errors = 0
+        self._categories: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # 상태 파일
+    # ------------------------------------------------------------------
+
+    def load_state(self):
+        if self.state_path and os.path.exists(self.state_path):
+            with open(self.state_path, encoding="utf-8") as f:
+                self.state = json.load(f)
+
+    def _save_state(self):
+        if not self.state_path:
+            return
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.state_path)
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def import_file(self, path: str, kind: Optional[str] = None) -> int:
+        """파일 하나 적재 - 적재한 행 수 반환 (이미 끝난 파일은 0)"""
+        key = os.path.abspath(path)
+        file_state = self.state.get(key, {"offset": 0, "line": 0, "done": False})
+        if file_state.get("done"):
+            logger.info(f"이미 적재한 파일 건너뜀: {path}")
+            return 0
+        default_kind = kind or detect_kind(path)
+
+        buffers: Dict[str, List] = {name: [] for name in KINDS}
+        line = file_state["line"]
+        imported = 0
+        pending = 0
+        started = time.perf_counter()
+
+        with SessionLocal() as db:
+            self._categories = dict(db.execute(select(Category.name, Category.id)).all())
+            for record, position in read_records(path, file_state["offset"]):
+                line += 1
+                try:
+                    if isinstance(record, ImportRecordError):
+                        raise record
+                    record_kind = KIND_ALIASES.get(str(record.get("type", "")).lower(), default_kind)
+                    if record_kind is None:
+                        raise ImportRecordError("종류를 알 수 없습니다 (type 필드 또는 파일 이름으로 지정)")
+                    buffers[record_kind].append(self._convert(record_kind, record))
+                    pending += 1
+                except ImportRecordError as e:
+                    self._record_error(f"{path}:{line}", e)
+
+                if pending >= self.batch_size:
+                    imported += self._flush(db, buffers)
+                    pending = 0
+                    file_state = {"offset": position, "line": line, "done": False}
+                    self.state[key] = file_state
+                    self._save_state()
+                    if self.progress:
+                        self.progress(path, file_state["line"], time.perf_counter() - started)
+
+            imported += self._flush(db, buffers)
+
+        self.state[key] = {"offset": 0, "line": line, "done": True}
+        self._save_state()
+        if self.progress:
+            self.progress(path, line, time.perf_counter() - started)
+        return imported
+
+    def _record_error(self, location: str, error: Exception):
+        self.errors += 1
+        if self.errors <= 20:
+            logger.warning(f"{location} 건너뜀 - {error}")
+        if self.errors > self.max_errors:
+            raise RuntimeError(f"형식 오류가 {self.max_errors}건을 넘어 중단합니다 ({location})")
+
+    def _convert(self, kind: str, record: Dict):
+        if kind == "categories":
+            return category_row(record)
+        if kind == "tags":
+            return tag_row(record)
+        if kind == "posts":
+            return post_row(record)
+        post_id = _int(record, "post_id")
+        if post_id is None:
+            raise ImportRecordError("필수 필드 누락: post_id")
+        return summary_row(record, post_id)
+
+    def _flush(self, db: Session, buffers: Dict[str, List]) -> int:
+        """모은 행을 종류 순서대로 저장하고 커밋 (요약이 같은 배치의 게시물을 참조할 수 있도록)"""
+        total = sum(len(rows) for rows in buffers.values())
+        if not total:
+            return 0
+
+        if buffers["categories"]:
+            upsert_rows(db, Category.__table__, _dedupe(buffers["categories"], "name"), ["name"], ["description"])
+            self._reload_categories(db, [row["name"] for row in buffers["categories"]])
+        if buffers["tags"]:
+            upsert_rows(db, Tag.__table__, _dedupe(buffers["tags"], "name"), ["name"], ["color"])
+        if buffers["posts"]:
+            self._save_posts(db, buffers["posts"])
+        if buffers["summaries"]:
+            skipped = self._save_summaries(db, buffers["summaries"])
+            self.counts["summaries"] -= skipped
+            total -= skipped
+        db.commit()
+
+        for kind, rows in buffers.items():
+            self.counts[kind] += len(rows)
+            rows.clear()
+        return total
+
+    def _reload_categories(self, db: Session, names: List[str]):
+        self._categories.update(db.execute(
+            select(Category.name, Category.id).where(Category.name.in_(set(names)))
+        ).all())
+
+    def _save_posts(self, db: Session, items: List[Tuple[Dict, Optional[str], Optional[Dict]]]):
+        # 카테고리 이름 → ID (없는 카테고리는 한 번에 생성)
+        missing = {name for _, name, _ in items if name and name not in self._categories}
+        if missing:
+            upsert_rows(db, Category.__table__, [{"name": name} for name in missing], ["name"])
+            self._reload_categories(db, list(missing))
+        for row, name, _ in items:
+            if row["category_id"] is None:
+                row["category_id"] = self._categories[name]
+
+        summaries = []
+        # executemany는 모든 행의 컬럼이 같아야 하므로 (created_at 유무 등) 컬럼 구성별로 나눠 실행
+        for columns, group in _group_by_columns(items):
+            if "id" in columns:
+                rows = _dedupe([row for row, _ in group], "id")
+                # 요약 상태는 요약 저장 시점에만 바꿈 (요약 없이 다시 적재해도 유지)
+                upsert_rows(db, Post.__table__, rows, ["id"], [column for column in columns if column != "id"])
+                # 기존 게시물의 카테고리가 바뀌었을 수 있으므로 키워드 색인의 카테고리도 맞춤
+                keyword_index.set_category(db, [row["id"] for row in rows])
+                summaries.extend(summary for _, summary in group if summary)
+            elif any(summary for _, summary in group):
+                ids = insert_rows_returning_ids(db, Post.__table__, [row for row, _ in group])
+                for post_id, (_, summary) in zip(ids, group):
+                    if summary:
+                        summary["post_id"] = post_id
+                        summaries.append(summary)
+            else:
+                db.execute(Post.__table__.insert(), [row for row, _ in group])
+
+        if summaries:
+            self._upsert_summaries(db, summaries)
+
+    def _save_summaries(self, db: Session, rows: List[Dict]) -> int:
+        """요약 파일 적재 - 없는 게시물을 가리켜 건너뛴 행 수 반환"""
+        existing = set(db.execute(
+            select(Post.id).where(Post.id.in_({row["post_id"] for row in rows}))
+        ).scalars())
+        skipped = 0
+        for row in rows:
+            if row["post_id"] not in existing:
+                skipped += 1
+                self._record_error("summaries", ImportRecordError(f"게시물이 없습니다: post_id={row['post_id']}"))
+        self._upsert_summaries(db, [row for row in rows if row["post_id"] in existing])
+        return skipped
+
+    def _upsert_summaries(self, db: Session, rows: List[Dict]):
+        rows = _dedupe(rows, "post_id")
+        if not rows:
+            return
+        upsert_rows(db, Summary.__table__, rows, ["post_id"], SUMMARY_UPDATE_COLUMNS)
+        keyword_index.index_posts(db, {
+            row["post_id"]: [] if row["model_version"] == LLMService.FALLBACK_MODEL else row["keywords"]
+            for row in rows
+        })
+        db.execute(
+            update(Post)
+            .where(Post.id.in_([row["post_id"] for row in rows]))
+            .values(summary_status=SummaryStatus.READY)
+        )
+
+def _group_by_columns(items) -> List[Tuple[Tuple[str, ...], List]]:
+    groups: Dict[Tuple[str, ...], List] = {}
+    for row, _, summary in items:
+        groups.setdefault(tuple(row), []).append((row, summary))
+    return list(groups.items())
+
+def _dedupe(rows: List[Dict], key: str) -> List[Dict]:
+    """같은 배치 안에서 키가 겹치면 마지막 행만 남김 (한 문장 안의 중복 키 upsert 방지)"""
+    return list({row[key]: row for row in rows}.values())
@@ -0,0 +1,208 @@
+# backend/app/services/keyword_service.py
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, desc, exists, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal, upsert_rows
+from app.models.keyword import Keyword, PostKeyword
+from app.models.post import Post
+from app.models.summary import Summary
+from app.services.llm_service import LLMService
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_keyword(keyword) -> str:
+    """키워드 비교용 형태 (앞뒤 공백 제거, 연속 공백 하나로, 소문자, 50자 이내)"""
+    return _WHITESPACE.sub(" ", str(keyword or "")).strip().lower()[:50]
+
+class KeywordIndexService:
+    """
+    요약 키워드 색인 (keywords / post_keywords 테이블)
+
+    Summary.keywords(JSON)를 정규화해 게시물-키워드 행으로 저장하므로
+    "키워드 X가 있는 게시물", "카테고리 Y의 상위 키워드"를 JSON을 풀지 않고 색인으로 조회합니다.
+    - 갱신: 요약 저장(save_summary), 대량 적재, 게시물 카테고리 변경시 같은 트랜잭션에서
+      (커밋은 호출하는 쪽에서 수행, 게시물 삭제시에는 post_keywords.post_id의 ON DELETE CASCADE로 삭제)
+    - 대체 요약(fallback)의 키워드는 제목 단어라 색인하지 않음
+    - 기존 요약은 backfill로 한 번에 채움 (backfill_keywords.py, 색인이 비어 있으면 앱 시작시 자동)
+    """
+
+    # ------------------------------------------------------------------
+    # 색인 갱신
+    # ------------------------------------------------------------------
+
+    def index_post(self, db: Session, post_id: int, category_id: int, keywords: Optional[List[str]]):
+        """게시물 하나의 키워드 교체"""
+        self.index_posts(db, {post_id: keywords or []}, {post_id: category_id})
+
+    def index_posts(
+        self,
+        db: Session,
+        keywords_by_post: Dict[int, Optional[List[str]]],
+        category_by_post: Optional[Dict[int, int]] = None
+    ):
+        """
+        여러 게시물의 키워드를 한 번에 교체 (기존 연결 삭제 → 키워드 ID 확보 → 연결 일괄 추가)
+        category_by_post를 생략하면 posts 테이블에서 한 번에 읽습니다.
+        """
+        post_ids = list(keywords_by_post)
+        if not post_ids:
+            return
+        if category_by_post is None:
+            category_by_post = dict(db.execute(
+                select(Post.id, Post.category_id).where(Post.id.in_(post_ids))
+            ).all())
+
+        db.execute(delete(PostKeyword).where(PostKeyword.post_id.in_(post_ids)))
+
+        names_by_post = {
+            post_id: _unique(normalize_keyword(keyword) for keyword in keywords or [])
+            for post_id, keywords in keywords_by_post.items()
+            if post_id in category_by_post
+        }
+        keyword_ids = self._keyword_ids(db, {name for names in names_by_post.values() for name in names})
+        rows = [
+            {
+                "post_id": post_id,
+                "keyword_id": keyword_id,
+                "category_id": category_by_post[post_id],
+                "position": position
+            }
+            for post_id, names in names_by_post.items()
+            # DB가 같은 키워드로 보는 표기가 함께 있으면 한 번만
+            for position, keyword_id in enumerate(_unique(keyword_ids[name] for name in names))
+        ]
+        if rows:
+            db.execute(PostKeyword.__table__.insert(), rows)
+
+    def set_category(self, db: Session, post_ids: Iterable[int], category_id: Optional[int] = None):
+        """
+        게시물 카테고리 변경 반영
+        category_id를 생략하면 각 게시물의 현재 카테고리로 맞춤 (대량 적재 후 등)
+        """
+        post_ids = list(post_ids)
+        if not post_ids:
+            return
+        if category_id is None:
+            category_id = (
+                select(Post.category_id).where(Post.id == PostKeyword.post_id).scalar_subquery()
+            )
+        db.execute(
+            update(PostKeyword)
+            .where(PostKeyword.post_id.in_(post_ids))
+            .values(category_id=category_id)
+        )
+
+    def _keyword_ids(self, db: Session, names: set) -> Dict[str, int]:
+        """
+        키워드 이름 → ID (없는 키워드는 추가, 동시에 추가되어도 무시)
+        바이너리 콜레이션으로 만들기 전의 테이블처럼 DB가 다른 표기("cafe")를 같은 이름으로 보면
+        추가가 그 행에 합쳐지고 조회 결과도 저장된 표기로 오므로, 요청한 이름으로 못 찾은 것은
+        DB의 비교 규칙대로 하나씩 다시 조회해 그 행의 ID를 씀
+        """
+        if not names:
+            return {}
+        keyword_ids = dict(db.execute(
+            select(Keyword.name, Keyword.id).where(Keyword.name.in_(names))
+        ).all())
+        missing = [name for name in names if name not in keyword_ids]
+        if missing:
+            upsert_rows(db, Keyword.__table__, [{"name": name} for name in missing], ["name"])
+            keyword_ids.update(db.execute(
+                select(Keyword.name, Keyword.id).where(Keyword.name.in_(missing))
+            ).all())
+        for name in names:
+            if name not in keyword_ids:
+                keyword_ids[name] = db.execute(
+                    select(Keyword.id).where(Keyword.name == name).limit(1)
+                ).scalar_one()
+        return {name: keyword_ids[name] for name in names}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def post_condition(self, keyword: str):
+        """목록 쿼리에 붙일 "키워드가 있는 게시물" 조건"""
+        return Post.id.in_(
+            select(PostKeyword.post_id)
+            .join(Keyword, Keyword.id == PostKeyword.keyword_id)
+            .where(Keyword.name == normalize_keyword(keyword))
+        )
+
+    async def top_keywords(
+        self, db: AsyncSession, category_id: Optional[int] = None, limit: int = 20
+    ) -> List[Tuple[str, int]]:
+        """
+        게시물 수가 많은 키워드 (이름, 게시물 수) - 카테고리 지정시 (category_id, keyword_id) 색인만 사용
+        """
+        counts = select(
+            PostKeyword.keyword_id, func.count().label("post_count")
+        ).group_by(PostKeyword.keyword_id)
+        if category_id is not None:
+            counts = counts.where(PostKeyword.category_id == category_id)
+        counts = counts.order_by(desc("post_count"), PostKeyword.keyword_id).limit(limit).subquery()
+
+        result = await db.execute(
+            select(Keyword.name, counts.c.post_count)
+            .join(counts, counts.c.keyword_id == Keyword.id)
+            .order_by(desc(counts.c.post_count), Keyword.name)
+        )
+        return [(name, post_count) for name, post_count in result.all()]
+
+    # ------------------------------------------------------------------
+    # 기존 요약 채우기
+    # ------------------------------------------------------------------
+
+    def backfill(self, batch_size: int = 1000, progress=None) -> int:
+        """모든 요약에서 색인을 다시 만듦 (post_id 순 배치, 배치마다 커밋) - 처리한 요약 수 반환"""
+        processed = 0
+        last_post_id = 0
+        with SessionLocal() as db:
+            db.execute(delete(PostKeyword))
+            db.commit()
+            while True:
+                rows = db.execute(
+                    select(Summary.post_id, Summary.keywords, Post.category_id)
+                    .join(Post, Post.id == Summary.post_id)
+                    .where(
+                        Summary.post_id > last_post_id,
+                        or_(Summary.model_version.is_(None), Summary.model_version != LLMService.FALLBACK_MODEL)
+                    )
+                    .order_by(Summary.post_id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                self.index_posts(
+                    db,
+                    {post_id: keywords for post_id, keywords, _ in rows},
+                    {post_id: category_id for post_id, _, category_id in rows}
+                )
+                db.commit()
+                processed += len(rows)
+                last_post_id = rows[-1][0]
+                if progress:
+                    progress(processed)
+        logger.info(f"키워드 색인 채우기 완료 - 요약 {processed}건")
+        return processed
+
+    def backfill_if_empty(self) -> int:
+        """색인이 비어 있는데 요약이 있으면 채움 (앱 시작시 - 테이블을 새로 만든 직후 등)"""
+        with SessionLocal() as db:
+            indexed = db.execute(select(exists().where(PostKeyword.post_id.is_not(None)))).scalar()
+            summarized = db.execute(select(exists().where(Summary.id.is_not(None)))).scalar()
+        if indexed or not summarized:
+            return 0
+        return self.backfill()
+
+def _unique(names: Iterable[str]) -> List[str]:
+    """빈 값 제외, 순서 유지 중복 제거"""
+    return list(dict.fromkeys(name for name in names if name))
+
+keyword_index = KeywordIndexService()
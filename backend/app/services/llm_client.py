@@ -0,0 +1,173 @@
+# backend/app/services/llm_client.py
+
+from openai import AsyncOpenAI
+from typing import AsyncIterator, Dict, List, Optional
+from app.core.config import settings
+from app.core.metrics import llm_call_duration, llm_tokens, metrics
+import asyncio
+import httpx
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class LLMClientPool:
+    """
+    프로세스 전역에서 공유하는 비동기 OpenAI 클라이언트
+
+    - keep-alive 커넥션을 재사용하는 httpx.AsyncClient 하나를 공유
+    - 세마포어로 동시에 진행되는 LLM 호출 수를 제한
+    - 호출별 타임아웃 (대기 시간 포함)
+
+    이벤트 루프를 막지 않으므로 요약이 여러 건 진행 중이어도
+    일반 조회 요청은 지연 없이 처리됩니다.
+    base_url/api_key를 지정하면 OpenAI 호환 로컬 서버용 풀로 사용합니다.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+        self.base_url = base_url if base_url is not None else (settings.OPENAI_BASE_URL or None)
+        self.api_key = api_key if api_key is not None else settings.OPENAI_API_KEY
+        self._client: Optional[AsyncOpenAI] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 LLM 호출 수"""
+        return self._in_flight
+
+    def _get_client(self) -> AsyncOpenAI:
+        if self._client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY_SECONDS
+                ),
+                timeout=httpx.Timeout(
+                    settings.LLM_TIMEOUT_SECONDS,
+                    connect=settings.LLM_CONNECT_TIMEOUT_SECONDS
+                )
+            )
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=http_client,
+                max_retries=settings.LLM_MAX_RETRIES
+            )
+            logger.info(
+                f"LLM 클라이언트 풀 생성 - 동시 호출 제한: {settings.LLM_MAX_CONCURRENCY}, "
+                f"최대 커넥션: {settings.LLM_MAX_CONNECTIONS}"
+            )
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+        return self._semaphore
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Chat Completions 호출
+
+        timeout은 동시 호출 제한 대기 시간을 포함한 전체 제한 시간입니다.
+        """
+        timeout = timeout or settings.LLM_TIMEOUT_SECONDS
+        return await asyncio.wait_for(
+            self._chat(messages, model, max_tokens, temperature, timeout),
+            timeout=timeout
+        )
+
+    async def _chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float
+    ) -> str:
+        client = self._get_client()
+        async with self._get_semaphore():
+            self._in_flight += 1
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    timeout=timeout
+                )
+                outcome = "ok"
+            finally:
+                self._in_flight -= 1
+                if metrics.enabled:
+                    llm_call_duration.observe(time.perf_counter() - started, model, "chat", outcome)
+        if metrics.enabled and response.usage is not None:
+            llm_tokens.inc(model, "prompt", amount=response.usage.prompt_tokens)
+            llm_tokens.inc(model, "completion", amount=response.usage.completion_tokens)
+        return response.choices[0].message.content.strip()
+
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Chat Completions 스트리밍 호출 - 생성되는 텍스트 조각을 순서대로 반환
+
+        timeout은 동시 호출 제한 대기 시간과 조각 사이 최대 대기 시간에 적용됩니다.
+        중간에 소비를 멈추면 (클라이언트 연결 종료 등) 업스트림 요청도 닫힙니다.
+        """
+        timeout = timeout or settings.LLM_TIMEOUT_SECONDS
+        client = self._get_client()
+        semaphore = self._get_semaphore()
+        await asyncio.wait_for(semaphore.acquire(), timeout=timeout)
+        self._in_flight += 1
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                timeout=timeout,
+                stream=True
+            )
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+                outcome = "ok"
+            finally:
+                await stream.close()
+        finally:
+            self._in_flight -= 1
+            semaphore.release()
+            if metrics.enabled:
+                llm_call_duration.observe(time.perf_counter() - started, model, "stream", outcome)
+
+    async def close(self):
+        """커넥션 풀 정리 (앱 종료시 호출)"""
+        if self._client is not None:
+            await self._client.close()
+            logger.info("LLM 클라이언트 풀 종료")
+        self._client = None
+        self._semaphore = None
+
+llm_client = LLMClientPool()
@@ -0,0 +1,284 @@
+# backend/app/services/llm_providers.py
+
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from openai import OpenAI
+from app.core.config import settings
+from app.core.metrics import llm_call_duration, llm_tokens, metrics
+from app.services.llm_client import LLMClientPool, llm_client
+from app.utils.chunking import estimate_tokens
+from app.utils.extractive import extractive_summary
+import asyncio
+import httpx
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class LLMProvider:
+    """
+    LLM 공급자 공통 인터페이스
+
+    - supports_chat: 프롬프트 기반 호출(chat/stream_chat) 지원 여부
+      (False면 summarize로 요약만 직접 생성 - 자유 질문에는 사용하지 않음)
+    - rate_limited: 호출 한도 스케줄러(RPM/TPM)를 거쳐야 하는지 여부
+    - version: Summary.model_version에 기록되는 실제 사용 공급자/모델
+    """
+
+    name = "base"
+    supports_chat = True
+    rate_limited = False
+
+    def __init__(self, model: str):
+        self.model = model
+
+    @property
+    def version(self) -> str:
+        return f"{self.name}:{self.model}"[:50]
+
+    async def chat(
+        self, messages: List[Dict[str, str]], max_tokens: int, temperature: float
+    ) -> str:
+        raise NotImplementedError
+
+    async def stream_chat(
+        self, messages: List[Dict[str, str]], max_tokens: int, temperature: float
+    ) -> AsyncIterator[str]:
+        raise NotImplementedError
+        yield  # pragma: no cover
+
+    async def summarize(self, title: str, content: str) -> Dict:
+        raise NotImplementedError
+
+class PooledChatProvider(LLMProvider):
+    """OpenAI 호환 Chat Completions 엔드포인트 (공유 비동기 커넥션 풀 사용)"""
+
+    def __init__(self, model: str, pool: LLMClientPool):
+        super().__init__(model)
+        self.pool = pool
+
+    async def chat(self, messages, max_tokens, temperature) -> str:
+        return await self.pool.chat(
+            messages=messages, model=self.model, max_tokens=max_tokens, temperature=temperature
+        )
+
+    async def stream_chat(self, messages, max_tokens, temperature) -> AsyncIterator[str]:
+        async for delta in self.pool.stream_chat(
+            messages=messages, model=self.model, max_tokens=max_tokens, temperature=temperature
+        ):
+            yield delta
+
+class OpenAIProvider(PooledChatProvider):
+    """OpenAI (비동기 클라이언트) - 기존 요약과 같은 model_version(모델 이름만) 기록"""
+
+    name = "openai"
+    rate_limited = True
+
+    def __init__(self, model: str):
+        super().__init__(model, llm_client)
+
+    @property
+    def version(self) -> str:
+        return self.model[:50]
+
+class LocalHTTPProvider(PooledChatProvider):
+    """
+    OpenAI 호환 로컬 서버 (Ollama, vLLM, benchmarks/fake_openai.py 등)
+    외부 호출 한도가 없으므로 스케줄러를 거치지 않습니다.
+    """
+
+    name = "local"
+
+    _pool: Optional[LLMClientPool] = None
+
+    def __init__(self, model: str):
+        if LocalHTTPProvider._pool is None:
+            LocalHTTPProvider._pool = LLMClientPool(
+                base_url=settings.LOCAL_LLM_BASE_URL, api_key=settings.LOCAL_LLM_API_KEY
+            )
+        super().__init__(model, LocalHTTPProvider._pool)
+
+class OpenAISyncProvider(LLMProvider):
+    """
+    OpenAI (동기 클라이언트를 스레드에서 실행)
+
+    비동기 클라이언트를 쓸 수 없는 환경(프록시/인증서 설정이 동기 httpx에만 맞춰진 경우 등)이나
+    문제 분리용입니다. 스트리밍은 전체 응답을 받은 뒤 한 조각으로 보냅니다.
+    """
+
+    name = "openai-sync"
+    rate_limited = True
+
+    _client: Optional[OpenAI] = None
+    _client_lock = threading.Lock()
+
+    @classmethod
+    def _get_client(cls) -> OpenAI:
+        with cls._client_lock:
+            if cls._client is None:
+                cls._client = OpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    base_url=settings.OPENAI_BASE_URL or None,
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=settings.LLM_MAX_CONNECTIONS,
+                            max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS
+                        ),
+                        timeout=httpx.Timeout(
+                            settings.LLM_TIMEOUT_SECONDS, connect=settings.LLM_CONNECT_TIMEOUT_SECONDS
+                        )
+                    ),
+                    max_retries=settings.LLM_MAX_RETRIES
+                )
+            return cls._client
+
+    def complete(self, messages, max_tokens: int, temperature: float) -> str:
+        """동기 호출 (스크립트 등 이벤트 루프 밖에서도 사용 가능)"""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = self._get_client().chat.completions.create(
+                model=self.model, messages=messages, max_tokens=max_tokens, temperature=temperature
+            )
+            outcome = "ok"
+        finally:
+            if metrics.enabled:
+                llm_call_duration.observe(time.perf_counter() - started, self.model, "chat", outcome)
+        if metrics.enabled and response.usage is not None:
+            llm_tokens.inc(self.model, "prompt", amount=response.usage.prompt_tokens)
+            llm_tokens.inc(self.model, "completion", amount=response.usage.completion_tokens)
+        return response.choices[0].message.content.strip()
+
+    async def chat(self, messages, max_tokens, temperature) -> str:
+        return await asyncio.to_thread(self.complete, messages, max_tokens, temperature)
+
+    async def stream_chat(self, messages, max_tokens, temperature) -> AsyncIterator[str]:
+        yield await self.chat(messages, max_tokens, temperature)
+
+class ExtractiveProvider(LLMProvider):
+    """LLM 없이 본문 문장을 골라 요약 (오프라인/부하 테스트/장애 대비용)"""
+
+    name = "extractive"
+    supports_chat = False
+
+    def __init__(self, model: str = "extractive"):
+        super().__init__(model)
+
+    @property
+    def version(self) -> str:
+        return self.name
+
+    async def summarize(self, title: str, content: str) -> Dict:
+        return await asyncio.to_thread(extractive_summary, title, content)
+
+PROVIDERS = {
+    provider.name: provider
+    for provider in (OpenAIProvider, OpenAISyncProvider, LocalHTTPProvider, ExtractiveProvider)
+}
+
+def parse_provider_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """'이름' 또는 '이름:모델' → (이름, 모델 또는 None)"""
+    name, _, model = spec.strip().partition(":")
+    name = name.strip().lower()
+    if name not in PROVIDERS:
+        raise ValueError(f"알 수 없는 LLM 공급자입니다: {name} (사용 가능: {', '.join(PROVIDERS)})")
+    return name, model.strip() or None
+
+class LLMRouter:
+    """
+    요청별 LLM 공급자 선택
+
+    - 기본 공급자: LLM_PROVIDER
+    - 짧은 입력: 본문 추정 토큰 수가 LLM_SHORT_INPUT_TOKENS 이하면 LLM_SHORT_INPUT_PROVIDER
+      (예: extractive, openai:gpt-4.1-nano)
+    - 장애 대비: 선택된 공급자가 실패하면 LLM_FAILOVER_PROVIDER로 한 번 더 시도
+
+    모델을 생략하면 openai 계열은 용도별 기본 모델(요약/질문), local은 LOCAL_LLM_MODEL을 사용합니다.
+    공급자 객체는 (이름, 모델)별로 하나만 만들어 재사용합니다.
+    """
+
+    def __init__(self, default: str, short_input: str, short_input_tokens: int, failover: str):
+        # 설정 오류는 시작 시점에 드러나도록 미리 검증
+        self.default = parse_provider_spec(default)
+        self.short_input = parse_provider_spec(short_input) if short_input else None
+        self.short_input_tokens = short_input_tokens
+        self.failover = parse_provider_spec(failover) if failover else None
+        self._providers: Dict[Tuple[str, str], LLMProvider] = {}
+
+    def _get(self, spec: Tuple[str, Optional[str]], purpose_model: str) -> LLMProvider:
+        name, model = spec
+        if model is None:
+            model = {
+                "local": settings.LOCAL_LLM_MODEL,
+                "extractive": "extractive"
+            }.get(name, purpose_model)
+        key = (name, model)
+        provider = self._providers.get(key)
+        if provider is None:
+            provider = PROVIDERS[name](model)
+            self._providers[key] = provider
+        return provider
+
+    def summary_providers(self, content: str) -> List[LLMProvider]:
+        """요약에 시도할 공급자 (순서대로)"""
+        model = settings.LLM_SUMMARY_MODEL
+        if (
+            self.short_input is not None and self.short_input_tokens > 0
+            and estimate_tokens(content) <= self.short_input_tokens
+        ):
+            primary = self._get(self.short_input, model)
+        else:
+            primary = self._get(self.default, model)
+        providers = [primary]
+        if self.failover is not None:
+            failover = self._get(self.failover, model)
+            if failover is not primary:
+                providers.append(failover)
+        return providers
+
+    def ask_providers(self) -> List[LLMProvider]:
+        """자유 질문에 시도할 공급자 (프롬프트 호출을 지원하는 것만)"""
+        model = settings.LLM_ASK_MODEL
+        providers = []
+        for spec in (self.default, self.failover):
+            if spec is None:
+                continue
+            provider = self._get(spec, model)
+            if provider.supports_chat and provider not in providers:
+                providers.append(provider)
+        return providers
+
+    def describe(self) -> Dict:
+        return {
+            "default": self._get(self.default, settings.LLM_SUMMARY_MODEL).version,
+            "short_input": (
+                self._get(self.short_input, settings.LLM_SUMMARY_MODEL).version
+                if self.short_input is not None and self.short_input_tokens > 0 else None
+            ),
+            "short_input_tokens": self.short_input_tokens,
+            "failover": (
+                self._get(self.failover, settings.LLM_SUMMARY_MODEL).version
+                if self.failover is not None else None
+            ),
+            "ask": [provider.version for provider in self.ask_providers()]
+        }
+
+    async def close(self):
+        """공급자별 커넥션 풀 정리 (앱 종료시 호출)"""
+        pools = set()
+        for provider in self._providers.values():
+            pool = getattr(provider, "pool", None)
+            if pool is not None:
+                pools.add(pool)
+        for pool in pools:
+            await pool.close()
+        # 아직 공급자를 만들지 않았어도 공유 OpenAI 풀은 정리
+        if llm_client not in pools:
+            await llm_client.close()
+
+llm_router = LLMRouter(
+    default=settings.LLM_PROVIDER,
+    short_input=settings.LLM_SHORT_INPUT_PROVIDER,
+    short_input_tokens=settings.LLM_SHORT_INPUT_TOKENS,
+    failover=settings.LLM_FAILOVER_PROVIDER
+)
@@ -0,0 +1,195 @@
+# backend/app/services/llm_scheduler.py
+
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Dict, List, Optional
+from app.core.config import settings
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class LLMPriority(IntEnum):
+    """LLM 호출 우선순위 (값이 작을수록 먼저)"""
+    INTERACTIVE = 0  # 사용자가 응답을 기다리는 호출 (미리보기, 자유 질문)
+    BACKGROUND = 1   # 요약 워커, 재생성 등 일괄 작업
+
+# 현재 호출 흐름의 우선순위 (LLMService 공개 메서드에서 설정, 내부 호출까지 전달)
+current_priority: ContextVar[LLMPriority] = ContextVar("llm_priority", default=LLMPriority.INTERACTIVE)
+
+class LLMDeadlineExceeded(Exception):
+    """대기 기한 안에 호출 한도를 확보할 수 없음"""
+
+class _TokenBucket:
+    """분당 한도를 초당 비율로 채우는 토큰 버킷 (limit <= 0이면 무제한)"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def refill(self, now: float):
+        if self.unlimited:
+            return
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def seconds_until(self, amount: float, reserve: float) -> float:
+        """level에서 reserve를 남기고 amount를 꺼낼 수 있을 때까지 남은 시간"""
+        if self.unlimited:
+            return 0.0
+        # 한도보다 큰 요청은 가득 찼을 때 통과시킴
+        needed = min(amount + reserve, self.capacity) - self.level
+        return max(0.0, needed / self.rate)
+
+    def take(self, amount: float):
+        if not self.unlimited:
+            self.level -= min(amount, self.capacity)
+
+class _Ticket:
+    __slots__ = ("priority", "seq", "tokens")
+
+    def __init__(self, priority: LLMPriority, seq: int, tokens: int):
+        self.priority = priority
+        self.seq = seq
+        self.tokens = tokens
+
+    def __lt__(self, other: "_Ticket") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+class LLMScheduler:
+    """
+    LLM 호출 우선순위 스케줄러
+
+    - 분당 요청 수(RPM)와 분당 추정 토큰 수(TPM) 두 개의 토큰 버킷으로 호출 속도 제한
+    - 대기열은 (우선순위, 도착 순서) 순으로 처리
+    - BACKGROUND 호출은 버킷의 일부(LLM_INTERACTIVE_RESERVE_RATIO)를 남겨 두어야 통과하므로
+      일괄 작업이 한도를 다 써도 사용자 호출은 바로 처리됨
+    - 앞선 대기열과 버킷 상태로 예상 시작 시각을 계산해 우선순위별 대기 기한을 넘기면
+      기다리지 않고 LLMDeadlineExceeded로 거절 (호출하는 쪽에서 대체 요약으로 처리)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        reserve_ratio: float,
+        deadlines: Dict[LLMPriority, float]
+    ):
+        self._requests = _TokenBucket(requests_per_minute)
+        self._tokens = _TokenBucket(tokens_per_minute)
+        self.reserve_ratio = reserve_ratio
+        self.deadlines = deadlines
+        self._queue: List[_Ticket] = []
+        self._seq = itertools.count()
+        self._changed: Optional[asyncio.Condition] = None
+
+        # 우선순위별 카운터
+        self.granted = {priority.name.lower(): 0 for priority in LLMPriority}
+        self.rejected = {priority.name.lower(): 0 for priority in LLMPriority}
+        self.wait_seconds = {priority.name.lower(): 0.0 for priority in LLMPriority}
+
+    @property
+    def enabled(self) -> bool:
+        return not (self._requests.unlimited and self._tokens.unlimited)
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    async def acquire(self, tokens: int, priority: Optional[LLMPriority] = None):
+        """
+        호출 한도 확보 (확보할 때까지 대기)
+        priority를 생략하면 현재 호출 흐름의 우선순위(current_priority)를 사용합니다.
+        """
+        priority = current_priority.get() if priority is None else priority
+        name = priority.name.lower()
+        if not self.enabled:
+            self.granted[name] += 1
+            return
+
+        started = time.monotonic()
+        deadline = started + self.deadlines[priority]
+        ticket = _Ticket(priority, next(self._seq), tokens)
+        changed = self._get_condition()
+
+        async with changed:
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._requests.refill(now)
+                    self._tokens.refill(now)
+
+                    wait = self._estimate_wait(ticket)
+                    if wait <= 0 and self._queue[0] is ticket:
+                        heapq.heappop(self._queue)
+                        self._requests.take(1)
+                        self._tokens.take(tokens)
+                        self.granted[name] += 1
+                        self.wait_seconds[name] += now - started
+                        changed.notify_all()
+                        return
+
+                    if now + wait > deadline:
+                        self.rejected[name] += 1
+                        raise LLMDeadlineExceeded(
+                            f"LLM 호출 한도 대기 예상 {wait:.1f}초가 기한을 넘습니다 ({name})"
+                        )
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=max(wait, 0.01))
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                    heapq.heapify(self._queue)
+                    changed.notify_all()
+                raise
+
+    def _estimate_wait(self, ticket: _Ticket) -> float:
+        """이 요청이 시작되기까지 남은 예상 시간 (앞선 대기열 요청을 모두 처리한 뒤)"""
+        ahead = [other for other in self._queue if other < ticket]
+        request_demand = len(ahead) + 1
+        token_demand = sum(other.tokens for other in ahead) + ticket.tokens
+        reserve = self.reserve_ratio if ticket.priority != LLMPriority.INTERACTIVE else 0.0
+        return max(
+            self._requests.seconds_until(request_demand, self._requests.capacity * reserve),
+            self._tokens.seconds_until(token_demand, self._tokens.capacity * reserve)
+        )
+
+    def stats(self) -> Dict:
+        now = time.monotonic()
+        self._requests.refill(now)
+        self._tokens.refill(now)
+        return {
+            "enabled": self.enabled,
+            "queued": len(self._queue),
+            "requests_available": None if self._requests.unlimited else round(self._requests.level, 1),
+            "tokens_available": None if self._tokens.unlimited else round(self._tokens.level),
+            "granted": dict(self.granted),
+            "rejected": dict(self.rejected),
+            "avg_wait_seconds": {
+                name: round(self.wait_seconds[name] / count, 3) if count else 0.0
+                for name, count in self.granted.items()
+            }
+        }
+
+llm_scheduler = LLMScheduler(
+    requests_per_minute=settings.LLM_RATE_LIMIT_RPM,
+    tokens_per_minute=settings.LLM_RATE_LIMIT_TPM,
+    reserve_ratio=settings.LLM_INTERACTIVE_RESERVE_RATIO,
+    deadlines={
+        LLMPriority.INTERACTIVE: settings.LLM_INTERACTIVE_DEADLINE_SECONDS,
+        LLMPriority.BACKGROUND: settings.LLM_BACKGROUND_DEADLINE_SECONDS
+    }
+)
@@ -1,59 +1,423 @@
-from openai import OpenAI
-from typing import Dict
+from typing import AsyncIterator, Dict, Hashable, List, Optional, Tuple
 from app.core.config import settings
+from app.core.metrics import llm_parse_failures, llm_summaries, metrics
+from app.services.llm_providers import LLMProvider, llm_router
+from app.services.llm_scheduler import llm_scheduler, current_priority, LLMPriority
+from app.services.summary_cache import summary_cache
+from app.utils.chunking import estimate_tokens, split_into_chunks
+from app.utils.json_stream import JsonStreamParser
+from app.utils.single_flight import SingleFlight
+import asyncio
+import copy
 import logging
 import json
 
 logger = logging.getLogger(__name__)
 
 class LLMService:
+    # 요약 프롬프트나 응답 형식을 바꾸면 올려서 기존 캐시를 무효화
+    PROMPT_VERSION = "v1"
+    # 대체 요약에 기록되는 model_version
+    FALLBACK_MODEL = "fallback"
+    ASK_SYSTEM_PROMPT = "Assistant로서 사용자 질문에 자연어로 답변하세요. 반드시 한국어로 답변하세요."
+    ASK_FAILURE_MESSAGE = "죄송합니다. 답변을 생성하는 데 실패했습니다."
+    CATEGORY_CONTEXT = {
+        "독서": "이 텍스트는 독서 관련 내용입니다. 책의 핵심 내용과 인사이트를 중심으로 요약해주세요.",
+        "학습": "이 텍스트는 학습 자료입니다. 핵심 개념과 중요한 학습 포인트를 중심으로 요약해주세요.",
+        "일상": "이 텍스트는 일상 기록입니다. 주요 사건과 의미 있는 내용을 중심으로 요약해주세요.",
+        "기타": "이 텍스트의 주요 내용과 핵심 포인트를 중심으로 요약해주세요."
+    }
+
     def __init__(self):
-        pass
+        # 동시에 들어온 같은 요청은 LLM 호출 하나를 공유
+        self._summary_flights = SingleFlight()
+        self._ask_flights = SingleFlight()
+
+    async def generate_summary(
+        self, title: str, content: str, category: str,
+        use_cache: bool = True, fallback: bool = True,
+        owner: Optional[Hashable] = None,
+        priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> Dict:
+        """
+        요약 생성 (내용 해시 캐시 사용)
 
-    async def generate_summary(self, title: str, content: str, category: str) -> Dict:
+        같은 제목/내용/카테고리로 미리보기 후 저장하면 LLM은 한 번만 호출됩니다.
+        같은 입력으로 동시에 들어온 요청(재생성 연타 등)은 진행 중인 호출 하나를 함께 기다립니다.
+        use_cache=False면 캐시를 건너뛰고 새로 생성한 결과로 캐시를 갱신합니다.
+        fallback=False면 실패시 대체 요약 대신 예외를 그대로 전달합니다 (재시도용).
+        owner를 지정하면 같은 owner의 새 요청이 들어올 때 이 요청은 SupersededError로 끝나고,
+        아무도 기다리지 않는 LLM 호출은 취소됩니다 (미리보기용).
+        priority는 호출 한도 대기열의 우선순위입니다 (일괄 작업은 BACKGROUND).
+        공급자는 입력 길이에 따라 선택하며 (llm_router), 실패하면 장애 대비 공급자를 시도합니다.
+        """
+        providers = llm_router.summary_providers(content)
+        cache_key = summary_cache.make_key(
+            title, content, category, self.PROMPT_VERSION, providers[0].version
+        )
+        if use_cache:
+            cached = await summary_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"LLM 요약 캐시 적중 - 제목: {title}")
+                self._record_summary_source(cached, cached=True)
+                return cached
+        # 합쳐진 호출은 처음 시작한 요청의 우선순위를 따름
+        token = current_priority.set(priority)
         try:
-            prompt = self._build_summary_prompt(title, content, category)
-            response = await self._call_openai_api(prompt)
-            result = self._parse_response(response)
-            logger.info(f"LLM 요약 생성 성공 - 제목: {title}")
-            return result
-        except Exception as e:
-            logger.error(f"LLM 요약 생성 실패: {str(e)}")
+            result = await self._summary_flights.do(
+                (cache_key, fallback),
+                lambda: self._generate_uncached(cache_key, providers, title, content, category, fallback),
+                owner=owner
+            )
+        finally:
+            current_priority.reset(token)
+        self._record_summary_source(result)
+        return copy.deepcopy(result)
+
+    async def _generate_uncached(
+        self, cache_key: str, providers: List[LLMProvider],
+        title: str, content: str, category: str, fallback: bool
+    ) -> Dict:
+        try:
+            result, provider = await self._summarize_first(providers, title, content, category)
+        except Exception:
+            if not fallback:
+                raise
             return self._create_fallback_summary(title, content)
+        # 장애 대비 공급자 결과와 대체 요약은 캐시하지 않음 (다음 호출에서 기본 공급자로 다시 시도)
+        if provider is providers[0]:
+            await summary_cache.set(cache_key, result)
+        return result
+
+    async def _summarize_first(
+        self, providers: List[LLMProvider], title: str, content: str, category: str
+    ) -> Tuple[Dict, LLMProvider]:
+        """공급자를 순서대로 시도해 처음 성공한 요약과 공급자 반환 (모두 실패하면 마지막 예외)"""
+        error: Optional[Exception] = None
+        for provider in providers:
+            try:
+                result = await self._summarize_with(provider, title, content, category)
+                logger.info(f"LLM 요약 생성 성공 - 제목: {title}, 모델: {result['model_version']}")
+                return result, provider
+            except Exception as e:
+                logger.error(f"LLM 요약 생성 실패 ({provider.version}): {str(e)}")
+                error = e
+        raise error or ValueError("요약에 사용할 LLM 공급자가 없습니다.")
+
+    async def _summarize_with(
+        self, provider: LLMProvider, title: str, content: str, category: str
+    ) -> Dict:
+        if provider.supports_chat:
+            prompt = await self._build_final_prompt(provider, title, content, category)
+            result = self._parse_response(await self._complete(provider, prompt))
+        else:
+            result = await provider.summarize(title, content)
+        result["model_version"] = provider.version
+        return result
 
     async def ask_llm(self, prompt: str) -> str:
         """
-        자유로운 자연어 질문에 대해 LLM(OpenAI)로부터 답변을 받습니다.
+        자유로운 자연어 질문에 대해 LLM으로부터 답변을 받습니다.
+        공백만 다른 같은 질문이 동시에 들어오면 답변 하나를 함께 받습니다.
+        """
+        return await self._ask_flights.do(" ".join(prompt.split()), lambda: self._ask_uncached(prompt))
+
+    async def _ask_uncached(self, prompt: str) -> str:
+        messages = self._ask_messages(prompt)
+        for provider in llm_router.ask_providers():
+            try:
+                await self._acquire(provider, messages, 400)
+                answer = await provider.chat(messages, max_tokens=400, temperature=0.7)
+                logger.info(f"LLM 자유질문 응답 성공 ({provider.version}): {answer[:40]}...")
+                return answer
+            except Exception as e:
+                logger.error(f"LLM 자유질문 응답 실패 ({provider.version}): {str(e)}")
+        return self.ASK_FAILURE_MESSAGE
+
+    async def stream_answer(self, prompt: str) -> AsyncIterator[Dict]:
+        """
+        자유 질문 답변 스트리밍
+
+        {"event": "token", "data": {"text": ...}} 를 생성되는 대로 보내고
+        마지막에 {"event": "done", "data": {"answer": 전체 답변}} 을 보냅니다.
+        실패시 error 이벤트로 안내 문구를 보냅니다.
+        첫 조각을 받기 전에 실패하면 장애 대비 공급자로 다시 시도합니다.
+        """
+        parts = []
+        messages = self._ask_messages(prompt)
+        for provider in llm_router.ask_providers():
+            try:
+                await self._acquire(provider, messages, 400)
+                async for delta in provider.stream_chat(messages, max_tokens=400, temperature=0.7):
+                    parts.append(delta)
+                    yield {"event": "token", "data": {"text": delta}}
+            except Exception as e:
+                logger.error(f"LLM 자유질문 스트리밍 실패 ({provider.version}): {str(e)}")
+                if parts:
+                    break  # 이미 보낸 조각은 다른 공급자로 이어갈 수 없음
+                continue
+            answer = "".join(parts).strip()
+            logger.info(f"LLM 자유질문 스트리밍 완료: {answer[:40]}...")
+            yield {"event": "done", "data": {"answer": answer}}
+            return
+        yield {"event": "error", "data": {"message": self.ASK_FAILURE_MESSAGE}}
+
+    async def stream_summary(self, title: str, content: str, category: str) -> AsyncIterator[Dict]:
+        """
+        요약 스트리밍 (미리보기용)
+
+        LLM 응답 JSON을 점진적으로 파싱해서 값이 완성되는 즉시 이벤트로 보냅니다.
+        - summary / highlight / keyword / confidence_score
+        - 마지막 done 이벤트에 generate_summary와 같은 형식의 전체 결과
+          (중간에 실패하면 done에는 대체 요약이 담기므로 done을 최종 결과로 사용)
+        캐시 적중시 LLM 호출 없이 같은 순서로 즉시 보냅니다.
         """
+        providers = llm_router.summary_providers(content)
+        provider = providers[0]
+        cache_key = summary_cache.make_key(
+            title, content, category, self.PROMPT_VERSION, provider.version
+        )
+        cached = await summary_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"LLM 요약 캐시 적중 (스트리밍) - 제목: {title}")
+            self._record_summary_source(cached, cached=True)
+            for event in self._summary_events(cached):
+                yield event
+            yield {"event": "done", "data": cached}
+            return
+
+        if not provider.supports_chat:
+            # 스트리밍할 응답이 없는 공급자는 완성된 요약을 같은 순서로 보냄
+            result = await self._generate_uncached(cache_key, providers, title, content, category, True)
+            for event in self._summary_events(result):
+                yield event
+            self._record_summary_source(result)
+            yield {"event": "done", "data": result}
+            return
+
+        parser = JsonStreamParser()
+        parts = []
         try:
-            system_prompt = "Assistant로서 사용자 질문에 자연어로 답변하세요. 반드시 한국어로 답변하세요."
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ]
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",  # gpt-4-1106-preview는 권한 있으면 사용
-                messages=messages,
-                max_tokens=400,
-                temperature=0.7
+            messages = self._summary_messages(
+                await self._build_final_prompt(provider, title, content, category)
             )
-            answer = response.choices[0].message.content.strip()
-            logger.info(f"LLM 자유질문 응답 성공: {answer[:40]}...")
-            return answer
+            await self._acquire(provider, messages, 1000)
+            async for delta in provider.stream_chat(messages, max_tokens=1000, temperature=0.3):
+                parts.append(delta)
+                for path, value in parser.feed(delta):
+                    event = self._summary_stream_event(path, value)
+                    if event is not None:
+                        yield event
+            result = self._parse_response("".join(parts))
+            result["model_version"] = provider.version
+            await summary_cache.set(cache_key, result)
+            logger.info(f"LLM 요약 스트리밍 완료 - 제목: {title}")
         except Exception as e:
-            logger.error(f"LLM 자유질문 응답 실패: {str(e)}")
-            return "죄송합니다. 답변을 생성하는 데 실패했습니다."
+            logger.error(f"LLM 요약 스트리밍 실패 ({provider.version}): {str(e)}")
+            try:
+                # 장애 대비 공급자 결과는 done 이벤트로만 전달
+                result, _ = await self._summarize_first(providers[1:], title, content, category)
+            except Exception:
+                result = self._create_fallback_summary(title, content)
+        self._record_summary_source(result)
+        yield {"event": "done", "data": result}
+
+    def _summary_stream_event(self, path, value):
+        """점진 파서 결과 (경로, 값)를 요약 스트림 이벤트로 변환"""
+        if path == ("summary",):
+            return {"event": "summary", "data": {"text": value}}
+        if len(path) == 2 and path[0] == "highlights":
+            return {"event": "highlight", "data": {"index": path[1], "text": value}}
+        if len(path) == 2 and path[0] == "keywords":
+            return {"event": "keyword", "data": {"index": path[1], "text": value}}
+        if path == ("confidence_score",):
+            return {"event": "confidence_score", "data": {"value": value}}
+        return None
+
+    def _summary_events(self, summary_data: Dict):
+        """완성된 요약을 스트림 이벤트 순서로 분해 (캐시 적중시)"""
+        yield self._summary_stream_event(("summary",), summary_data["summary"])
+        for index, highlight in enumerate(summary_data["highlights"]):
+            yield self._summary_stream_event(("highlights", index), highlight)
+        for index, keyword in enumerate(summary_data["keywords"]):
+            yield self._summary_stream_event(("keywords", index), keyword)
+        yield self._summary_stream_event(("confidence_score",), summary_data["confidence_score"])
+
+    def _ask_messages(self, prompt: str):
+        return [
+            {"role": "system", "content": self.ASK_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _summary_messages(self, prompt: str):
+        return [
+            {
+                "role": "system",
+                "content": "당신은 한국어 문서 요약 전문가입니다. 항상 유효한 JSON 형식으로 응답하세요."
+            },
+            {"role": "user", "content": prompt}
+        ]
+        
+    async def _build_final_prompt(
+        self, provider: LLMProvider, title: str, content: str, category: str
+    ) -> str:
+        """
+        최종 요약 프롬프트
+        본문이 SUMMARY_CHUNK_THRESHOLD_TOKENS 이하면 본문 전체를 넣고,
+        길면 조각별 부분 요약(map)을 먼저 만든 뒤 이를 합치는(reduce) 프롬프트를 만듭니다.
+        """
+        if estimate_tokens(content) <= settings.SUMMARY_CHUNK_THRESHOLD_TOKENS:
+            return self._build_summary_prompt(title, content, category)
+        partials = await self._summarize_chunks(provider, title, content, category)
+        return self._build_reduce_prompt(title, category, partials)
+
+    async def _summarize_chunks(
+        self, provider: LLMProvider, title: str, content: str, category: str
+    ) -> List[Dict]:
+        """
+        긴 본문 map 단계 - 문단/문장 경계로 나눈 조각을 동시에 요약
         
+        조각 요약은 (조각 내용, 카테고리)로 캐시되므로 한 문단만 고치면
+        그 문단이 속한 조각만 다시 요약합니다.
+        부분 요약을 합친 길이가 reduce 입력 예산을 넘으면 여러 단계로 나눠 합칩니다.
+        """
+        chunks = split_into_chunks(content, settings.SUMMARY_CHUNK_TOKENS)
+        semaphore = asyncio.Semaphore(settings.SUMMARY_CHUNK_CONCURRENCY)
+
+        async def summarize(chunk: str) -> Dict:
+            async with semaphore:
+                return await self._cached_partial(
+                    provider, "chunk", "", chunk, category, self._build_chunk_prompt(chunk, category)
+                )
+
+        partials = list(await asyncio.gather(*(summarize(chunk) for chunk in chunks)))
+        logger.info(f"긴 본문 분할 요약 - 제목: {title}, 조각 {len(chunks)}개")
+
+        while len(partials) > 1:
+            groups = self._group_partials(partials)
+            # 한 번에 합칠 수 있거나 더 줄일 수 없으면 최종 reduce로
+            if len(groups) == 1 or len(groups) == len(partials):
+                break
+
+            async def reduce(group: List[Dict]) -> Dict:
+                if len(group) == 1:
+                    return group[0]
+                async with semaphore:
+                    return await self._cached_partial(
+                        provider, "reduce", title, self._format_partials(group), category,
+                        self._build_reduce_prompt(title, category, group)
+                    )
+
+            partials = list(await asyncio.gather(*(reduce(group) for group in groups)))
+        return partials
+
+    async def _cached_partial(
+        self, provider: LLMProvider, kind: str, title: str, text: str, category: str, prompt: str
+    ) -> Dict:
+        """부분 요약 LLM 호출 (요약 캐시 사용)"""
+        cache_key = summary_cache.make_key(
+            title, text, category, f"{self.PROMPT_VERSION}-{kind}", provider.version
+        )
+        cached = await summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        response = await self._complete(provider, prompt, max_tokens=500)
+        result = self._parse_response(response)
+        await summary_cache.set(cache_key, result)
+        return result
+
+    def _group_partials(self, partials: List[Dict]) -> List[List[Dict]]:
+        """부분 요약들을 reduce 입력 예산 단위로 묶음"""
+        groups: List[List[Dict]] = []
+        current: List[Dict] = []
+        current_tokens = 0
+        for partial in partials:
+            tokens = estimate_tokens(self._format_partials([partial]))
+            if current and current_tokens + tokens > settings.SUMMARY_REDUCE_INPUT_TOKENS:
+                groups.append(current)
+                current = []
+                current_tokens = 0
+            current.append(partial)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def _format_partials(self, partials: List[Dict]) -> str:
+        blocks = []
+        for index, partial in enumerate(partials, start=1):
+            highlights = "\n".join(f"- {highlight}" for highlight in partial["highlights"])
+            blocks.append(
+                f"[부분 {index}]\n요약: {partial['summary']}\n"
+                f"하이라이트:\n{highlights}\n키워드: {', '.join(partial['keywords'])}"
+            )
+        return "\n\n".join(blocks)
+
+    def _build_chunk_prompt(self, chunk: str, category: str) -> str:
+        """map 단계 프롬프트 (캐시 키와 맞추기 위해 조각 내용과 카테고리만 사용)"""
+        context = self.CATEGORY_CONTEXT.get(category, self.CATEGORY_CONTEXT["기타"])
+        prompt = f"""
+다음은 긴 문서의 일부입니다. 이 부분의 내용만 분석하여 다음 형식으로 응답해주세요.
+
+**컨텍스트**: {context}
+
+**분석할 텍스트**:
+{chunk}
+
+**요청사항**:
+1. 2-3줄의 요약
+2. 1-3개의 하이라이트 (각각 1줄)
+3. 3-5개의 키워드
+4. 신뢰도 점수 (1-100)
+
+**응답 형식 (반드시 유효한 JSON으로 응답)**:
+{{
+    "summary": "이 부분의 요약",
+    "highlights": ["핵심 포인트"],
+    "keywords": ["키워드1", "키워드2", "키워드3"],
+    "confidence_score": 90
+}}
+"""
+        return prompt.strip()
+
+    def _build_reduce_prompt(self, title: str, category: str, partials: List[Dict]) -> str:
+        """reduce 단계 프롬프트 - 부분 요약들을 최종 요약 형식으로 합침"""
+        context = self.CATEGORY_CONTEXT.get(category, self.CATEGORY_CONTEXT["기타"])
+        prompt = f"""
+당신은 전문적인 문서 요약 AI입니다. 아래는 긴 문서를 순서대로 나눠 요약한 부분 요약들입니다.
+이를 종합하여 문서 전체에 대한 요약을 다음 형식으로 응답해주세요.
+
+**컨텍스트**: {context}
+
+**문서 제목**: {title}
+
+**부분 요약**:
+{self._format_partials(partials)}
+
+**요청사항**:
+1. 문서 전체 흐름을 담은 3-5줄의 요약 생성
+2. 3-5개의 중요한 하이라이트 (부분 요약들에서 가장 중요한 것 위주)
+3. 5-8개의 핵심 키워드
+4. 신뢰도 점수 (1-100) 제공
+
+**응답 형식 (반드시 유효한 JSON으로 응답)**:
+{{
+    "summary": "문서 전체를 3-5줄로 요약한 텍스트",
+    "highlights": [
+        "첫 번째 핵심 포인트",
+        "두 번째 핵심 포인트",
+        "세 번째 핵심 포인트"
+    ],
+    "keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"],
+    "confidence_score": 95
+}}
+
+중요: 응답은 반드시 유효한 JSON 형식이어야 하며, 한국어로 작성해주세요.
+"""
+        return prompt.strip()
+
     def _build_summary_prompt(self, title: str, content: str, category: str) -> str:
-        category_context = {
-            "독서": "이 텍스트는 독서 관련 내용입니다. 책의 핵심 내용과 인사이트를 중심으로 요약해주세요.",
-            "학습": "이 텍스트는 학습 자료입니다. 핵심 개념과 중요한 학습 포인트를 중심으로 요약해주세요.",
-            "일상": "이 텍스트는 일상 기록입니다. 주요 사건과 의미 있는 내용을 중심으로 요약해주세요.",
-            "기타": "이 텍스트의 주요 내용과 핵심 포인트를 중심으로 요약해주세요."
-        }
-        context = category_context.get(category, category_context["기타"])
+        context = self.CATEGORY_CONTEXT.get(category, self.CATEGORY_CONTEXT["기타"])
         prompt = f"""
 당신은 전문적인 문서 요약 AI입니다. 주어진 텍스트를 분석하여 다음 형식으로 응답해주세요.
 
@@ -85,24 +449,25 @@ class LLMService:
 """
         return prompt.strip()
     
-    async def _call_openai_api(self, prompt: str) -> str:
+    async def _acquire(self, provider: LLMProvider, messages: List[Dict[str, str]], max_tokens: int):
+        """
+        스케줄러에서 호출 한도 확보 (추정 토큰 = 입력 추정치 + 최대 출력)
+        대기 기한을 넘기면 LLMDeadlineExceeded - 각 호출부의 실패 처리(대체 요약 등)로 이어짐
+        외부 호출 한도가 없는 공급자(local 등)는 바로 통과합니다.
+        """
+        if not provider.rate_limited:
+            return
+        await llm_scheduler.acquire(
+            sum(estimate_tokens(message["content"]) for message in messages) + max_tokens
+        )
+
+    async def _complete(self, provider: LLMProvider, prompt: str, max_tokens: int = 1000) -> str:
         try:
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 한국어 문서 요약 전문가입니다. 항상 유효한 JSON 형식으로 응답하세요."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1000,
-                temperature=0.3
-            )
-            return response.choices[0].message.content.strip()
+            messages = self._summary_messages(prompt)
+            await self._acquire(provider, messages, max_tokens)
+            return await provider.chat(messages, max_tokens=max_tokens, temperature=0.3)
         except Exception as e:
-            logger.error(f"OpenAI API 호출 실패: {str(e)}")
+            logger.error(f"LLM 호출 실패 ({provider.version}): {str(e)}")
             raise
 
     def _parse_response(self, response: str) -> Dict:
@@ -132,11 +497,40 @@ class LLMService:
             return result
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {str(e)}, 응답: {response}")
+            if metrics.enabled:
+                llm_parse_failures.inc()
             raise ValueError("LLM 응답의 JSON 형식이 올바르지 않습니다.")
         except Exception as e:
             logger.error(f"응답 파싱 실패: {str(e)}")
+            if metrics.enabled:
+                llm_parse_failures.inc()
             raise
 
+    def provider_routing(self) -> Dict:
+        """공급자 선택 설정 (기본/짧은 입력/장애 대비, 자유 질문 순서)"""
+        return llm_router.describe()
+
+    def scheduler_stats(self) -> Dict:
+        """호출 한도 스케줄러 통계 (우선순위별 통과/거절 수, 평균 대기 시간)"""
+        return llm_scheduler.stats()
+
+    def coalescing_stats(self) -> Dict:
+        """요청 합치기 통계 (coalesced = 절약한 LLM 호출 수)"""
+        return {
+            "summary": self._summary_flights.stats(),
+            "ask": self._ask_flights.stats()
+        }
+
+    def _record_summary_source(self, summary_data: Dict, cached: bool = False):
+        """요약 결과 출처 지표 (cache/llm/fallback)"""
+        if metrics.enabled:
+            source = "cache" if cached else ("fallback" if self.is_fallback(summary_data) else "llm")
+            llm_summaries.inc(source)
+
+    def is_fallback(self, summary_data: Dict) -> bool:
+        """대체 요약 여부"""
+        return summary_data.get("model_version") == self.FALLBACK_MODEL
+
     def _create_fallback_summary(self, title: str, content: str) -> Dict:
         summary = content[:200] + "..." if len(content) > 200 else content
         paragraphs = content.split('\n\n')
@@ -155,12 +549,19 @@ class LLMService:
             "summary": f"'{title}'에 대한 내용입니다. " + summary,
             "highlights": highlights,
             "keywords": keywords,
-            "confidence_score": 30.0
+            "confidence_score": 30.0,
+            "model_version": self.FALLBACK_MODEL
         }
 
-    async def regenerate_summary(self, post_id: int, title: str, content: str, category: str) -> Dict:
+    async def regenerate_summary(
+        self, post_id: int, title: str, content: str, category: str,
+        use_cache: bool = True, fallback: bool = True,
+        priority: LLMPriority = LLMPriority.BACKGROUND
+    ) -> Dict:
         logger.info(f"게시물 {post_id} 요약 재생성 시작")
-        result = await self.generate_summary(title, content, category)
+        result = await self.generate_summary(
+            title, content, category, use_cache=use_cache, fallback=fallback, priority=priority
+        )
         result["regenerated"] = True
         return result
 
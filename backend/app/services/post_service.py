@@ -1,22 +1,62 @@
 # backend/app/services/post_service.py
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc
-from typing import List, Optional, Tuple
-from app.models.post import Post
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer, joinedload, with_expression
+from sqlalchemy import and_, or_, desc, func, select, Select
+from sqlalchemy.exc import IntegrityError
+from collections import Counter
+from datetime import datetime, timezone
+from enum import Enum
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, insert_rows_returning_ids
+from app.models.post import Post, PostStatus, SummaryStatus
 from app.models.category import Category
 from app.models.summary import Summary
+from app.models.related import RelatedPost
 from app.schemas import PostCreate, PostUpdate, CategoryCreate, CategoryUpdate
-from app.services.llm_service import llm_service
+from app.services.llm_service import LLMService, llm_service
+from app.services.summary_worker import summary_worker
+from app.services.count_service import post_count_service, as_post_status
+from app.services.category_registry import category_registry
+from app.services.keyword_service import keyword_index
+from app.services.stats_service import stats_service
+from app.services.response_cache import (
+    response_cache, POSTS_TAG, CATEGORIES_TAG, post_tag, category_tag
+)
+from app.services.search_service import (
+    search_service, is_indexable_query, ilike_condition, build_summary_search_text
+)
+from app.services.semantic_service import semantic_index
+from app.services.related_service import related_service
+from app.utils.helpers import encode_cursor, decode_cursor, make_excerpt
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 내보내기 레코드에 포함할 컬럼
+EXPORT_POST_COLUMNS = (
+    Post.id, Post.title, Post.content, Post.category_id, Post.image_url, Post.status,
+    Post.summary_status, Post.user_id, Post.created_at, Post.updated_at
+)
+EXPORT_SUMMARY_COLUMNS = (
+    Summary.summary, Summary.highlights, Summary.keywords, Summary.confidence_score,
+    Summary.model_version, Summary.updated_at
+)
+
+def _export_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
 class PostService:
     
     @staticmethod
-    async def create_post(db: Session, post_data: PostCreate) -> Post:
-        """새 게시물 생성 (LLM 요약 포함)"""
+    async def create_post(db: AsyncSession, post_data: PostCreate) -> Post:
+        """새 게시물 생성 (LLM 요약은 백그라운드 작업으로 예약)"""
         try:
             # 1. 게시물 생성
             db_post = Post(
@@ -28,220 +68,657 @@ class PostService:
             )
             
             db.add(db_post)
-            db.flush()  # ID 생성을 위해 flush
+            await db.flush()  # ID 생성을 위해 flush
+            await db.run_sync(post_count_service.adjust, db_post.category_id, db_post.status, 1)
+            await db.run_sync(stats_service.add_new_posts, [db_post.id])
             
-            # 2. 카테고리 정보 조회
-            category = db.query(Category).filter(Category.id == post_data.category_id).first()
-            category_name = category.name if category else "기타"
-            
-            # 3. LLM 요약 생성 (auto_summarize가 True인 경우)
-            summary_data = None
+            # 2. LLM 요약 작업 예약 (auto_summarize가 True인 경우)
             if post_data.auto_summarize:
-                try:
-                    logger.info(f"게시물 '{post_data.title}' LLM 요약 생성 시작")
-                    summary_data = await llm_service.generate_summary(
-                        title=post_data.title,
-                        content=post_data.content,
-                        category=category_name
-                    )
-                    logger.info(f"LLM 요약 생성 완료 - 신뢰도: {summary_data.get('confidence_score', 0)}")
-                    
-                except Exception as e:
-                    logger.error(f"LLM 요약 생성 실패: {str(e)}")
-                    # 요약 생성 실패해도 게시물은 저장
-                    summary_data = None
+                await db.run_sync(summary_worker.enqueue, db_post)
             
-            # 4. Summary 레코드 생성
-            if summary_data:
-                db_summary = Summary(
-                    post_id=db_post.id,
-                    summary=summary_data["summary"],
-                    highlights=summary_data["highlights"],
-                    keywords=summary_data["keywords"],
-                    model_version=summary_data.get("model_version", "gpt-3.5-turbo"),
-                    confidence_score=summary_data["confidence_score"]
-                )
-                db.add(db_summary)
-            
-            db.commit()
-            db.refresh(db_post)
+            # 응답은 라우터가 요약과 함께 다시 조회하므로 refresh하지 않음
+            await db.commit()
+            await response_cache.invalidate(POSTS_TAG)
+            summary_worker.notify()
+            search_service.index_post(db_post.id, db_post.title, db_post.content)
+            semantic_index.index_post(db_post.id, db_post.title, db_post.content)
+            related_service.mark_dirty([db_post.id])
             
             logger.info(f"게시물 생성 완료 - ID: {db_post.id}, 제목: {post_data.title}")
             return db_post
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"게시물 생성 실패: {str(e)}")
             raise
     
     @staticmethod
-    async def update_post(db: Session, post_id: int, post_data: PostUpdate) -> Optional[Post]:
-        """게시물 수정 (필요시 요약 재생성)"""
+    async def bulk_create_posts(
+        db: AsyncSession, posts_data: List[PostCreate], refresh_categories: bool = False
+    ) -> List[Dict]:
+        """
+        게시물 일괄 생성
+        
+        1. 카테고리 ID 검증 (카테고리 레지스트리, DB 조회 없음)
+           - 다른 프로세스에서 삭제된 카테고리로 INSERT가 외래 키 위반이면
+             목록을 다시 로드해 한 번 더 시도 (해당 항목은 실패로 표시)
+        2. 게시물 INSERT (문장 1회)
+        3. 요약 작업 일괄 등록 - 요약은 동시 실행 수가 제한된 워커 풀에서 처리
+        
+        항목별 결과(index, success, post_id, summary_status, error)를 입력 순서대로 반환
+        """
         try:
-            # 1. 기존 게시물 조회
-            db_post = db.query(Post).filter(Post.id == post_id).first()
+            # 1. 카테고리 일괄 검증 (메모리)
+            valid_category_ids = {
+                category_id for category_id in {post_data.category_id for post_data in posts_data}
+                if await category_registry.ensure(category_id, refresh=refresh_categories)
+            }
+            
+            results = []
+            rows = []
+            row_indexes = []
+            for index, post_data in enumerate(posts_data):
+                if post_data.category_id not in valid_category_ids:
+                    results.append({
+                        "index": index,
+                        "success": False,
+                        "error": "존재하지 않는 카테고리입니다."
+                    })
+                    continue
+                
+                rows.append({
+                    "title": post_data.title,
+                    "content": post_data.content,
+                    "category_id": post_data.category_id,
+                    "image_url": post_data.image_url,
+                    "status": PostStatus(post_data.status.value),
+                    "summary_status": SummaryStatus.PENDING if post_data.auto_summarize else None
+                })
+                row_indexes.append(index)
+                results.append(None)
+            
+            # 2. 게시물 일괄 INSERT
+            post_ids = await db.run_sync(insert_rows_returning_ids, Post.__table__, rows)
+            await db.run_sync(post_count_service.apply, Counter(
+                (row["category_id"], row["status"]) for row in rows
+            ))
+            await db.run_sync(stats_service.add_new_posts, post_ids)
+            
+            # 3. 요약 작업 일괄 등록
+            await db.run_sync(summary_worker.enqueue_many, [
+                post_id for post_id, row in zip(post_ids, rows)
+                if row["summary_status"] is not None
+            ])
+            
+            await db.commit()
+            await response_cache.invalidate(POSTS_TAG)
+            summary_worker.notify()
+            
+            for index, post_id, row in zip(row_indexes, post_ids, rows):
+                search_service.index_post(post_id, row["title"], row["content"])
+                semantic_index.index_post(post_id, row["title"], row["content"])
+                results[index] = {
+                    "index": index,
+                    "success": True,
+                    "post_id": post_id,
+                    "summary_status": row["summary_status"]
+                }
+            related_service.mark_dirty(post_ids)
+            
+            logger.info(f"게시물 일괄 생성 완료 - 요청 {len(posts_data)}건, 생성 {len(post_ids)}건")
+            return results
+            
+        except IntegrityError as e:
+            await db.rollback()
+            if refresh_categories:
+                logger.error(f"게시물 일괄 생성 실패: {str(e)}")
+                raise
+            logger.warning(f"게시물 일괄 생성 외래 키 위반 - 카테고리 목록을 다시 로드해 재시도: {str(e)}")
+            return await PostService.bulk_create_posts(db, posts_data, refresh_categories=True)
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"게시물 일괄 생성 실패: {str(e)}")
+            raise
+    
+    @staticmethod
+    async def update_post(db: AsyncSession, post_id: int, post_data: PostUpdate) -> Optional[Post]:
+        """게시물 수정 (필요시 요약 재생성 작업 예약)"""
+        try:
+            # 1. 기존 게시물 조회 (재색인에 쓸 요약 포함, 카운터/통계 증감 기준이므로 행 잠금)
+            db_post = (await db.execute(
+                select(Post).options(joinedload(Post.summary)).where(Post.id == post_id).with_for_update(of=Post)
+            )).scalar_one_or_none()
             if not db_post:
                 return None
             
             # 2. 게시물 정보 업데이트
+            old_count_key = (db_post.category_id, as_post_status(db_post.status))
+            old_stats = stats_service.contribution(
+                db_post.created_at, db_post.category_id, db_post.status, db_post.summary
+            )
             update_data = post_data.model_dump(exclude_unset=True, exclude={"regenerate_summary"})
             for field, value in update_data.items():
                 setattr(db_post, field, value)
             
+            new_count_key = (db_post.category_id, as_post_status(db_post.status))
+            if new_count_key != old_count_key:
+                await db.run_sync(post_count_service.apply, {old_count_key: -1, new_count_key: 1})
+                await db.run_sync(stats_service.apply_posts, [old_stats], [stats_service.contribution(
+                    db_post.created_at, db_post.category_id, db_post.status, db_post.summary
+                )])
+            if new_count_key[0] != old_count_key[0] and PostService._has_keywords(db_post.summary):
+                await db.run_sync(stats_service.apply_keywords, [post_id], -1)
+                await db.run_sync(keyword_index.set_category, [post_id], db_post.category_id)
+                await db.run_sync(stats_service.apply_keywords, [post_id], 1)
+            
             # 3. 요약 재생성 (regenerate_summary=True 또는 content 변경시)
             content_changed = hasattr(post_data, 'content') and post_data.content is not None
             should_regenerate = post_data.regenerate_summary or content_changed
             
             if should_regenerate:
-                # 카테고리 정보 조회
-                category = db.query(Category).filter(Category.id == db_post.category_id).first()
-                category_name = category.name if category else "기타"
-                
-                try:
-                    logger.info(f"게시물 {post_id} 요약 재생성 시작")
-                    summary_data = await llm_service.regenerate_summary(
-                        post_id=post_id,
-                        title=db_post.title,
-                        content=db_post.content,
-                        category=category_name
-                    )
-                    
-                    # 기존 요약 업데이트 또는 생성
-                    existing_summary = db.query(Summary).filter(Summary.post_id == post_id).first()
-                    if existing_summary:
-                        existing_summary.summary = summary_data["summary"]
-                        existing_summary.highlights = summary_data["highlights"]
-                        existing_summary.keywords = summary_data["keywords"]
-                        existing_summary.confidence_score = summary_data["confidence_score"]
-                        existing_summary.model_version = summary_data.get("model_version", "gpt-3.5-turbo")
-                    else:
-                        new_summary = Summary(
-                            post_id=post_id,
-                            summary=summary_data["summary"],
-                            highlights=summary_data["highlights"],
-                            keywords=summary_data["keywords"],
-                            model_version=summary_data.get("model_version", "gpt-3.5-turbo"),
-                            confidence_score=summary_data["confidence_score"]
-                        )
-                        db.add(new_summary)
-                    
-                    logger.info(f"게시물 {post_id} 요약 재생성 완료")
-                    
-                except Exception as e:
-                    logger.error(f"요약 재생성 실패: {str(e)}")
-                    # 요약 재생성 실패해도 게시물 수정은 계속 진행
+                # 명시적 재생성 요청이면 캐시를 건너뜀 (내용만 바뀐 경우는 캐시 사용)
+                await db.run_sync(
+                    summary_worker.enqueue, db_post, force_refresh=post_data.regenerate_summary
+                )
             
-            db.commit()
-            db.refresh(db_post)
+            summary_text = db_post.summary.search_text if db_post.summary else None
+            await db.commit()
+            await db.refresh(db_post)
+            await response_cache.invalidate(POSTS_TAG, post_tag(post_id))
+            if should_regenerate:
+                summary_worker.notify()
+            if "title" in update_data or "content" in update_data:
+                if search_service.needs_documents:
+                    search_service.index_post(db_post.id, db_post.title, db_post.content, summary_text)
+                semantic_index.index_post(db_post.id, db_post.title, db_post.content, summary_text)
+                related_service.mark_dirty([db_post.id])
             
             logger.info(f"게시물 수정 완료 - ID: {post_id}")
             return db_post
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"게시물 수정 실패: {str(e)}")
             raise
     
     @staticmethod
-    def get_post_with_summary(db: Session, post_id: int) -> Optional[Post]:
-        """게시물 상세 조회 (요약 포함)"""
-        return db.query(Post).options(
-            joinedload(Post.category),
-            joinedload(Post.summary)
-        ).filter(Post.id == post_id).first()
+    def save_summary(db: Session, post: Post, summary_data: Dict) -> Summary:
+        """
+        요약 저장 (기존 요약 갱신 또는 생성) 및 게시물 요약 상태 반영
+        커밋과 커밋 이후의 캐시 무효화/검색 색인 반영(summary_saved)은 호출하는 쪽에서 수행
+        (동기 세션용 - 백그라운드 워커에서 호출, 비동기 세션에서는 run_sync로 호출)
+        """
+        # 카테고리/상태 수정과 겹치지 않도록 게시물 행을 잠그고 현재 값으로 통계 증감
+        db.refresh(post, with_for_update=True)
+        summary = db.query(Summary).filter(Summary.post_id == post.id).first()
+        stats_before = stats_service.contribution(post.created_at, post.category_id, post.status, summary)
+        if PostService._has_keywords(summary):
+            stats_service.apply_keywords(db, [post.id], -1)
+        if summary is None:
+            summary = Summary(post_id=post.id)
+            db.add(summary)
+        
+        summary.summary = summary_data["summary"]
+        summary.highlights = summary_data["highlights"]
+        summary.keywords = summary_data["keywords"]
+        summary.confidence_score = summary_data["confidence_score"]
+        summary.model_version = summary_data.get("model_version")
+        summary.search_text = build_summary_search_text(
+            summary_data["summary"], summary_data["highlights"], summary_data["keywords"]
+        )
+        
+        fallback = llm_service.is_fallback(summary_data)
+        post.summary_status = SummaryStatus.FAILED if fallback else SummaryStatus.READY
+        # 대체 요약의 키워드(제목 단어)는 색인하지 않음
+        keyword_index.index_post(db, post.id, post.category_id, [] if fallback else summary.keywords)
+        if not fallback:
+            stats_service.apply_keywords(db, [post.id], 1)
+        stats_service.apply_posts(db, [stats_before], [
+            stats_service.contribution(post.created_at, post.category_id, post.status, summary)
+        ])
+        return summary
+    
+    @staticmethod
+    def _has_keywords(summary: Optional[Summary]) -> bool:
+        """키워드 색인(post_keywords)에 행이 있을 수 있는 요약인지 (대체 요약의 키워드는 색인하지 않음)"""
+        return summary is not None and summary.model_version != LLMService.FALLBACK_MODEL
+    
+    @staticmethod
+    def summary_saved(post_id: int, title: str, content: str, summary_text: Optional[str]):
+        """
+        요약 저장 커밋 후 응답 캐시 무효화, 검색 색인 반영 및 관련 게시물 재계산 표시
+        (롤백된 요약이 색인에 남지 않도록 커밋 이후에만 호출, 요약 워커 스레드에서도 호출)
+        """
+        response_cache.invalidate_sync(POSTS_TAG, post_tag(post_id))
+        search_service.index_post(post_id, title, content, summary_text)
+        semantic_index.index_post(post_id, title, content, summary_text)
+        related_service.mark_dirty([post_id])
+    
+    @staticmethod
+    async def get_post(db: AsyncSession, post_id: int) -> Optional[Post]:
+        """게시물 조회 (관계 미포함)"""
+        return await db.get(Post, post_id)
+    
+    @staticmethod
+    async def get_post_with_summary(db: AsyncSession, post_id: int) -> Optional[Post]:
+        """게시물 상세 조회 (요약, 미리 계산한 관련 게시물 포함 - 한 번의 쿼리)"""
+        return (await db.execute(
+            select(Post).options(
+                joinedload(Post.category),
+                joinedload(Post.summary),
+                joinedload(Post.related_posts).joinedload(RelatedPost.related_post).load_only(
+                    Post.id, Post.title, Post.category_id
+                )
+            ).where(Post.id == post_id)
+        )).unique().scalar_one_or_none()
     
     @staticmethod
-    def get_posts_with_summaries(
-        db: Session, 
+    async def get_posts_with_summaries(
+        db: AsyncSession, 
         skip: int = 0, 
         limit: int = 20,
         category_id: Optional[int] = None,
         search: Optional[str] = None,
-        status: Optional[str] = None
-    ) -> Tuple[List[Post], int]:
-        """게시물 목록 조회 (요약 포함, 검색/필터링)"""
+        status: Optional[str] = None,
+        total_mode: str = "exact",
+        compact: bool = False,
+        keyword: Optional[str] = None
+    ) -> Tuple[List[Post], Optional[int], bool]:
+        """
+        게시물 목록 조회 (요약 포함, 검색/필터링) - (게시물, total, truncated) 반환
+        
+        total_mode: exact(정확한 수) / estimate(검색 결과 수는 캐시 허용) / none(계산 안 함)
+        compact: True이면 본문 전체 대신 앞부분만 읽음 (_list_options 참고)
+        keyword: 요약 키워드 (키워드 색인으로 필터링)
+        truncated: 검색 결과가 SEARCH_MAX_RESULTS개 후보에서 잘려 total이 하한값이고
+                   그 뒤 페이지는 비어 있음 (필터를 검색 쿼리에서 처리하지 못하는 검색 엔진만)
+        """
         
         # 기본 쿼리 구성
-        query = db.query(Post).options(
-            joinedload(Post.category),
-            joinedload(Post.summary)
-        )
+        query = select(Post).options(*PostService._list_options(compact))
         
         # 필터링 조건
-        conditions = []
+        conditions = PostService._filter_conditions(category_id, status, keyword)
         
-        if category_id:
-            conditions.append(Post.category_id == category_id)
+        if search and is_indexable_query(search):
+            return await PostService._search_posts(
+                db, search, skip, limit, conditions, compact, total_mode,
+                count_key=(search, keyword, category_id, status)
+            )
         
-        if status:
-            conditions.append(Post.status == status)
+        if search:
+            # 색인할 수 없는 1글자 검색어는 부분 일치로 처리
+            conditions.append(ilike_condition(search))
+        
+        if conditions:
+            query = query.where(and_(*conditions))
         
+        # 페이징 및 정렬 (커서 모드와 같은 순서)
+        posts = list((await db.execute(
+            query.order_by(desc(Post.created_at), desc(Post.id)).offset(skip).limit(limit)
+        )).scalars().all())
+        
+        # 마지막 페이지면 개수를 따로 셀 필요가 없음
+        if total_mode != "none" and len(posts) < limit and (posts or skip == 0):
+            return posts, skip + len(posts), False
+        
+        total = await PostService.count_posts(db, category_id, status, search, total_mode, keyword)
+        return posts, total, False
+    
+    @staticmethod
+    async def get_posts_by_cursor(
+        db: AsyncSession,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        category_id: Optional[int] = None,
+        status: Optional[str] = None,
+        compact: bool = False,
+        keyword: Optional[str] = None
+    ) -> Tuple[List[Post], Optional[str]]:
+        """
+        게시물 목록 커서 페이징 조회 (created_at DESC, id DESC)
+        
+        ix_posts_created_at_id 색인을 따라 커서 위치부터 limit개만 읽으므로
+        페이지 깊이와 무관하게 조회 비용이 일정하고, 중간에 게시물이 추가되어도
+        페이지가 밀리지 않습니다. 마지막 페이지면 next_cursor는 None입니다.
+        """
+        conditions = PostService._filter_conditions(category_id, status, keyword)
+        
+        if cursor:
+            created_at, post_id = decode_cursor(cursor)
+            conditions.append(or_(
+                Post.created_at < created_at,
+                and_(Post.created_at == created_at, Post.id < post_id)
+            ))
+        
+        posts = list((await db.execute(
+            select(Post).options(
+                *PostService._list_options(compact)
+            ).where(*conditions).order_by(
+                desc(Post.created_at), desc(Post.id)
+            ).limit(limit + 1)
+        )).scalars().all())
+        
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            next_cursor = encode_cursor(posts[-1].created_at, posts[-1].id)
+        
+        return posts, next_cursor
+    
+    @staticmethod
+    async def count_posts(
+        db: AsyncSession,
+        category_id: Optional[int] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        total_mode: str = "exact",
+        keyword: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        목록 total 계산 (게시물 조회 쿼리와 별개로 joinedload 없이 수행)
+        필터만 있으면 카운터 테이블을, 검색어나 키워드가 있으면 COUNT 쿼리를 사용합니다.
+        """
+        if total_mode == "none":
+            return None
+        if not search and not keyword:
+            return await db.run_sync(post_count_service.filter_count, category_id, status)
+        
+        conditions = PostService._filter_conditions(category_id, status, keyword)
         if search:
-            search_condition = or_(
-                Post.title.ilike(f"%{search}%"),
-                Post.content.ilike(f"%{search}%")
+            conditions.append(ilike_condition(search))
+        return await db.run_sync(
+            post_count_service.search_count,
+            (search, keyword, category_id, status),
+            conditions,
+            total_mode == "estimate"
+        )
+
+    @staticmethod
+    def build_export_query(
+        category_id: Optional[int] = None,
+        status: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+        after_id: Optional[int] = None
+    ) -> Select:
+        """
+        내보내기 쿼리 (id 오름차순, 잘못된 필터는 스트리밍 시작 전에 ValueError)
+
+        ORM 객체 대신 컬럼만 조회하므로 세션에 객체가 쌓이지 않습니다.
+        updated_since는 게시물이나 요약 중 하나라도 그 이후 수정된 게시물을 포함합니다.
+        """
+        conditions = PostService._filter_conditions(category_id, status)
+        if updated_since is not None:
+            if updated_since.tzinfo is not None:
+                updated_since = updated_since.astimezone(timezone.utc).replace(tzinfo=None)
+            conditions.append(or_(Post.updated_at >= updated_since, Summary.updated_at >= updated_since))
+        if after_id is not None:
+            conditions.append(Post.id > after_id)
+
+        return select(
+            *EXPORT_POST_COLUMNS,
+            Category.name.label("category"),
+            *(column.label(f"summary_{column.key}") for column in EXPORT_SUMMARY_COLUMNS)
+        ).outerjoin(
+            Category, Category.id == Post.category_id
+        ).outerjoin(
+            Summary, Summary.post_id == Post.id
+        ).where(*conditions).order_by(Post.id)
+
+    @staticmethod
+    async def export_posts(query: Select) -> AsyncIterator[Dict]:
+        """
+        게시물+요약을 한 건씩 반환 (서버 측 커서로 EXPORT_BATCH_SIZE행씩 가져옴)
+
+        응답 스트리밍이 끝날 때까지 커넥션을 쓰므로 요청 세션과 별도의 세션을 엽니다.
+        레코드 형식은 import_data.py가 그대로 다시 적재할 수 있는 형식입니다.
+        """
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(
+                query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
             )
-            conditions.append(search_condition)
+            async for row in result.mappings():
+                yield PostService.to_export_record(row)
+
+    @staticmethod
+    def to_export_record(row) -> Dict:
+        record = {column.key: _export_value(row[column.key]) for column in EXPORT_POST_COLUMNS}
+        record["category"] = row["category"]
+        record["summary"] = None
+        if row["summary_summary"] is not None:
+            record["summary"] = {
+                column.key: _export_value(row[f"summary_{column.key}"])
+                for column in EXPORT_SUMMARY_COLUMNS
+            }
+        return record
+
+    @staticmethod
+    def _list_options(compact: bool) -> List:
+        """
+        목록 조회 로딩 옵션
         
-        if conditions:
-            query = query.filter(and_(*conditions))
+        compact 보기는 content(TEXT)를 읽지 않고 발췌문에 필요한 앞부분만 SUBSTR로 가져오며,
+        요약 행도 요약문/키워드 컬럼만 읽습니다.
+        """
+        if not compact:
+            return [joinedload(Post.category), joinedload(Post.summary)]
+        return [
+            defer(Post.content),
+            with_expression(
+                Post.content_head,
+                func.substr(Post.content, 1, settings.POST_EXCERPT_LENGTH * 2)
+            ),
+            joinedload(Post.category),
+            joinedload(Post.summary).load_only(Summary.summary, Summary.keywords)
+        ]
+    
+    @staticmethod
+    def to_list_item(post: Post) -> Dict:
+        """compact 보기 목록 항목 (PostListItem 형태)"""
+        summary = post.summary
+        return {
+            "id": post.id,
+            "title": post.title,
+            "excerpt": make_excerpt(post.content_head, settings.POST_EXCERPT_LENGTH),
+            "category_id": post.category_id,
+            "category_name": post.category.name if post.category else None,
+            "image_url": post.image_url,
+            "status": post.status,
+            "summary_status": post.summary_status,
+            "summary": summary.summary if summary else None,
+            "keywords": (summary.keywords or [])[:settings.POST_LIST_KEYWORDS] if summary else [],
+            "created_at": post.created_at,
+            "updated_at": post.updated_at
+        }
+    
+    @staticmethod
+    def _filter_conditions(
+        category_id: Optional[int], status: Optional[str], keyword: Optional[str] = None
+    ) -> List:
+        conditions = []
+        if category_id:
+            conditions.append(Post.category_id == category_id)
+        if status:
+            conditions.append(Post.status == as_post_status(status))
+        if keyword:
+            conditions.append(keyword_index.post_condition(keyword))
+        return conditions
+    
+    @staticmethod
+    async def _search_posts(
+        db: AsyncSession,
+        search: str,
+        skip: int,
+        limit: int,
+        conditions: List,
+        compact: bool = False,
+        total_mode: str = "exact",
+        count_key: Optional[Tuple] = None
+    ) -> Tuple[List[Post], Optional[int], bool]:
+        """
+        검색 색인으로 관련도 순 게시물 조회 (게시물, total, truncated)
+        
+        필터를 검색 쿼리에서 처리하는 엔진(MySQL FULLTEXT)은 필터/페이지를 검색 쿼리에 넣고
+        total은 같은 일치 조건의 COUNT로 계산 (estimate면 카운터 서비스의 캐시 사용)
+        그 외 엔진은 상위 SEARCH_MAX_RESULTS개 후보에 필터를 적용하며, 후보가 잘렸으면 truncated
+        """
+        if search_service.filters_in_query:
+            ranked_ids = [
+                post_id for post_id, _ in
+                await db.run_sync(search_service.search, search, limit, conditions, skip)
+            ]
+            posts = await PostService._load_page(db, ranked_ids, compact)
+            if total_mode == "none":
+                return posts, None, False
+            # 마지막 페이지면 개수를 따로 셀 필요가 없음
+            if len(ranked_ids) < limit and (ranked_ids or skip == 0):
+                return posts, skip + len(ranked_ids), False
+            total = await db.run_sync(
+                post_count_service.search_count,
+                count_key,
+                [search_service.match_condition(search), *conditions],
+                total_mode == "estimate"
+            )
+            return posts, total, False
         
-        # 전체 개수 조회
-        total = query.count()
+        # 하나 더 받아서 후보가 잘렸는지 확인
+        ranked_ids = [
+            post_id for post_id, _ in
+            await db.run_sync(search_service.search, search, settings.SEARCH_MAX_RESULTS + 1)
+        ]
+        truncated = len(ranked_ids) > settings.SEARCH_MAX_RESULTS
+        ranked_ids = ranked_ids[:settings.SEARCH_MAX_RESULTS]
+        posts, total = await PostService._load_ranked(db, ranked_ids, skip, limit, conditions, compact)
+        return posts, (None if total_mode == "none" else total), truncated
+    
+    @staticmethod
+    async def semantic_search(
+        db: AsyncSession,
+        query: str,
+        limit: int = 20,
+        category_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> List[Tuple[Post, float]]:
+        """
+        의미 검색 (semantic_index 벡터 유사도 순, compact 보기용 로딩)
+        필터가 있으면 SEMANTIC_MAX_RESULTS개 후보에서 거른 뒤 limit개를 반환
+        """
+        conditions = PostService._filter_conditions(category_id, status)
+        candidates = settings.SEMANTIC_MAX_RESULTS if conditions else limit
+        # 벡터 계산은 CPU 작업이므로 이벤트 루프 밖에서 실행 (NumPy는 행렬 곱 중 GIL을 놓음)
+        ranked = await asyncio.to_thread(semantic_index.search, query, candidates)
+        scores = dict(ranked)
+        posts, _ = await PostService._load_ranked(
+            db, [post_id for post_id, _ in ranked], 0, limit, conditions, compact=True
+        )
+        return [(post, scores[post.id]) for post in posts]
+    
+    @staticmethod
+    async def _load_ranked(
+        db: AsyncSession,
+        ranked_ids: List[int],
+        skip: int,
+        limit: int,
+        conditions: List,
+        compact: bool
+    ) -> Tuple[List[Post], int]:
+        """순위가 매겨진 게시물 ID에 필터를 적용하고 한 페이지를 순서대로 조회"""
+        if not ranked_ids:
+            return [], 0
         
-        # 페이징 및 정렬
-        posts = query.order_by(desc(Post.created_at)).offset(skip).limit(limit).all()
+        # 카테고리/상태 필터는 후보 ID에 대해서만 적용
+        if conditions:
+            allowed = set((await db.execute(
+                select(Post.id).where(Post.id.in_(ranked_ids), *conditions)
+            )).scalars().all())
+            ranked_ids = [post_id for post_id in ranked_ids if post_id in allowed]
         
-        return posts, total
+        return await PostService._load_page(db, ranked_ids[skip:skip + limit], compact), len(ranked_ids)
+    
+    @staticmethod
+    async def _load_page(db: AsyncSession, page_ids: List[int], compact: bool) -> List[Post]:
+        """한 페이지 게시물을 주어진 ID 순서대로 조회"""
+        if not page_ids:
+            return []
+        posts = list((await db.execute(
+            select(Post).options(
+                *PostService._list_options(compact)
+            ).where(Post.id.in_(page_ids))
+        )).scalars().all())
+        order = {post_id: position for position, post_id in enumerate(page_ids)}
+        posts.sort(key=lambda post: order[post.id])
+        return posts
     
     @staticmethod
-    def delete_post(db: Session, post_id: int) -> bool:
+    async def delete_post(db: AsyncSession, post_id: int) -> bool:
         """게시물 삭제 (요약도 함께 삭제)"""
         try:
-            db_post = db.query(Post).filter(Post.id == post_id).first()
+            # 카운터/통계에서 뺄 값이므로 요약과 함께 잠가서 읽음
+            # (관련 게시물 목록을 다시 계산할 게시물도 같은 쿼리에서 조인)
+            db_post = (await db.execute(
+                select(Post)
+                .options(joinedload(Post.summary), joinedload(Post.referrers))
+                .where(Post.id == post_id)
+                .with_for_update(of=Post)
+            )).unique().scalar_one_or_none()
             if not db_post:
                 return False
             
-            # CASCADE 설정으로 요약도 자동 삭제됨
-            db.delete(db_post)
-            db.commit()
+            # CASCADE 설정으로 요약도 자동 삭제됨 (키워드 연결과 관련 게시물 행은 DB의 ON DELETE CASCADE)
+            await db.run_sync(post_count_service.adjust, db_post.category_id, db_post.status, -1)
+            if PostService._has_keywords(db_post.summary):
+                await db.run_sync(stats_service.apply_keywords, [post_id], -1)
+            await db.run_sync(stats_service.apply_posts, [stats_service.contribution(
+                db_post.created_at, db_post.category_id, db_post.status, db_post.summary
+            )])
+            related_referrers = [related.post_id for related in db_post.referrers]
+            await db.delete(db_post)
+            await db.commit()
+            await response_cache.invalidate(POSTS_TAG, post_tag(post_id))
+            search_service.remove_post(post_id)
+            semantic_index.remove_post(post_id)
+            related_service.mark_dirty(related_referrers)
             
             logger.info(f"게시물 삭제 완료 - ID: {post_id}")
             return True
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"게시물 삭제 실패: {str(e)}")
             return False
 
 class CategoryService:
     
     @staticmethod
-    def create_category(db: Session, category_data: CategoryCreate) -> Category:
+    async def create_category(db: AsyncSession, category_data: CategoryCreate) -> Category:
         """카테고리 생성"""
         db_category = Category(
             name=category_data.name,
             description=category_data.description
         )
         db.add(db_category)
-        db.commit()
-        db.refresh(db_category)
+        await db.flush()
+        await db.run_sync(post_count_service.init_category, db_category.id)
+        await db.commit()
+        await db.refresh(db_category)
+        category_registry.put(db_category.id, db_category.name)
+        await response_cache.invalidate(CATEGORIES_TAG)
         return db_category
     
     @staticmethod
-    def get_categories(db: Session) -> List[Category]:
+    async def get_categories(db: AsyncSession) -> List[Category]:
         """카테고리 목록 조회"""
-        return db.query(Category).order_by(Category.name).all()
+        return list((await db.execute(select(Category).order_by(Category.name))).scalars().all())
     
     @staticmethod
-    def get_category(db: Session, category_id: int) -> Optional[Category]:
+    async def get_category(db: AsyncSession, category_id: int) -> Optional[Category]:
         """카테고리 조회"""
-        return db.query(Category).filter(Category.id == category_id).first()
+        return await db.get(Category, category_id)
     
     @staticmethod
-    def update_category(db: Session, category_id: int, category_data: CategoryUpdate) -> Optional[Category]:
+    async def update_category(db: AsyncSession, category_id: int, category_data: CategoryUpdate) -> Optional[Category]:
         """카테고리 수정"""
-        db_category = db.query(Category).filter(Category.id == category_id).first()
+        db_category = await db.get(Category, category_id)
         if not db_category:
             return None
         
@@ -249,22 +726,30 @@ class CategoryService:
         for field, value in update_data.items():
             setattr(db_category, field, value)
         
-        db.commit()
-        db.refresh(db_category)
+        await db.commit()
+        await db.refresh(db_category)
+        category_registry.put(db_category.id, db_category.name)
+        # 게시물 응답에도 카테고리 정보가 포함됨
+        await response_cache.invalidate(CATEGORIES_TAG, category_tag(category_id), POSTS_TAG)
         return db_category
     
     @staticmethod
-    def delete_category(db: Session, category_id: int) -> bool:
+    async def delete_category(db: AsyncSession, category_id: int) -> bool:
         """카테고리 삭제"""
-        db_category = db.query(Category).filter(Category.id == category_id).first()
+        db_category = await db.get(Category, category_id)
         if not db_category:
             return False
         
         # 해당 카테고리를 사용하는 게시물이 있는지 확인
-        post_count = db.query(Post).filter(Post.category_id == category_id).count()
+        post_count = (await db.execute(
+            select(func.count(Post.id)).where(Post.category_id == category_id)
+        )).scalar_one()
         if post_count > 0:
             raise ValueError(f"카테고리에 {post_count}개의 게시물이 있어 삭제할 수 없습니다.")
         
-        db.delete(db_category)
-        db.commit()
-        return True
\ No newline at end of file
+        await db.run_sync(post_count_service.remove_category, category_id)
+        await db.delete(db_category)
+        await db.commit()
+        category_registry.remove(category_id)
+        await response_cache.invalidate(CATEGORIES_TAG, category_tag(category_id))
+        return True
@@ -0,0 +1,323 @@
+# backend/app/services/related_service.py
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.keyword import PostKeyword
+from app.models.post import Post
+from app.models.related import RelatedPost
+from app.services.response_cache import response_cache, post_tag
+from app.services.semantic_service import semantic_index
+import asyncio
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# (관련 게시물 ID, 관련도, 겹치는 키워드 수)
+Neighbour = Tuple[int, float, int]
+
+class KeywordGraph:
+    """
+    게시물-키워드 연결 중 관련도 계산에 필요한 부분
+
+    - for_posts: 갱신할 게시물들의 키워드와 그 키워드를 가진 게시물만 DB에서 읽음 (증분 갱신)
+    - load_all: post_keywords 전체를 한 번 읽음 (전체 재계산)
+    게시물이 너무 많은 키워드(RELATED_MAX_KEYWORD_POSTS 초과)는 구분력이 없어 겹침 계산에서 제외
+    """
+
+    def __init__(self, keywords_by_post: Dict[int, Set[int]], postings: Dict[int, List[int]], sizes: Dict[int, int]):
+        self.keywords_by_post = keywords_by_post
+        self.postings = postings
+        self.sizes = sizes
+
+    @classmethod
+    def for_posts(cls, db: Session, post_ids: List[int]) -> "KeywordGraph":
+        keywords_by_post: Dict[int, Set[int]] = defaultdict(set)
+        for post_id, keyword_id in db.execute(
+            select(PostKeyword.post_id, PostKeyword.keyword_id).where(PostKeyword.post_id.in_(post_ids))
+        ):
+            keywords_by_post[post_id].add(keyword_id)
+        keyword_ids = set().union(*keywords_by_post.values())
+
+        postings: Dict[int, List[int]] = defaultdict(list)
+        if keyword_ids:
+            usable = db.execute(
+                select(PostKeyword.keyword_id)
+                .where(PostKeyword.keyword_id.in_(keyword_ids))
+                .group_by(PostKeyword.keyword_id)
+                .having(func.count() <= settings.RELATED_MAX_KEYWORD_POSTS)
+            ).scalars().all()
+            if usable:
+                for keyword_id, post_id in db.execute(
+                    select(PostKeyword.keyword_id, PostKeyword.post_id).where(PostKeyword.keyword_id.in_(usable))
+                ):
+                    postings[keyword_id].append(post_id)
+        sizes = {post_id: len(keywords) for post_id, keywords in keywords_by_post.items()}
+        return cls(keywords_by_post, postings, sizes)
+
+    @classmethod
+    def load_all(cls, db: Session) -> "KeywordGraph":
+        keywords_by_post: Dict[int, Set[int]] = defaultdict(set)
+        postings: Dict[int, List[int]] = defaultdict(list)
+        for post_id, keyword_id in db.execute(
+            select(PostKeyword.post_id, PostKeyword.keyword_id).execution_options(yield_per=10000)
+        ):
+            keywords_by_post[post_id].add(keyword_id)
+            postings[keyword_id].append(post_id)
+        for keyword_id in [keyword_id for keyword_id, post_ids in postings.items()
+                           if len(post_ids) > settings.RELATED_MAX_KEYWORD_POSTS]:
+            del postings[keyword_id]
+        sizes = {post_id: len(keywords) for post_id, keywords in keywords_by_post.items()}
+        return cls(keywords_by_post, postings, sizes)
+
+    def load_sizes(self, db: Session, post_ids: Iterable[int]):
+        """후보 게시물의 키워드 수 (아직 모르는 것만 조회)"""
+        missing = [post_id for post_id in post_ids if post_id not in self.sizes]
+        for start in range(0, len(missing), 5000):
+            chunk = missing[start:start + 5000]
+            self.sizes.update(db.execute(
+                select(PostKeyword.post_id, func.count())
+                .where(PostKeyword.post_id.in_(chunk))
+                .group_by(PostKeyword.post_id)
+            ).all())
+
+    def shared_counts(self, post_id: int) -> Counter:
+        """게시물과 키워드가 겹치는 게시물별 겹친 수"""
+        shared: Counter = Counter()
+        for keyword_id in self.keywords_by_post.get(post_id, ()):
+            shared.update(self.postings.get(keyword_id, ()))
+        shared.pop(post_id, None)
+        return shared
+
+class RelatedPostService:
+    """
+    관련 게시물 미리 계산 (related_posts 테이블)
+
+    관련도 = 요약 키워드 겹침 코사인(겹친 수 / sqrt(두 게시물 키워드 수 곱)) x RELATED_KEYWORD_WEIGHT
+           + 의미 검색 벡터 코사인 유사도 x (1 - RELATED_KEYWORD_WEIGHT)
+    후보는 키워드가 겹치는 게시물과 벡터가 가까운 게시물 각각 RELATED_CANDIDATES개이며,
+    RELATED_MIN_SCORE 이상인 상위 RELATED_POSTS_LIMIT개를 저장합니다.
+
+    - 증분 갱신: 게시물 생성/제목·본문 수정/요약 저장 커밋 후 mark_dirty로 표시하면
+      주기 작업(RELATED_REFRESH_SECONDS)이 표시된 게시물과, 그 게시물을 목록에 두었거나
+      새로 관련 게시물이 된 게시물만 다시 계산 (관련도는 대칭이므로 상대 쪽 목록도 바뀔 수 있음)
+    - 삭제: 양방향 행은 외래 키의 ON DELETE CASCADE로 지워지고, 게시물 삭제시 함께 읽은
+      Post.referrers(이 게시물을 목록에 두었던 게시물)를 커밋 후 mark_dirty로 표시
+    - 전체 재계산: 테이블이 비어 있으면 앱 시작시(의미 검색 색인 구성 후), 대량 적재 후 스크립트에서 실행
+    표시는 메모리에만 있으므로 반영 전에 재시작하면 해당 게시물은 다음 변경 때 다시 계산됩니다.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._dirty: Set[int] = set()
+        self._dirty_lock = threading.Lock()
+        self._needs_rebuild_check = True
+        self._task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # 계산
+    # ------------------------------------------------------------------
+
+    def compute(self, db: Session, post_ids: List[int], graph: Optional[KeywordGraph] = None) -> Dict[int, List[Neighbour]]:
+        """게시물별 관련 게시물 상위 k개 (저장하지 않음)"""
+        if not post_ids:
+            return {}
+        graph = graph or KeywordGraph.for_posts(db, post_ids)
+        candidates_limit = settings.RELATED_CANDIDATES
+        keyword_weight = settings.RELATED_KEYWORD_WEIGHT
+        text_neighbours = semantic_index.similar_posts(post_ids, candidates_limit)
+
+        shared_by_post = {}
+        candidates_by_post = {}
+        for post_id in post_ids:
+            shared = graph.shared_counts(post_id)
+            candidates = {candidate for candidate, _ in shared.most_common(candidates_limit)}
+            candidates.update(candidate for candidate, _ in text_neighbours.get(post_id, ()))
+            shared_by_post[post_id] = shared
+            candidates_by_post[post_id] = candidates
+        graph.load_sizes(db, set(post_ids).union(*candidates_by_post.values()))
+
+        results = {}
+        for post_id in post_ids:
+            shared = shared_by_post[post_id]
+            candidates = candidates_by_post[post_id]
+            text_scores = dict(text_neighbours.get(post_id, ()))
+            missing = [candidate for candidate in candidates if candidate not in text_scores]
+            text_scores.update(semantic_index.similarity(post_id, missing))
+
+            size = graph.sizes.get(post_id, 0)
+            scored = []
+            for candidate in candidates:
+                overlap = shared.get(candidate, 0)
+                keyword_score = 0.0
+                if overlap and size:
+                    keyword_score = overlap / math.sqrt(size * max(graph.sizes.get(candidate, 0), overlap))
+                text_score = max(text_scores.get(candidate, 0.0), 0.0)
+                score = keyword_weight * keyword_score + (1 - keyword_weight) * text_score
+                if score >= settings.RELATED_MIN_SCORE:
+                    scored.append((candidate, round(score, 4), overlap))
+            scored.sort(key=lambda item: (-item[1], item[0]))
+            results[post_id] = scored[:settings.RELATED_POSTS_LIMIT]
+        return results
+
+    def _store(self, db: Session, results: Dict[int, List[Neighbour]]):
+        """게시물별 목록 교체"""
+        if not results:
+            return
+        db.execute(delete(RelatedPost).where(RelatedPost.post_id.in_(list(results))))
+        rows = [
+            {
+                "post_id": post_id,
+                "related_post_id": related_post_id,
+                "rank": rank,
+                "score": score,
+                "shared_keywords": shared_keywords
+            }
+            for post_id, neighbours in results.items()
+            for rank, (related_post_id, score, shared_keywords) in enumerate(neighbours)
+        ]
+        if rows:
+            db.execute(RelatedPost.__table__.insert(), rows)
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+
+    def mark_dirty(self, post_ids: Iterable[int]):
+        """다시 계산할 게시물 표시 (커밋 후 호출 - 요약 워커 스레드에서도 호출)"""
+        with self._dirty_lock:
+            self._dirty.update(post_ids)
+
+    def refresh(self, post_ids: Iterable[int]) -> int:
+        """
+        게시물들과 영향받는 게시물의 목록 다시 계산 (다시 계산한 게시물 수 반환)
+        1. 표시된 게시물 계산/저장
+        2. 기존에 이 게시물들을 목록에 두었던 게시물 + 새 목록에 오른 게시물을 한 번 더 계산
+           (2단계 결과로 다시 퍼뜨리지는 않음)
+        """
+        with SessionLocal() as db:
+            post_ids = list(db.execute(
+                select(Post.id).where(Post.id.in_(list(set(post_ids))))
+            ).scalars().all())
+            if not post_ids:
+                return 0
+
+            referrers = set(db.execute(
+                select(RelatedPost.post_id).where(RelatedPost.related_post_id.in_(post_ids))
+            ).scalars().all())
+            results = self.compute(db, post_ids)
+            self._store(db, results)
+
+            affected = referrers.union(
+                related_post_id for neighbours in results.values() for related_post_id, _, _ in neighbours
+            ) - set(post_ids)
+            affected = sorted(affected)
+            for start in range(0, len(affected), settings.RELATED_BATCH_SIZE):
+                self._store(db, self.compute(db, affected[start:start + settings.RELATED_BATCH_SIZE]))
+            db.commit()
+
+        refreshed = post_ids + affected
+        # 상세 조회 응답에 관련 게시물이 포함되므로 해당 게시물 캐시 무효화
+        response_cache.invalidate_sync(*[post_tag(post_id) for post_id in refreshed])
+        return len(refreshed)
+
+    def process_dirty(self) -> int:
+        """표시된 게시물 처리 (주기 작업 - 의미 검색 색인이 준비될 때까지 기다림)"""
+        if semantic_index.enabled and not semantic_index.ready:
+            return 0
+        if self._needs_rebuild_check:
+            self._needs_rebuild_check = False
+            if self.rebuild_if_empty():
+                with self._dirty_lock:
+                    self._dirty.clear()
+                return 0
+
+        with self._dirty_lock:
+            post_ids, self._dirty = self._dirty, set()
+        if post_ids:
+            # 다른 워커 프로세스가 바꾼 이웃 게시물의 벡터까지 최신으로 맞춘 뒤 계산
+            semantic_index.sync()
+        refreshed = 0
+        post_ids = sorted(post_ids)
+        for start in range(0, len(post_ids), settings.RELATED_BATCH_SIZE):
+            try:
+                refreshed += self.refresh(post_ids[start:start + settings.RELATED_BATCH_SIZE])
+            except Exception:
+                # 처리하지 못한 게시물은 다음 주기에 다시 시도
+                self.mark_dirty(post_ids[start:])
+                raise
+        return refreshed
+
+    # ------------------------------------------------------------------
+    # 전체 재계산
+    # ------------------------------------------------------------------
+
+    def rebuild(self, progress=None) -> int:
+        """
+        모든 게시물의 목록 다시 계산 (키워드 연결은 한 번에 읽고, 게시물은 ID 순 배치로 계산/커밋)
+        의미 검색 색인이 준비되지 않았으면 키워드 겹침만으로 계산합니다.
+        """
+        started = time.perf_counter()
+        processed = 0
+        last_post_id = 0
+        batch_size = settings.RELATED_BATCH_SIZE
+        with SessionLocal() as db:
+            graph = KeywordGraph.load_all(db)
+            db.execute(delete(RelatedPost))
+            db.commit()
+            while True:
+                post_ids = db.execute(
+                    select(Post.id).where(Post.id > last_post_id).order_by(Post.id).limit(batch_size)
+                ).scalars().all()
+                if not post_ids:
+                    break
+                self._store(db, self.compute(db, list(post_ids), graph))
+                db.commit()
+                processed += len(post_ids)
+                last_post_id = post_ids[-1]
+                if progress:
+                    progress(processed)
+        logger.info(f"관련 게시물 전체 계산 완료 - 게시물 {processed}건 ({time.perf_counter() - started:.1f}초)")
+        return processed
+
+    def rebuild_if_empty(self) -> int:
+        """테이블이 비어 있는데 게시물이 둘 이상 있으면 전체 계산 (테이블을 새로 만든 경우)"""
+        with SessionLocal() as db:
+            built = db.execute(select(exists().where(RelatedPost.post_id.is_not(None)))).scalar()
+            post_count = db.execute(select(func.count(Post.id))).scalar_one()
+        if built or post_count < 2:
+            return 0
+        return self.rebuild()
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """주기적 갱신 시작 (앱 시작시 호출 - 첫 실행에서 비어 있으면 전체 계산)"""
+        if self.refresh_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                refreshed = await asyncio.to_thread(self.process_dirty)
+                if refreshed:
+                    logger.info(f"관련 게시물 갱신 완료 - {refreshed}건")
+            except Exception as e:
+                logger.error(f"관련 게시물 갱신 실패: {str(e)}")
+
+related_service = RelatedPostService(refresh_seconds=settings.RELATED_REFRESH_SECONDS)
@@ -0,0 +1,238 @@
+# backend/app/services/response_cache.py
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from app.core.config import settings
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 무효화 태그
+POSTS_TAG = "posts"            # 모든 게시물 목록 (검색/필터/페이지 포함)
+CATEGORIES_TAG = "categories"  # 카테고리 목록
+
+def post_tag(post_id: int) -> str:
+    return f"post:{post_id}"
+
+def category_tag(category_id: int) -> str:
+    return f"category:{category_id}"
+
+class ResponseCache:
+    """
+    조회 API 응답 캐시 (read-through)
+
+    키는 라우트 이름 + 정규화된 쿼리 파라미터의 해시이며, 값은 직렬화된 JSON 본문입니다.
+    무효화는 태그 버전 방식입니다.
+    - 항목은 저장할 때 자신이 의존하는 태그들의 버전을 함께 기록
+    - 쓰기 경로는 커밋 후 관련 태그 버전을 올림 (invalidate)
+    - 조회시 기록된 버전과 현재 버전이 하나라도 다르면 만료로 처리
+    버전은 DB 조회 전에 읽어 두므로, 조회 도중 커밋된 쓰기가 있으면 그 응답은 곧바로 만료됩니다.
+
+    - 1계층: 프로세스 내 LRU (크기/TTL 제한)
+    - 2계층(선택): RESPONSE_CACHE_REDIS_URL 지정시 Redis에 본문과 태그 버전을 공유
+      (Redis 없이 여러 프로세스로 실행하면 다른 프로세스의 쓰기는 TTL 이후 반영됨)
+    """
+
+    KEY_PREFIX = "seeq:resp:"
+    TAG_PREFIX = "seeq:tag:"
+
+    def __init__(self, enabled: bool, max_size: int, ttl_seconds: float, redis_url: str = ""):
+        self.enabled = enabled
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, int], bytes]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()  # 요약 워커 스레드에서도 무효화하므로 버전 갱신은 잠금
+        self._redis = self._connect(redis_url) if enabled and redis_url else None
+
+        # 적중/실패 카운터
+        self.memory_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _connect(redis_url: str):
+        try:
+            import redis
+        except ImportError:
+            logger.warning("redis 패키지가 없어 응답 캐시는 메모리만 사용합니다.")
+            return None
+        return redis.Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    @staticmethod
+    def make_key(route: str, params: Dict[str, Any]) -> str:
+        """라우트 이름과 쿼리 파라미터로 캐시 키 생성 (None 값 제외, 키 정렬)"""
+        normalized = {
+            name: getattr(value, "value", value)
+            for name, value in params.items()
+            if value is not None
+        }
+        raw = json.dumps([route, normalized], ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def fetch(
+        self,
+        route: str,
+        params: Dict[str, Any],
+        tags: Iterable[str],
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """
+        캐시된 응답을 반환하고, 없으면 loader 결과를 직렬화해 저장한 뒤 반환
+        loader에서 발생한 예외(HTTPException 등)는 그대로 전달되며 캐시하지 않습니다.
+        """
+        if not self.enabled:
+            return self._response(self._encode(await loader()), "BYPASS")
+
+        key = self.make_key(route, params)
+        tags = list(tags)
+        body = await self.get(key)
+        if body is not None:
+            return self._response(body, "HIT")
+
+        versions = await self._current_versions(tags)
+        body = self._encode(await loader())
+        await self.set(key, versions, body)
+        return self._response(body, "MISS")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회 (메모리 → Redis 순서, 태그 버전 검증)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, versions, body = entry
+            if expires_at > time.monotonic() and await self._is_current(versions):
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return body
+            del self._entries[key]
+            self.stale += 1
+
+        if self._redis is not None:
+            try:
+                raw = await asyncio.to_thread(self._redis.get, self.KEY_PREFIX + key)
+            except Exception as e:
+                logger.error(f"응답 캐시 Redis 조회 실패: {str(e)}")
+                raw = None
+            if raw is not None:
+                stored = json.loads(raw)
+                if await self._is_current(stored["versions"]):
+                    body = stored["body"].encode("utf-8")
+                    self._remember(key, stored["versions"], body)
+                    self.shared_hits += 1
+                    return body
+                self.stale += 1
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, versions: Dict[str, int], body: bytes):
+        """캐시 저장 (versions는 DB 조회 전에 읽은 태그 버전)"""
+        self._remember(key, versions, body)
+
+        if self._redis is not None:
+            payload = json.dumps({"versions": versions, "body": body.decode("utf-8")}, ensure_ascii=False)
+            try:
+                await asyncio.to_thread(
+                    self._redis.set, self.KEY_PREFIX + key, payload, ex=max(1, int(self.ttl_seconds))
+                )
+            except Exception as e:
+                logger.error(f"응답 캐시 Redis 저장 실패: {str(e)}")
+
+    async def invalidate(self, *tags: str):
+        """태그 버전 올림 (쓰기 경로에서 커밋 후 호출)"""
+        if not self.enabled:
+            return
+        if self._redis is None:
+            self.invalidate_sync(*tags)
+        else:
+            await asyncio.to_thread(self.invalidate_sync, *tags)
+
+    def invalidate_sync(self, *tags: str):
+        """invalidate의 동기 버전 (요약 워커 스레드 등에서 호출)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+            self.invalidations += 1
+
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline()
+                for tag in tags:
+                    pipe.incr(self.TAG_PREFIX + tag)
+                pipe.execute()
+            except Exception as e:
+                # 다른 프로세스에는 TTL 이후 반영됨
+                logger.error(f"응답 캐시 Redis 무효화 실패: {str(e)}")
+
+    async def _current_versions(self, tags: List[str]) -> Dict[str, int]:
+        if self._redis is None:
+            with self._lock:
+                return {tag: self._versions.get(tag, 0) for tag in tags}
+        try:
+            values = await asyncio.to_thread(self._redis.mget, [self.TAG_PREFIX + tag for tag in tags])
+        except Exception as e:
+            logger.error(f"응답 캐시 Redis 버전 조회 실패: {str(e)}")
+            return {tag: -1 for tag in tags}  # 검증에 항상 실패하도록
+        return {tag: int(value or 0) for tag, value in zip(tags, values)}
+
+    async def _is_current(self, versions: Dict[str, int]) -> bool:
+        return versions == await self._current_versions(list(versions))
+
+    def _remember(self, key: str, versions: Dict[str, int], body: bytes):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, versions, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _encode(result: Any) -> bytes:
+        return json.dumps(
+            jsonable_encoder(result), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    @staticmethod
+    def _response(body: bytes, status: str) -> Response:
+        return Response(content=body, media_type="application/json", headers={"X-Cache": status})
+
+    def stats(self) -> Dict:
+        """적중/실패 통계"""
+        hits = self.memory_hits + self.shared_hits
+        lookups = hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "memory_hits": self.memory_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "memory_size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "shared_backend": "redis" if self._redis is not None else None
+        }
+
+    def clear(self):
+        """메모리 계층 비우기"""
+        self._entries.clear()
+
+response_cache = ResponseCache(
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+    max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    redis_url=settings.RESPONSE_CACHE_REDIS_URL
+)
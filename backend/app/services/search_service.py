@@ -0,0 +1,413 @@
+# backend/app/services/search_service.py
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import desc, func, inspect, or_, select, text, union, update
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import engine
+from app.models.post import Post
+from app.models.summary import Summary
+from app.services.document_changes import Marks, fetch_changes, read_marks, start_sync_loop
+import heapq
+import logging
+import math
+import re
+import threading
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+# 검색 필드 가중치 (제목 > 요약/하이라이트/키워드 > 본문)
+TITLE_WEIGHT = 3.0
+SUMMARY_WEIGHT = 1.5
+CONTENT_WEIGHT = 1.0
+
+# MySQL ngram 파서 기본 토큰 길이와 맞춤
+MIN_TERM_LENGTH = 2
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+def normalize_text(value: str) -> str:
+    """검색용 정규화 (NFKC + 소문자)"""
+    return unicodedata.normalize("NFKC", value or "").lower()
+
+def extract_terms(query: str) -> List[str]:
+    """검색어를 단어 단위로 분리"""
+    return _TOKEN_PATTERN.findall(normalize_text(query))
+
+def is_indexable_query(query: str) -> bool:
+    """bigram 색인으로 처리 가능한 검색어인지 (2글자 이상 단어가 하나라도 있어야 함)"""
+    return any(len(term) >= MIN_TERM_LENGTH for term in extract_terms(query))
+
+def char_bigrams(value: str) -> Iterable[str]:
+    """단어별 문자 bigram (한국어처럼 띄어쓰기가 불규칙한 텍스트용)"""
+    for term in _TOKEN_PATTERN.findall(normalize_text(value)):
+        for i in range(len(term) - 1):
+            yield term[i:i + 2]
+
+def build_summary_search_text(summary: Optional[str], highlights: Optional[List[str]], keywords: Optional[List[str]]) -> str:
+    """요약/하이라이트/키워드를 검색용 텍스트 하나로 합침"""
+    parts = [summary or ""]
+    parts.extend(highlights or [])
+    parts.extend(keywords or [])
+    return "\n".join(str(part) for part in parts if part)
+
+class SearchBackend:
+    """검색 엔진 공통 인터페이스"""
+
+    name = "base"
+    # 색인을 직접 유지해야 해서 게시물 본문/요약 텍스트가 필요한지 여부
+    needs_documents = False
+    # 목록 필터와 페이지 위치를 검색 쿼리 안에서 처리하는지
+    # (False면 상위 SEARCH_MAX_RESULTS개 후보만 받아 그 안에서 거름)
+    filters_in_query = False
+
+    def search(self, db: Session, query: str, limit: int) -> List[Tuple[int, float]]:
+        """관련도 순 (post_id, score) 목록"""
+        raise NotImplementedError
+
+    def match_condition(self, query: str):
+        """검색어와 일치하는 게시물 조건 (목록 total COUNT용, filters_in_query인 엔진만)"""
+        raise NotImplementedError
+
+    def index_post(self, post_id: int, title: str, content: str, summary_text: Optional[str] = None):
+        """게시물 색인 추가/갱신"""
+
+    def remove_post(self, post_id: int):
+        """게시물 색인 제거"""
+
+    def prepare(self):
+        """앱 시작시 색인 준비"""
+
+    def start_sync(self):
+        """앱 시작시(prepare 이후) 다른 워커 프로세스의 변경 반영 시작 (프로세스 내 색인만)"""
+
+class MySQLFullTextSearch(SearchBackend):
+    """
+    MySQL FULLTEXT (ngram 파서) 검색
+    posts(title, content), posts(title), summaries(search_text)에 FULLTEXT 색인을 두고
+    MATCH ... AGAINST (BOOLEAN MODE) 점수로 정렬합니다.
+
+    - 후보: 색인별 MATCH 조건을 UNION으로 모아 각각 FULLTEXT 색인을 타게 함
+      (LEFT JOIN 결과에 MATCH를 OR로 걸면 색인을 쓰지 못하고 조인 전체를 훑음)
+    - 점수: 제목+본문 x CONTENT_WEIGHT + 제목 x (TITLE_WEIGHT - CONTENT_WEIGHT) + 요약 x SUMMARY_WEIGHT
+      (제목에서 찾은 검색어는 두 색인에서 모두 점수를 받아 합이 TITLE_WEIGHT)
+    - 카테고리/상태/키워드 필터와 OFFSET도 같은 쿼리에서 처리하므로 결과 수 제한 없이 모든 페이지에 접근
+    색인은 MySQL이 유지하므로 index_post/remove_post는 아무 일도 하지 않습니다.
+    """
+
+    name = "mysql"
+    filters_in_query = True
+
+    INDEXES = [
+        ("posts", "ft_posts_title_content", "title, content"),
+        ("posts", "ft_posts_title", "title"),
+        ("summaries", "ft_summaries_search_text", "search_text"),
+    ]
+
+    def search(
+        self, db: Session, query: str, limit: int, conditions: Sequence = (), offset: int = 0
+    ) -> List[Tuple[int, float]]:
+        """관련도 순 (post_id, score) 목록 - conditions는 Post 기준 목록 필터, offset부터 limit개"""
+        boolean_query = self._to_boolean_query(query)
+        if not boolean_query:
+            return []
+        matched = self._matched_ids(boolean_query).subquery("matched")
+        score = (
+            self._match(boolean_query, Post.title, Post.content) * CONTENT_WEIGHT
+            + self._match(boolean_query, Post.title) * (TITLE_WEIGHT - CONTENT_WEIGHT)
+            + func.coalesce(self._match(boolean_query, Summary.search_text), 0) * SUMMARY_WEIGHT
+        ).label("score")
+        rows = db.execute(
+            select(Post.id, score)
+            .select_from(matched)
+            .join(Post, Post.id == matched.c.id)
+            .outerjoin(Summary, Summary.post_id == Post.id)
+            .where(*conditions)
+            .order_by(desc(score), desc(Post.id))
+            .offset(offset)
+            .limit(limit)
+        ).all()
+        return [(row.id, float(row.score)) for row in rows]
+
+    def match_condition(self, query: str):
+        boolean_query = self._to_boolean_query(query)
+        if not boolean_query:
+            return Post.id.is_(None)
+        return Post.id.in_(self._matched_ids(boolean_query))
+
+    @classmethod
+    def _matched_ids(cls, boolean_query: str):
+        return union(
+            select(Post.id).where(cls._match(boolean_query, Post.title, Post.content)),
+            select(Summary.post_id).where(cls._match(boolean_query, Summary.search_text))
+        )
+
+    @staticmethod
+    def _match(boolean_query: str, *columns):
+        return match(*columns, against=boolean_query).in_boolean_mode()
+
+    @staticmethod
+    def _to_boolean_query(query: str) -> str:
+        # ngram 파서는 각 단어를 구문 검색으로 처리하므로 모든 단어를 필수(+)로 지정
+        terms = [term for term in extract_terms(query) if len(term) >= MIN_TERM_LENGTH]
+        return " ".join(f'+"{term}"' for term in terms)
+
+    def prepare(self):
+        """FULLTEXT 색인 생성 및 summaries.search_text 채우기"""
+        inspector = inspect(engine)
+        with engine.begin() as connection:
+            for table, index_name, columns in self.INDEXES:
+                existing = {index["name"] for index in inspector.get_indexes(table)}
+                if index_name in existing:
+                    continue
+                logger.info(f"FULLTEXT 색인 생성 중: {table}.{index_name}")
+                connection.execute(text(
+                    f"ALTER TABLE {table} ADD FULLTEXT INDEX {index_name} ({columns}) WITH PARSER ngram"
+                ))
+        backfill_summary_search_text()
+
+class InvertedIndexSearch(SearchBackend):
+    """
+    프로세스 내 문자 bigram 역색인 (SQLite/테스트용)
+
+    - 게시물 하나를 문서 하나로 색인 (제목/요약/본문 가중치 합산)
+    - 포스팅은 문서 번호 오름차순 array로 저장하고, 갱신은 새 문서 번호를 발급한 뒤
+      이전 번호를 삭제 표시 (삭제 비율이 높아지면 압축)
+    - 검색은 모든 검색어 bigram을 포함한 게시물만 (AND), TF-IDF 점수 순
+    - 색인은 프로세스마다 따로 있으므로 다른 워커 프로세스의 변경은 INDEX_SYNC_SECONDS마다
+      updated_at 기준으로 다시 읽어 반영 (document_changes, 의미 검색 색인과 같은 방식)
+    """
+
+    name = "memory"
+    needs_documents = True
+
+    COMPACT_RATIO = 0.25
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        # 마지막으로 반영한 수정 시각 (None이면 아직 색인 구성 전)
+        self._marks: Optional[Marks] = None
+        self._reset()
+
+    def _reset(self):
+        self._postings: Dict[str, array] = {}
+        self._weights: Dict[str, array] = {}
+        self._doc_posts = array("i")
+        self._post_docs: Dict[int, int] = {}
+        self._deleted: Set[int] = set()
+
+    @property
+    def document_count(self) -> int:
+        return len(self._post_docs)
+
+    def index_post(self, post_id: int, title: str, content: str, summary_text: Optional[str] = None):
+        weights: Dict[str, float] = {}
+        for value, weight in (
+            (title, TITLE_WEIGHT),
+            (summary_text, SUMMARY_WEIGHT),
+            (content, CONTENT_WEIGHT)
+        ):
+            for bigram in char_bigrams(value or ""):
+                weights[bigram] = weights.get(bigram, 0.0) + weight
+
+        with self._lock:
+            self._remove(post_id)
+            docno = len(self._doc_posts)
+            self._doc_posts.append(post_id)
+            self._post_docs[post_id] = docno
+            for bigram, weight in weights.items():
+                postings = self._postings.get(bigram)
+                if postings is None:
+                    postings = self._postings[bigram] = array("i")
+                    self._weights[bigram] = array("f")
+                postings.append(docno)
+                self._weights[bigram].append(weight)
+            self._maybe_compact()
+
+    def remove_post(self, post_id: int):
+        with self._lock:
+            self._remove(post_id)
+            self._maybe_compact()
+
+    def _remove(self, post_id: int):
+        docno = self._post_docs.pop(post_id, None)
+        if docno is not None:
+            self._deleted.add(docno)
+
+    def _maybe_compact(self):
+        if len(self._deleted) > max(1000, len(self._doc_posts) * self.COMPACT_RATIO):
+            self._compact()
+
+    def _compact(self):
+        """삭제 표시된 문서를 포스팅에서 제거하고 문서 번호를 다시 매김"""
+        remap = {}
+        doc_posts = array("i")
+        for docno, post_id in enumerate(self._doc_posts):
+            if docno in self._deleted:
+                continue
+            remap[docno] = len(doc_posts)
+            doc_posts.append(post_id)
+
+        for bigram in list(self._postings):
+            old_docs = self._postings[bigram]
+            old_weights = self._weights[bigram]
+            new_docs = array("i")
+            new_weights = array("f")
+            for docno, weight in zip(old_docs, old_weights):
+                new_docno = remap.get(docno)
+                if new_docno is not None:
+                    new_docs.append(new_docno)
+                    new_weights.append(weight)
+            if new_docs:
+                self._postings[bigram] = new_docs
+                self._weights[bigram] = new_weights
+            else:
+                del self._postings[bigram]
+                del self._weights[bigram]
+
+        self._doc_posts = doc_posts
+        self._post_docs = {post_id: docno for docno, post_id in enumerate(doc_posts)}
+        self._deleted = set()
+
+    def search(self, db: Session, query: str, limit: int) -> List[Tuple[int, float]]:
+        bigrams = set()
+        for term in extract_terms(query):
+            if len(term) >= MIN_TERM_LENGTH:
+                bigrams.update(term[i:i + 2] for i in range(len(term) - 1))
+        if not bigrams:
+            return []
+
+        with self._lock:
+            lists = []
+            for bigram in bigrams:
+                postings = self._postings.get(bigram)
+                if postings is None:
+                    return []
+                lists.append((bigram, postings, self._weights[bigram]))
+            lists.sort(key=lambda item: len(item[1]))
+
+            total_docs = max(1, len(self._post_docs))
+            deleted = self._deleted
+
+            # 가장 짧은 포스팅을 후보로 두고 나머지 포스팅과 교집합
+            _, first_docs, first_weights = lists[0]
+            first_idf = math.log(1 + total_docs / len(first_docs))
+            scores: Dict[int, float] = {
+                docno: first_idf * weight / (weight + 1.2)
+                for docno, weight in zip(first_docs, first_weights)
+                if docno not in deleted
+            }
+
+            for _, docs, weights in lists[1:]:
+                if not scores:
+                    return []
+                idf = math.log(1 + total_docs / len(docs))
+                matched = {}
+                if len(scores) * 16 < len(docs):
+                    # 후보가 적으면 정렬된 포스팅에서 이진 탐색
+                    for docno, score in scores.items():
+                        position = bisect_left(docs, docno)
+                        if position < len(docs) and docs[position] == docno:
+                            weight = weights[position]
+                            matched[docno] = score + idf * weight / (weight + 1.2)
+                else:
+                    # 후보가 많으면 포스팅 전체를 해시로 바꿔 조회
+                    lookup = dict(zip(docs, weights))
+                    for docno, score in scores.items():
+                        weight = lookup.get(docno)
+                        if weight is not None:
+                            matched[docno] = score + idf * weight / (weight + 1.2)
+                scores = matched
+
+            ranked = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+            return [(self._doc_posts[docno], score) for docno, score in ranked]
+
+    def prepare(self):
+        """DB의 게시물/요약 전체로 색인 재구성"""
+        with self._lock:
+            self._reset()
+        count = 0
+        with Session(engine) as db:
+            # 구성 중의 변경은 다음 동기화에서 다시 읽도록 시작 전 시각을 기준으로 함
+            marks = read_marks(db)
+            result = db.execute(
+                select(Post.id, Post.title, Post.content, Summary.summary, Summary.highlights, Summary.keywords)
+                .outerjoin(Summary, Summary.post_id == Post.id)
+                .order_by(Post.id)
+                .execution_options(yield_per=1000)
+            )
+            for row in result:
+                self.index_post(
+                    row.id, row.title, row.content,
+                    build_summary_search_text(row.summary, row.highlights, row.keywords)
+                )
+                count += 1
+        with self._lock:
+            self._marks = marks
+        logger.info(f"검색 색인 구성 완료 - 게시물 {count}건")
+
+    def start_sync(self):
+        start_sync_loop("검색 색인", self.sync)
+
+    def sync(self) -> int:
+        """마지막 반영 이후 DB에서 바뀐 게시물을 다시 색인하고 삭제된 게시물을 제거"""
+        with self._sync_lock:
+            with self._lock:
+                marks = self._marks
+                if marks is None:
+                    return 0
+                known = set(self._post_docs)
+            next_marks, changed, removed = fetch_changes(marks, known)
+            for row in changed:
+                self.index_post(row.id, row.title, row.content, row.search_text)
+            for post_id in removed:
+                self.remove_post(post_id)
+            with self._lock:
+                self._marks = next_marks
+        return len(changed) + len(removed)
+
+def backfill_summary_search_text(batch_size: int = 500) -> int:
+    """search_text가 비어 있는 기존 요약 채우기"""
+    filled = 0
+    with Session(engine) as db:
+        while True:
+            rows = db.execute(
+                select(Summary.id, Summary.summary, Summary.highlights, Summary.keywords)
+                .where(Summary.search_text.is_(None))
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            for row in rows:
+                db.execute(
+                    update(Summary)
+                    .where(Summary.id == row.id)
+                    .values(search_text=build_summary_search_text(row.summary, row.highlights, row.keywords))
+                )
+            db.commit()
+            filled += len(rows)
+    if filled:
+        logger.info(f"요약 검색 텍스트 {filled}건 채움")
+    return filled
+
+def ilike_condition(search: str):
+    """bigram 색인으로 처리할 수 없는 짧은 검색어용 부분 일치 조건"""
+    return or_(
+        Post.title.ilike(f"%{search}%"),
+        Post.content.ilike(f"%{search}%")
+    )
+
+def create_search_backend() -> SearchBackend:
+    backend = settings.SEARCH_BACKEND
+    if backend == "auto":
+        backend = "mysql" if engine.dialect.name == "mysql" else "memory"
+    if backend == "mysql":
+        return MySQLFullTextSearch()
+    return InvertedIndexSearch()
+
+search_service = create_search_backend()
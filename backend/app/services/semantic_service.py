@@ -0,0 +1,610 @@
+# backend/app/services/semantic_service.py
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import engine
+from app.models.post import Post
+from app.services.document_changes import Marks, document_query, fetch_changes, read_marks, start_sync_loop
+from app.services.response_cache import response_cache, POSTS_TAG
+from app.services.search_service import (
+    TITLE_WEIGHT, SUMMARY_WEIGHT, CONTENT_WEIGHT, normalize_text
+)
+import numpy as np
+import logging
+import math
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+# n-gram 해시 (64비트 곱셈 해시 + murmur3 finalizer, 프로세스와 무관하게 같은 버킷)
+_HASH_PRIME = np.uint64(0x100000001B3)
+_HASH_MIX = np.uint64(0xFF51AFD7ED558CCD)
+_BIGRAM_SEED = np.uint64(2)
+_TRIGRAM_SEED = np.uint64(3)
+
+def hashed_ngrams(value: str, hash_bits: int) -> np.ndarray:
+    """
+    단어 경계를 포함한 문자 2/3-gram의 해시 버킷 번호
+    (" 회의록 " → " 회", "회의", ..., " 회의", "회의록", "의록 ")
+    """
+    normalized = _NON_WORD_PATTERN.sub(" ", normalize_text(value)).strip()
+    if not normalized:
+        return np.empty(0, dtype=np.int64)
+
+    codes = np.frombuffer(f" {normalized} ".encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    with np.errstate(over="ignore"):
+        bigrams = (_BIGRAM_SEED * _HASH_PRIME + codes[:-1]) * _HASH_PRIME + codes[1:]
+        trigrams = ((_TRIGRAM_SEED * _HASH_PRIME + codes[:-2]) * _HASH_PRIME + codes[1:-1]) * _HASH_PRIME + codes[2:]
+        # 가운데 글자가 공백인 trigram은 두 단어에 걸치므로 제외
+        hashes = np.concatenate([bigrams, trigrams[codes[1:-1] != 32]])
+        hashes ^= hashes >> np.uint64(33)
+        hashes *= _HASH_MIX
+        hashes ^= hashes >> np.uint64(33)
+    return (hashes >> np.uint64(64 - hash_bits)).astype(np.int64)
+
+def term_frequencies(fields: Sequence[Tuple[Optional[str], float]], hash_bits: int) -> Tuple[np.ndarray, np.ndarray]:
+    """필드 가중치를 곱한 n-gram 빈도 (버킷 번호 오름차순, 로그 스케일)"""
+    buckets = []
+    weights = []
+    for value, weight in fields:
+        if not value:
+            continue
+        hashed = hashed_ngrams(value, hash_bits)
+        buckets.append(hashed)
+        weights.append(np.full(len(hashed), weight, dtype=np.float32))
+    if not buckets:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    indices, inverse = np.unique(np.concatenate(buckets), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate(weights))
+    return indices, np.log1p(counts).astype(np.float32)
+
+def document_fields(title: Optional[str], content: Optional[str], summary_text: Optional[str]) -> List[Tuple[Optional[str], float]]:
+    """게시물 하나의 색인 필드 (제목 > 요약/하이라이트/키워드 > 본문 앞부분)"""
+    return [
+        (title, TITLE_WEIGHT),
+        (summary_text, SUMMARY_WEIGHT),
+        ((content or "")[:settings.SEMANTIC_MAX_CONTENT_CHARS], CONTENT_WEIGHT)
+    ]
+
+class SparseRows:
+    """
+    희소 TF 행렬 (행 = 문서, 열 = n-gram 해시 버킷)
+    문서당 원소가 수백 개라 행마다 BLAS gemv/외적으로 계산하는 쪽이
+    전체 원소를 모아 reduceat/add.at 하는 것보다 빠름
+    """
+
+    def __init__(self, rows: Sequence[Tuple[np.ndarray, np.ndarray]]):
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def dot(self, dense: np.ndarray) -> np.ndarray:
+        """X @ dense"""
+        result = np.zeros((len(self.rows), dense.shape[1]), dtype=np.float32)
+        for position, (indices, values) in enumerate(self.rows):
+            if len(indices):
+                result[position] = values @ dense[indices]
+        return result
+
+    def transpose_dot(self, dense: np.ndarray, columns: int) -> np.ndarray:
+        """X.T @ dense (행 안의 버킷 번호는 겹치지 않으므로 += 로 누적 가능)"""
+        result = np.zeros((columns, dense.shape[1]), dtype=np.float32)
+        for position, (indices, values) in enumerate(self.rows):
+            if len(indices):
+                result[indices] += np.outer(values, dense[position])
+        return result
+
+class SemanticModel:
+    """
+    해시 n-gram TF-IDF → SVD(LSA) 투영
+    idf와 투영 행렬은 표본 문서로 학습하고, 이후 추가되는 문서는 같은 투영을 그대로 사용
+    """
+
+    POWER_ITERATIONS = 1
+    OVERSAMPLES = 10
+
+    def __init__(self, idf: np.ndarray, components: np.ndarray, hash_bits: int):
+        self.idf = idf
+        self.components = components
+        self.hash_bits = hash_bits
+
+    @property
+    def dimension(self) -> int:
+        return self.components.shape[1]
+
+    @classmethod
+    def fit(cls, rows: List[Tuple[np.ndarray, np.ndarray]], dimension: int, hash_bits: int, seed: int = 0) -> "SemanticModel":
+        """표본 문서 TF로 idf와 상위 특이벡터 계산 (randomized SVD)"""
+        columns = 1 << hash_bits
+        document_frequency = np.zeros(columns, dtype=np.float32)
+        for indices, _ in rows:
+            document_frequency[indices] += 1
+        idf = np.log((1 + len(rows)) / (1 + document_frequency)).astype(np.float32) + 1
+
+        matrix = SparseRows([cls._weigh(indices, values, idf) for indices, values in rows])
+        rank = max(1, min(dimension, len(rows), columns))
+        width = min(rank + cls.OVERSAMPLES, len(rows), columns)
+
+        rng = np.random.default_rng(seed)
+        basis, _ = np.linalg.qr(matrix.dot(rng.standard_normal((columns, width), dtype=np.float32)))
+        for _ in range(cls.POWER_ITERATIONS):
+            basis, _ = np.linalg.qr(matrix.dot(matrix.transpose_dot(basis, columns)))
+
+        # B = Q.T @ X 의 오른쪽 특이벡터가 X의 상위 특이벡터 근사
+        # (B는 width x 2^bits로 옆으로 길어서 SVD 대신 B @ B.T 고유값 분해로 계산)
+        small = matrix.transpose_dot(basis, columns)
+        eigenvalues, eigenvectors = np.linalg.eigh(small.T @ small)
+        top = np.argsort(eigenvalues)[::-1][:rank]
+        singular = np.sqrt(np.maximum(eigenvalues[top], 1e-12))
+        components = (small @ eigenvectors[:, top]) / singular
+        return cls(idf, np.ascontiguousarray(components, dtype=np.float32), hash_bits)
+
+    @staticmethod
+    def _weigh(indices: np.ndarray, values: np.ndarray, idf: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """TF × IDF 후 L2 정규화"""
+        weighted = values * idf[indices]
+        norm = np.linalg.norm(weighted)
+        if norm > 0:
+            weighted /= norm
+        return indices, weighted
+
+    def embed(self, rows: Sequence[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+        """TF 목록 → 정규화된 float32 벡터 (특징이 없는 문서는 0 벡터)"""
+        if not rows:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        vectors = SparseRows([self._weigh(indices, values, self.idf) for indices, values in rows]).dot(self.components)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def embed_text(self, fields: Sequence[Tuple[Optional[str], float]]) -> np.ndarray:
+        return self.embed([term_frequencies(fields, self.hash_bits)])[0]
+
+class SemanticIndex:
+    """
+    프로세스 내 의미 검색 색인 (게시물 제목/요약/본문 → LSA 벡터)
+
+    - 벡터는 float32 행렬 한 개에 행 단위로 저장하고 삭제된 행은 재사용
+    - 검색은 기본적으로 전체 행렬 곱 + argpartition 상위 k (정확)
+    - 문서가 많으면(SEMANTIC_INDEX=auto/ivf) k-means 중심으로 나눈 IVF 목록 중
+      가까운 SEMANTIC_IVF_PROBES개만 비교 (근사)
+    - 게시물 쓰기시 search_service와 같은 시점에 행을 추가/갱신/삭제
+    - 문서 수가 마지막 학습 때의 SEMANTIC_REFIT_GROWTH배를 넘으면 백그라운드에서 다시 학습
+      (학습 중 들어온 변경은 모아 두었다가 새 색인에 다시 반영)
+    - 색인은 프로세스마다 따로 있으므로 다른 워커 프로세스의 변경은 INDEX_SYNC_SECONDS마다
+      posts/summaries의 updated_at이 마지막으로 본 시각 이후인 게시물을 다시 읽어 반영하고,
+      게시물 수가 색인보다 적으면 삭제된 게시물을 찾아 제거 (0이면 단일 워커 전용)
+    """
+
+    MIN_CAPACITY = 1024
+    KMEANS_ITERATIONS = 10
+    KMEANS_SAMPLES_PER_LIST = 40
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._building = False
+        self._pending: Dict[int, Optional[Tuple[Optional[str], Optional[str], Optional[str]]]] = {}
+        self._fitted_documents = 0
+        self._sync_lock = threading.Lock()
+        self._sync_started = False
+        # 마지막으로 반영한 수정 시각 (None이면 아직 색인 구성 전)
+        self._marks: Optional[Marks] = None
+        self._reset(None)
+
+    def _reset(self, model: Optional[SemanticModel]):
+        dimension = model.dimension if model else 0
+        self._model = model
+        self._vectors = np.zeros((self.MIN_CAPACITY, dimension), dtype=np.float32)
+        self._row_posts = np.full(self.MIN_CAPACITY, -1, dtype=np.int64)
+        self._post_rows: Dict[int, int] = {}
+        self._free: List[int] = []
+        self._size = 0
+        # IVF (None이면 전체 비교)
+        self._centroids: Optional[np.ndarray] = None
+        self._row_lists = np.full(self.MIN_CAPACITY, -1, dtype=np.int32)
+        self._lists: List[List[int]] = []
+        self._list_arrays: Dict[int, np.ndarray] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return settings.SEMANTIC_SEARCH_ENABLED
+
+    @property
+    def document_count(self) -> int:
+        return len(self._post_rows)
+
+    @property
+    def uses_ivf(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def ready(self) -> bool:
+        """모델 학습과 첫 색인 구성이 끝났는지"""
+        return self._model is not None and not (self._building and self._fitted_documents == 0)
+
+    # 색인 갱신
+
+    def index_post(self, post_id: int, title: str, content: str, summary_text: Optional[str] = None):
+        """게시물 벡터 추가/갱신"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._building or self._model is None:
+                self._pending[post_id] = (title, content, summary_text)
+            else:
+                vector = self._model.embed_text(document_fields(title, content, summary_text))
+                self._set_row(post_id, vector)
+        self._maybe_refit()
+
+    def remove_post(self, post_id: int):
+        """게시물 벡터 제거"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._building:
+                self._pending[post_id] = None
+            else:
+                self._pending.pop(post_id, None)
+                self._remove_row(post_id)
+
+    def _set_row(self, post_id: int, vector: np.ndarray):
+        row = self._post_rows.get(post_id)
+        if row is None:
+            row = self._allocate_row()
+            self._post_rows[post_id] = row
+            self._row_posts[row] = post_id
+        self._vectors[row] = vector
+        if self._centroids is not None:
+            self._assign_list(row, int(np.argmax(self._centroids @ vector)))
+
+    def _remove_row(self, post_id: int):
+        row = self._post_rows.pop(post_id, None)
+        if row is None:
+            return
+        self._vectors[row] = 0
+        self._row_posts[row] = -1
+        if self._centroids is not None:
+            self._assign_list(row, -1)
+        self._free.append(row)
+
+    def _allocate_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._size == len(self._row_posts):
+            self._grow(self._size * 2)
+        row = self._size
+        self._size += 1
+        return row
+
+    def _grow(self, capacity: int):
+        vectors = np.zeros((capacity, self._vectors.shape[1]), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        row_posts = np.full(capacity, -1, dtype=np.int64)
+        row_posts[:self._size] = self._row_posts[:self._size]
+        row_lists = np.full(capacity, -1, dtype=np.int32)
+        row_lists[:self._size] = self._row_lists[:self._size]
+        self._vectors, self._row_posts, self._row_lists = vectors, row_posts, row_lists
+
+    def _assign_list(self, row: int, list_no: int):
+        previous = int(self._row_lists[row])
+        if previous == list_no:
+            return
+        if previous >= 0:
+            self._lists[previous].remove(row)
+            self._list_arrays.pop(previous, None)
+        if list_no >= 0:
+            self._lists[list_no].append(row)
+            self._list_arrays.pop(list_no, None)
+        self._row_lists[row] = list_no
+
+    # 검색
+
+    def search(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        """코사인 유사도 순 (post_id, score) 목록 (유사도가 양수인 것만)"""
+        if not self.enabled or limit <= 0:
+            return []
+        with self._lock:
+            model = self._model
+            if model is None or not self._post_rows:
+                return []
+            vector = model.embed_text([(query, 1.0)])
+            if not vector.any():
+                return []
+
+            if self._centroids is not None:
+                rows = self._probe_rows(vector)
+                scores = self._vectors[rows] @ vector
+            else:
+                rows = np.arange(self._size)
+                scores = self._vectors[:self._size] @ vector
+                if self._free:
+                    scores[self._free] = -np.inf
+            return self._top(rows, scores, limit)
+
+    def similar_posts(self, post_ids: Sequence[int], limit: int, batch_size: int = 64) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        게시물별로 벡터가 가까운 다른 게시물 (post_id → 유사도 순 (post_id, score), 양수만)
+        전체 비교 모드에서는 batch_size개씩 행렬-행렬 곱으로 한 번에 계산
+        """
+        if not self.enabled or limit <= 0:
+            return {}
+        results: Dict[int, List[Tuple[int, float]]] = {}
+        with self._lock:
+            rows = [(post_id, self._post_rows[post_id]) for post_id in post_ids if post_id in self._post_rows]
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                if self._centroids is not None:
+                    for post_id, row in batch:
+                        candidates = self._probe_rows(self._vectors[row])
+                        scores = self._vectors[candidates] @ self._vectors[row]
+                        scores[candidates == row] = -np.inf
+                        results[post_id] = self._top(candidates, scores, limit)
+                    continue
+
+                queries = np.array([row for _, row in batch], dtype=np.int64)
+                scores = self._vectors[:self._size] @ self._vectors[queries].T
+                if self._free:
+                    scores[self._free] = -np.inf
+                scores[queries, np.arange(len(batch))] = -np.inf
+                candidates = np.arange(self._size)
+                for column, (post_id, _) in enumerate(batch):
+                    results[post_id] = self._top(candidates, scores[:, column], limit)
+        return results
+
+    def similarity(self, post_id: int, other_ids: Iterable[int]) -> Dict[int, float]:
+        """게시물 하나와 지정한 게시물들의 코사인 유사도 (벡터가 없는 게시물은 제외)"""
+        if not self.enabled:
+            return {}
+        with self._lock:
+            row = self._post_rows.get(post_id)
+            if row is None:
+                return {}
+            others = [(other_id, self._post_rows[other_id]) for other_id in other_ids if other_id in self._post_rows]
+            if not others:
+                return {}
+            scores = self._vectors[[other_row for _, other_row in others]] @ self._vectors[row]
+            return {other_id: float(score) for (other_id, _), score in zip(others, scores)}
+
+    def _top(self, rows: np.ndarray, scores: np.ndarray, limit: int) -> List[Tuple[int, float]]:
+        """점수 상위 limit개 (argpartition 후 그 안에서만 정렬) - 유사도가 0 이하인 게시물과 빈 행은 제외"""
+        count = min(limit, len(scores))
+        if count <= 0:
+            return []
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(post_id), float(score))
+            for post_id, score in zip(self._row_posts[rows[top]], scores[top])
+            if post_id >= 0 and score > 0
+        ]
+
+    def _probe_rows(self, vector: np.ndarray) -> np.ndarray:
+        """질의와 가까운 IVF 목록들의 행 번호"""
+        centroid_scores = self._centroids @ vector
+        probes = min(settings.SEMANTIC_IVF_PROBES, len(centroid_scores))
+        nearest = np.argpartition(-centroid_scores, probes - 1)[:probes]
+        arrays = []
+        for list_no in nearest:
+            array = self._list_arrays.get(int(list_no))
+            if array is None:
+                array = self._list_arrays[int(list_no)] = np.array(self._lists[list_no], dtype=np.int64)
+            arrays.append(array)
+        return np.concatenate(arrays)
+
+    # 학습 / 재구성
+
+    def prepare(self):
+        """DB의 게시물/요약 전체로 모델 학습 및 색인 재구성 (스크립트/벤치마크용, 끝날 때까지 대기)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+        self._rebuild()
+
+    def start(self):
+        """앱 시작시 백그라운드 스레드에서 색인 구성 (끝나기 전 검색은 빈 결과)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+        threading.Thread(target=self._rebuild, name="semantic-build", daemon=True).start()
+        if not self._sync_started:
+            self._sync_started = True
+            start_sync_loop("의미 검색 색인", self.sync)
+
+    # 다른 프로세스 변경 반영
+
+    def sync(self) -> int:
+        """
+        마지막 반영 이후 DB에서 바뀐 게시물을 다시 벡터화하고 삭제된 게시물을 제거
+        (같은 게시물을 이 프로세스가 이미 반영했어도 다시 계산할 뿐 결과는 같음)
+        """
+        if not self.enabled:
+            return 0
+        with self._sync_lock:
+            with self._lock:
+                model, marks = self._model, self._marks
+                if self._building or marks is None:
+                    return 0
+                known = set(self._post_rows)
+
+            if model is None:
+                # 빈 DB로 시작했는데 다른 프로세스가 게시물을 추가했으면 학습
+                with Session(engine) as db:
+                    if db.execute(select(func.count(Post.id))).scalar_one():
+                        self._maybe_refit()
+                return 0
+
+            next_marks, changed, removed = fetch_changes(marks, known)
+
+            vectors = model.embed([
+                term_frequencies(document_fields(row.title, row.content, row.search_text), model.hash_bits)
+                for row in changed
+            ])
+            with self._lock:
+                if self._model is not model:
+                    # 그 사이 다시 학습했으면 새 색인이 DB를 새로 읽었으므로 버림
+                    return 0
+                for row, vector in zip(changed, vectors):
+                    self._set_row(row.id, vector)
+                for post_id in removed:
+                    self._remove_row(post_id)
+                self._marks = next_marks
+
+        if changed or removed:
+            self._maybe_refit()
+        return len(changed) + len(removed)
+
+    def _maybe_refit(self):
+        """문서 수가 학습 당시보다 크게 늘었으면 백그라운드에서 다시 학습"""
+        growth = settings.SEMANTIC_REFIT_GROWTH
+        with self._lock:
+            documents = len(self._post_rows) + len(self._pending)
+            if self._building:
+                return
+            # 아직 학습 전이면(빈 DB로 시작) 첫 게시물부터 학습
+            if self._model is not None and (growth <= 0 or documents <= self._fitted_documents * growth):
+                return
+            self._building = True
+        threading.Thread(target=self._rebuild, name="semantic-refit", daemon=True).start()
+
+    def _rebuild(self):
+        """
+        표본으로 모델 학습 → 전체 게시물 벡터화 → 색인 교체
+        (_building이 True인 상태에서 호출, 끝나면 그동안 모인 변경을 반영)
+        """
+        started = time.perf_counter()
+        try:
+            # 학습/적재 중의 변경은 다음 동기화에서 다시 읽도록 시작 전 시각을 기준으로 함
+            with Session(engine) as db:
+                marks = read_marks(db)
+            model, documents = self._fit_from_db()
+            if model is not None:
+                index = SemanticIndex()
+                index._reset(model)
+                self._load_vectors(index)
+                index._build_ivf()
+        except Exception as e:
+            logger.error(f"의미 검색 색인 구성 실패: {str(e)}")
+            with self._lock:
+                self._building = False
+            return
+
+        with self._lock:
+            if model is not None:
+                self._model = index._model
+                self._vectors = index._vectors
+                self._row_posts = index._row_posts
+                self._post_rows = index._post_rows
+                self._free = index._free
+                self._size = index._size
+                self._centroids = index._centroids
+                self._row_lists = index._row_lists
+                self._lists = index._lists
+                self._list_arrays = index._list_arrays
+            self._fitted_documents = documents
+            self._marks = marks
+            self._building = False
+
+            pending, self._pending = self._pending, {}
+            if self._model is not None:
+                for post_id, document in pending.items():
+                    if document is None:
+                        self._remove_row(post_id)
+                    else:
+                        self._set_row(post_id, self._model.embed_text(document_fields(*document)))
+            else:
+                self._pending = {post_id: document for post_id, document in pending.items() if document}
+
+        # 색인이 없을 때 캐시된 빈 검색 결과 무효화
+        response_cache.invalidate_sync(POSTS_TAG)
+        logger.info(
+            f"의미 검색 색인 구성 완료 - 게시물 {self.document_count}건, "
+            f"{'IVF' if self.uses_ivf else '전체 비교'}, {time.perf_counter() - started:.1f}초"
+        )
+
+    def _fit_from_db(self) -> Tuple[Optional[SemanticModel], int]:
+        """게시물 ID 간격 표본(최대 SEMANTIC_FIT_SAMPLE건)으로 모델 학습"""
+        hash_bits = settings.SEMANTIC_HASH_BITS
+        with Session(engine) as db:
+            documents = db.execute(select(func.count(Post.id))).scalar_one()
+            if not documents:
+                return None, 0
+            stride = max(1, math.ceil(documents / settings.SEMANTIC_FIT_SAMPLE))
+            query = document_query()
+            if stride > 1:
+                query = query.where(Post.id % stride == 0)
+            rows = [
+                term_frequencies(document_fields(row.title, row.content, row.search_text), hash_bits)
+                for row in db.execute(query.execution_options(yield_per=1000))
+            ]
+        rows = [row for row in rows if len(row[0])]
+        if not rows:
+            return None, documents
+        return SemanticModel.fit(rows, settings.SEMANTIC_DIMENSION, hash_bits), documents
+
+    @staticmethod
+    def _load_vectors(index: "SemanticIndex", batch_size: int = 2000):
+        """전체 게시물을 배치로 벡터화해 새 색인에 채움"""
+        model = index._model
+        with Session(engine) as db:
+            result = db.execute(
+                document_query().order_by(Post.id).execution_options(yield_per=batch_size)
+            )
+            for partition in result.partitions(batch_size):
+                vectors = model.embed([
+                    term_frequencies(document_fields(row.title, row.content, row.search_text), model.hash_bits)
+                    for row in partition
+                ])
+                for row, vector in zip(partition, vectors):
+                    index._set_row(row.id, vector)
+
+    def _build_ivf(self):
+        """문서 수가 많으면 k-means(구면) 중심으로 IVF 목록 구성"""
+        mode = settings.SEMANTIC_INDEX
+        documents = len(self._post_rows)
+        if mode == "exact" or documents == 0:
+            return
+        if mode == "auto" and documents < settings.SEMANTIC_IVF_MIN_DOCS:
+            return
+
+        list_count = settings.SEMANTIC_IVF_LISTS or int(math.sqrt(documents))
+        list_count = max(1, min(list_count, documents))
+        rows = np.array(sorted(self._post_rows.values()), dtype=np.int64)
+        rng = np.random.default_rng(0)
+        sample = self._vectors[rng.choice(rows, min(len(rows), list_count * self.KMEANS_SAMPLES_PER_LIST), replace=False)]
+
+        centroids = sample[rng.choice(len(sample), list_count, replace=False)].copy()
+        for _ in range(self.KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            # 빈 목록은 표본에서 다시 뽑음
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            norms[empty] = 1
+            centroids = sums / norms
+
+        self._centroids = centroids.astype(np.float32)
+        self._lists = [[] for _ in range(list_count)]
+        self._list_arrays = {}
+        for start in range(0, len(rows), 10000):
+            chunk = rows[start:start + 10000]
+            for row, list_no in zip(chunk, np.argmax(self._vectors[chunk] @ self._centroids.T, axis=1)):
+                self._lists[list_no].append(int(row))
+                self._row_lists[row] = list_no
+
+semantic_index = SemanticIndex()
@@ -0,0 +1,359 @@
+# backend/app/services/stats_service.py
+
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import case, delete, desc, exists, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal, increment_from_select, increment_rows
+from app.models.keyword import Keyword, PostKeyword
+from app.models.post import Post, PostStatus
+from app.models.stats import KeywordDailyStat, PostDailyStat
+from app.models.summary import Summary
+from app.services.count_service import as_post_status
+from app.services.llm_service import LLMService
+from app.utils.helpers import utcnow
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+PostKey = Tuple[date, int, PostStatus]
+# (게시물 수, 요약 수, 대체 요약 수, LLM 요약 신뢰도 합계)
+StatValues = Tuple[int, int, int, float]
+PostContribution = Tuple[PostKey, StatValues]
+
+POST_COUNTERS = ("post_count", "summary_count", "fallback_count", "confidence_sum")
+
+def _as_day(value) -> date:
+    """DATE()/created_at 값 → date (SQLite는 문자열로 돌려줌)"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+def _today_query():
+    """
+    DB 기준 오늘 날짜 (CURRENT_DATE)
+    집계 날짜는 DB 세션 시간대의 created_at(server_default=now())으로 나누므로
+    앱 서버의 UTC 날짜가 아니라 같은 시간대의 날짜를 기준으로 삼아야 함
+    """
+    return select(func.current_date())
+
+class StatsService:
+    """
+    문서 통계 (post_daily_stats / keyword_daily_stats 집계 테이블)
+
+    - 통계 API는 집계 테이블만 읽으므로 posts/summaries 크기와 무관하게 빠름
+    - 증분 갱신: 쓰기 경로에서 이미 읽은 값으로 변경 전후 기여분의 차이만 더함
+          before = stats_service.contribution(post.created_at, post.category_id, post.status, post.summary)
+          ... 게시물/요약 변경 ...
+          stats_service.apply_posts(db, [before], [stats_service.contribution(...)])
+      키워드 집계는 post_keywords를 바꾸기 전후에 apply_keywords(-1/+1)로 반영 (INSERT ... SELECT)
+      게시물 쓰기와 같은 트랜잭션이라 롤백되면 통계도 함께 롤백됨.
+      수정/요약 저장은 게시물 행을 잠그고(SELECT ... FOR UPDATE) 읽으므로 동시에 바뀐 값을 기준으로 삼지 않음
+    - 정리 작업(compact): 최근 STATS_COMPACTION_DAYS일을 원본에서 다시 계산하고
+      값이 0이 된 행을 삭제 (대량 적재 등 증분 경로를 거치지 않은 쓰기와 누적 오차 보정)
+    - 전체 재계산(rebuild): 집계 테이블이 비어 있으면 앱 시작시, 대량 적재 후 스크립트에서 실행
+    """
+
+    def __init__(self, compaction_seconds: float, compaction_days: int):
+        self.compaction_seconds = compaction_seconds
+        self.compaction_days = compaction_days
+        self.last_compacted_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # 증분 갱신 (커밋은 호출하는 쪽에서 수행)
+    # ------------------------------------------------------------------
+
+    def contribution(self, created_at, category_id: int, status, summary=None) -> PostContribution:
+        """게시물 하나가 post_daily_stats에 기여하는 값 (summary: 요약 행 또는 None)"""
+        values: StatValues = (1, 0, 0, 0.0)
+        if summary is not None:
+            if summary.model_version == LLMService.FALLBACK_MODEL:
+                values = (1, 1, 1, 0.0)
+            else:
+                values = (1, 1, 0, summary.confidence_score or 0.0)
+        return (_as_day(created_at), category_id, as_post_status(status)), values
+
+    def apply_posts(
+        self, db: Session, removed: Iterable[PostContribution] = (), added: Iterable[PostContribution] = ()
+    ):
+        """removed 기여분을 빼고 added 기여분을 더함 (키가 같으면 합쳐서 upsert 한 번)"""
+        totals: Dict[PostKey, List] = {}
+        for sign, contributions in ((-1, removed), (1, added)):
+            for key, values in contributions:
+                total = totals.setdefault(key, [0, 0, 0, 0.0])
+                for index, value in enumerate(values):
+                    total[index] += sign * value
+
+        rows = [
+            {"day": day, "category_id": category_id, "status": status, **dict(zip(POST_COUNTERS, total))}
+            for (day, category_id, status), total in totals.items()
+            if any(total)
+        ]
+        increment_rows(db, PostDailyStat.__table__, rows, ["day", "category_id", "status"], POST_COUNTERS)
+
+    def add_new_posts(self, db: Session, post_ids: List[int]):
+        """
+        방금 INSERT한 게시물(요약 없음)의 기여분을 더함
+        작성일은 DB 기본값(created_at)이므로 posts에서 바로 INSERT ... SELECT로 집계합니다.
+        """
+        if not post_ids:
+            return
+        day = func.date(Post.created_at)
+        increment_from_select(
+            db, PostDailyStat.__table__, ["day", "category_id", "status", *POST_COUNTERS],
+            select(day, Post.category_id, Post.status, func.count(), literal(0), literal(0), literal(0.0))
+            .where(Post.id.in_(post_ids))
+            .group_by(day, Post.category_id, Post.status),
+            ["day", "category_id", "status"], POST_COUNTERS
+        )
+
+    def apply_keywords(self, db: Session, post_ids: List[int], sign: int):
+        """
+        게시물들의 현재 post_keywords 행을 keyword_daily_stats에 sign(+1/-1)만큼 반영 (INSERT ... SELECT)
+        키워드/카테고리를 바꾸기 전에 -1, 바꾼 뒤에 +1로 호출합니다.
+        """
+        if not post_ids:
+            return
+        day = func.date(Post.created_at)
+        increment_from_select(
+            db, KeywordDailyStat.__table__, ["day", "category_id", "keyword_id", "post_count"],
+            select(day, PostKeyword.category_id, PostKeyword.keyword_id, func.count() * sign)
+            .join(Post, Post.id == PostKeyword.post_id)
+            .where(PostKeyword.post_id.in_(post_ids))
+            .group_by(day, PostKeyword.category_id, PostKeyword.keyword_id),
+            ["day", "category_id", "keyword_id"], ["post_count"]
+        )
+
+    # ------------------------------------------------------------------
+    # 재계산 / 정리
+    # ------------------------------------------------------------------
+
+    def rebuild(self, since: Optional[date] = None) -> int:
+        """
+        원본(posts/summaries/post_keywords)에서 집계 다시 계산 - since부터 (생략하면 전체)
+        계산한 post_daily_stats 행 수 반환
+        """
+        with SessionLocal() as db:
+            day = func.date(Post.created_at)
+            conditions = []
+            if since is not None:
+                conditions.append(Post.created_at >= datetime.combine(since, dtime.min))
+
+            is_fallback = Summary.model_version == LLMService.FALLBACK_MODEL
+            post_rows = [
+                {
+                    "day": _as_day(row_day), "category_id": category_id, "status": as_post_status(status),
+                    "post_count": post_count, "summary_count": summary_count,
+                    "fallback_count": fallback_count or 0, "confidence_sum": confidence_sum or 0.0
+                }
+                for row_day, category_id, status, post_count, summary_count, fallback_count, confidence_sum
+                in db.execute(
+                    select(
+                        day, Post.category_id, Post.status,
+                        func.count(Post.id),
+                        func.count(Summary.id),
+                        func.sum(case((is_fallback, 1), else_=0)),
+                        func.sum(case((is_fallback, 0), else_=func.coalesce(Summary.confidence_score, 0.0)))
+                    )
+                    .outerjoin(Summary, Summary.post_id == Post.id)
+                    .where(*conditions)
+                    .group_by(day, Post.category_id, Post.status)
+                )
+            ]
+            keyword_rows = [
+                {"day": _as_day(row_day), "category_id": category_id, "keyword_id": keyword_id, "post_count": count}
+                for row_day, category_id, keyword_id, count in db.execute(
+                    select(day, Post.category_id, PostKeyword.keyword_id, func.count())
+                    .join(Post, Post.id == PostKeyword.post_id)
+                    .where(*conditions)
+                    .group_by(day, Post.category_id, PostKeyword.keyword_id)
+                )
+            ]
+
+            if since is None:
+                db.execute(delete(PostDailyStat))
+                db.execute(delete(KeywordDailyStat))
+            else:
+                db.execute(delete(PostDailyStat).where(PostDailyStat.day >= since))
+                db.execute(delete(KeywordDailyStat).where(KeywordDailyStat.day >= since))
+            if post_rows:
+                db.execute(PostDailyStat.__table__.insert(), post_rows)
+            if keyword_rows:
+                db.execute(KeywordDailyStat.__table__.insert(), keyword_rows)
+            db.commit()
+        return len(post_rows)
+
+    def compact(self) -> int:
+        """
+        최근 기간 재계산 + 0이 된 행 삭제 (정리 작업)
+        재계산 도중 커밋된 다른 쓰기는 다음 정리 때 반영됩니다.
+        """
+        with SessionLocal() as db:
+            today = _as_day(db.execute(_today_query()).scalar_one())
+        rows = self.rebuild(since=today - timedelta(days=self.compaction_days))
+        with SessionLocal() as db:
+            db.execute(delete(PostDailyStat).where(
+                PostDailyStat.post_count == 0,
+                PostDailyStat.summary_count == 0,
+                PostDailyStat.fallback_count == 0
+            ))
+            db.execute(delete(KeywordDailyStat).where(KeywordDailyStat.post_count == 0))
+            db.commit()
+        self.last_compacted_at = utcnow()
+        return rows
+
+    def rebuild_if_empty(self) -> int:
+        """집계 테이블이 비어 있는데 게시물이 있으면 전체 계산 (테이블을 새로 만든 경우)"""
+        with SessionLocal() as db:
+            built = db.execute(select(exists().where(PostDailyStat.post_count.is_not(None)))).scalar()
+            has_posts = db.execute(select(exists().where(Post.id.is_not(None)))).scalar()
+        if built or not has_posts:
+            return 0
+        rows = self.rebuild()
+        logger.info(f"통계 집계 전체 계산 완료 - {rows}행")
+        return rows
+
+    # ------------------------------------------------------------------
+    # 조회 (집계 테이블만 사용)
+    # ------------------------------------------------------------------
+
+    async def overview(
+        self, db: AsyncSession, days: int = 30, category_id: Optional[int] = None, keyword_limit: int = 10
+    ) -> Dict:
+        """
+        전체 합계, 상태별/카테고리별 합계, 최근 days일 일별 추이, 키워드 추이
+        (키워드는 최근 days일과 그 직전 days일의 게시물 수 비교)
+        """
+        conditions = [PostDailyStat.category_id == category_id] if category_id is not None else []
+        sums = (
+            func.sum(PostDailyStat.post_count), func.sum(PostDailyStat.summary_count),
+            func.sum(PostDailyStat.fallback_count), func.sum(PostDailyStat.confidence_sum)
+        )
+
+        by_group = (await db.execute(
+            select(PostDailyStat.category_id, PostDailyStat.status, *sums)
+            .where(*conditions)
+            .group_by(PostDailyStat.category_id, PostDailyStat.status)
+        )).all()
+
+        totals = [0, 0, 0, 0.0]
+        by_status = {status.value: 0 for status in PostStatus}
+        by_category: Dict[int, List] = {}
+        for group_category_id, status, *values in by_group:
+            by_status[as_post_status(status).value] += values[0] or 0
+            category_values = by_category.setdefault(group_category_id, [0, 0, 0, 0.0])
+            for index, value in enumerate(values):
+                totals[index] += value or 0
+                category_values[index] += value or 0
+
+        today = _as_day((await db.execute(_today_query())).scalar_one())
+        since = today - timedelta(days=days - 1)
+        daily_values = {
+            _as_day(row_day): values
+            for row_day, *values in (await db.execute(
+                select(PostDailyStat.day, *sums)
+                .where(PostDailyStat.day >= since, *conditions)
+                .group_by(PostDailyStat.day)
+            )).all()
+        }
+        daily = [
+            {"day": since + timedelta(days=offset), **_metrics(daily_values.get(since + timedelta(days=offset)))}
+            for offset in range(days)
+        ]
+
+        return {
+            "category_id": category_id,
+            "days": days,
+            "totals": _metrics(totals),
+            "by_status": by_status,
+            "by_category": [
+                {"category_id": group_category_id, **_metrics(values)}
+                for group_category_id, values in sorted(by_category.items())
+            ],
+            "daily": daily,
+            "keywords": await self._keyword_trends(db, since, days, category_id, keyword_limit),
+            "compacted_at": self.last_compacted_at
+        }
+
+    async def _keyword_trends(
+        self, db: AsyncSession, since: date, days: int, category_id: Optional[int], limit: int
+    ) -> List[Dict]:
+        conditions = [KeywordDailyStat.category_id == category_id] if category_id is not None else []
+        total = func.sum(KeywordDailyStat.post_count).label("post_count")
+        current = (await db.execute(
+            select(KeywordDailyStat.keyword_id, total)
+            .where(KeywordDailyStat.day >= since, *conditions)
+            .group_by(KeywordDailyStat.keyword_id)
+            .having(total > 0)
+            .order_by(desc("post_count"), KeywordDailyStat.keyword_id)
+            .limit(limit)
+        )).all()
+        if not current:
+            return []
+
+        keyword_ids = [keyword_id for keyword_id, _ in current]
+        previous = dict((await db.execute(
+            select(KeywordDailyStat.keyword_id, func.sum(KeywordDailyStat.post_count))
+            .where(
+                KeywordDailyStat.day >= since - timedelta(days=days),
+                KeywordDailyStat.day < since,
+                KeywordDailyStat.keyword_id.in_(keyword_ids),
+                *conditions
+            )
+            .group_by(KeywordDailyStat.keyword_id)
+        )).all())
+        names = dict((await db.execute(
+            select(Keyword.id, Keyword.name).where(Keyword.id.in_(keyword_ids))
+        )).all())
+        return [
+            {"keyword": names.get(keyword_id, ""), "post_count": count, "previous_count": previous.get(keyword_id) or 0}
+            for keyword_id, count in current
+        ]
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """비어 있으면 전체 계산 후 주기적 정리 시작 (앱 시작시 호출)"""
+        await asyncio.to_thread(self.rebuild_if_empty)
+        if self.compaction_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self._compaction_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _compaction_loop(self):
+        while True:
+            await asyncio.sleep(self.compaction_seconds)
+            try:
+                rows = await asyncio.to_thread(self.compact)
+                logger.info(f"통계 집계 정리 완료 - 최근 {self.compaction_days}일 {rows}행 재계산")
+            except Exception as e:
+                logger.error(f"통계 집계 정리 실패: {str(e)}")
+
+def _metrics(values: Optional[List]) -> Dict:
+    """(게시물 수, 요약 수, 대체 요약 수, 신뢰도 합계) → 응답 항목"""
+    post_count, summary_count, fallback_count, confidence_sum = [value or 0 for value in (values or (0, 0, 0, 0.0))]
+    llm_summaries = summary_count - fallback_count
+    return {
+        "posts": post_count,
+        "summaries": summary_count,
+        "fallback_summaries": fallback_count,
+        "fallback_rate": round(fallback_count / summary_count, 4) if summary_count else 0.0,
+        "avg_confidence": round(confidence_sum / llm_summaries, 2) if llm_summaries else None
+    }
+
+stats_service = StatsService(
+    compaction_seconds=settings.STATS_COMPACTION_INTERVAL_SECONDS,
+    compaction_days=settings.STATS_COMPACTION_DAYS
+)
@@ -0,0 +1,188 @@
+# backend/app/services/summary_cache.py
+
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+from sqlalchemy import delete, select
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.summary_cache import SummaryCacheEntry
+from app.utils.helpers import utcnow
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class SummaryCache:
+    """
+    내용 주소 기반 요약 캐시
+
+    키는 (제목, 내용, 카테고리, 프롬프트 버전, 모델)의 SHA-256 해시입니다.
+    - 1계층: 프로세스 내 LRU (크기/TTL 제한)
+    - 2계층: summary_cache 테이블 (TTL/최대 행 수 제한)
+    """
+
+    PURGE_EVERY_WRITES = 500
+
+    def __init__(self, max_size: int, ttl_seconds: int, persist: bool):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._writes = 0
+
+        # 적중/실패 카운터
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(title: str, content: str, category: str, prompt_version: str, model: str) -> str:
+        """요약 입력으로부터 캐시 키 생성"""
+        raw = json.dumps(
+            [title, content, category, prompt_version, model],
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 (메모리 → DB 순서)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(value)
+            del self._entries[key]
+
+        if self.persist:
+            try:
+                value = await asyncio.to_thread(self._db_get, key)
+            except Exception as e:
+                logger.error(f"요약 캐시 DB 조회 실패: {str(e)}")
+                value = None
+            if value is not None:
+                self.db_hits += 1
+                self._remember(key, value)
+                return copy.deepcopy(value)
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Dict):
+        """캐시 저장 (메모리 + DB)"""
+        value = copy.deepcopy(value)
+        self._remember(key, value)
+
+        if self.persist:
+            try:
+                await asyncio.to_thread(self._db_set, key, value)
+                self._writes += 1
+                if self._writes % self.PURGE_EVERY_WRITES == 0:
+                    await self.purge_expired()
+            except Exception as e:
+                logger.error(f"요약 캐시 DB 저장 실패: {str(e)}")
+
+    def _remember(self, key: str, value: Dict):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _db_get(self, key: str) -> Optional[Dict]:
+        with SessionLocal() as db:
+            entry = db.execute(
+                select(SummaryCacheEntry).where(SummaryCacheEntry.cache_key == key)
+            ).scalar_one_or_none()
+            if entry is None:
+                return None
+            if entry.expires_at <= utcnow():
+                return None
+            return entry.payload
+
+    def _db_set(self, key: str, value: Dict):
+        expires_at = utcnow() + timedelta(seconds=self.ttl_seconds)
+        with SessionLocal() as db:
+            entry = db.execute(
+                select(SummaryCacheEntry).where(SummaryCacheEntry.cache_key == key)
+            ).scalar_one_or_none()
+            if entry:
+                entry.payload = value
+                entry.model_version = value.get("model_version")
+                entry.expires_at = expires_at
+            else:
+                db.add(SummaryCacheEntry(
+                    cache_key=key,
+                    payload=value,
+                    model_version=value.get("model_version"),
+                    expires_at=expires_at
+                ))
+            db.commit()
+
+    async def purge_expired(self):
+        """만료된 DB 항목 및 최대 행 수 초과분 삭제"""
+        if not self.persist:
+            return
+        try:
+            removed = await asyncio.to_thread(self._db_purge)
+            if removed:
+                logger.info(f"요약 캐시 정리 - {removed}건 삭제")
+        except Exception as e:
+            logger.error(f"요약 캐시 정리 실패: {str(e)}")
+
+    def _db_purge(self) -> int:
+        with SessionLocal() as db:
+            removed = db.execute(
+                delete(SummaryCacheEntry).where(
+                    SummaryCacheEntry.expires_at <= utcnow()
+                )
+            ).rowcount
+
+            # 최대 행 수 초과시 만료 임박 순으로 삭제
+            cutoff = db.execute(
+                select(SummaryCacheEntry.expires_at)
+                .order_by(SummaryCacheEntry.expires_at.desc())
+                .offset(settings.SUMMARY_CACHE_DB_MAX_ROWS)
+                .limit(1)
+            ).scalar_one_or_none()
+            if cutoff is not None:
+                removed += db.execute(
+                    delete(SummaryCacheEntry).where(SummaryCacheEntry.expires_at <= cutoff)
+                ).rowcount
+
+            db.commit()
+            return removed
+
+    def stats(self) -> Dict:
+        """적중/실패 통계"""
+        hits = self.memory_hits + self.db_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "memory_size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "persist": self.persist
+        }
+
+    def clear(self):
+        """메모리 계층 비우기"""
+        self._entries.clear()
+
+summary_cache = SummaryCache(
+    max_size=settings.SUMMARY_CACHE_MAX_SIZE,
+    ttl_seconds=settings.SUMMARY_CACHE_TTL_SECONDS,
+    persist=settings.SUMMARY_CACHE_PERSIST
+)
@@ -0,0 +1,399 @@
+# backend/app/services/summary_worker.py
+
+from datetime import timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.post import Post, SummaryStatus
+from app.models.summary_job import SummaryJob, JobStatus
+from app.services.category_registry import category_registry
+from app.services.llm_scheduler import LLMPriority
+from app.services.llm_service import llm_service
+from app.utils.helpers import utcnow
+import asyncio
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+class SummaryWorkerPool:
+    """
+    백그라운드 요약 작업 큐 + asyncio 워커 풀
+
+    - 작업은 summary_jobs 테이블에 저장되며 게시물 저장과 같은 트랜잭션으로 커밋됩니다.
+    - 워커는 실행 가능한 작업을 조건부 UPDATE로 선점한 뒤 LLM 요약을 생성합니다.
+      (DB 세션은 LLM 호출 동안 잡고 있지 않습니다)
+    - 실패시 지수 백오프로 재시도하고, 마지막 시도는 대체 요약을 저장한 뒤
+      게시물 요약 상태를 failed로 표시합니다.
+    - 처리 중인 작업은 heartbeat_at을 주기적으로 갱신하고(임대), SUMMARY_JOB_LEASE_SECONDS 동안
+      갱신이 없는 작업만 중단된 것으로 보고 다시 대기 상태로 돌림 (다른 프로세스가 처리 중인 작업은 그대로)
+    """
+
+    def __init__(self):
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+        self._post_waiters: Dict[int, asyncio.Event] = {}
+        self._post_waiter_counts: Dict[int, int] = {}
+        self._last_recovery = 0.0
+
+    # ------------------------------------------------------------------
+    # 작업 등록
+    # ------------------------------------------------------------------
+
+    def enqueue(self, db: Session, post: Post, force_refresh: bool = False) -> SummaryJob:
+        """
+        요약 작업 등록 (커밋은 호출하는 쪽에서 수행)
+        같은 게시물의 대기/처리 중인 작업은 최신 작업으로 대체됩니다.
+        (처리 중이던 작업의 결과는 저장되지 않음)
+        """
+        db.execute(
+            update(SummaryJob)
+            .where(
+                SummaryJob.post_id == post.id,
+                SummaryJob.status.in_([JobStatus.PENDING, JobStatus.RUNNING])
+            )
+            .values(status=JobStatus.FAILED, last_error="새 작업으로 대체됨", finished_at=utcnow())
+        )
+        job = SummaryJob(
+            post_id=post.id,
+            status=JobStatus.PENDING,
+            force_refresh=force_refresh,
+            max_attempts=settings.SUMMARY_JOB_MAX_ATTEMPTS,
+            run_after=utcnow()
+        )
+        db.add(job)
+        post.summary_status = SummaryStatus.PENDING
+        return job
+
+    def enqueue_many(self, db: Session, post_ids: List[int]):
+        """
+        새로 생성된 게시물들의 요약 작업을 한 번에 등록 (커밋은 호출하는 쪽에서 수행)
+        기존 작업이 없는 게시물 전용이므로 대체 처리는 하지 않습니다.
+        """
+        if not post_ids:
+            return
+        now = utcnow()
+        db.execute(insert(SummaryJob), [
+            {
+                "post_id": post_id,
+                "status": JobStatus.PENDING,
+                "force_refresh": False,
+                "attempts": 0,
+                "max_attempts": settings.SUMMARY_JOB_MAX_ATTEMPTS,
+                "run_after": now
+            }
+            for post_id in post_ids
+        ])
+
+    def notify(self):
+        """커밋 이후 호출 - 대기 중인 워커를 깨움"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # 워커 수명 주기
+    # ------------------------------------------------------------------
+
+    async def start(self, worker_count: int):
+        """워커 시작 (앱 시작시 호출)"""
+        if self._running:
+            return
+        self._running = True
+        self._wakeup = asyncio.Event()
+
+        # 이전 프로세스가 처리하다 중단된 작업을 다시 대기 상태로
+        await self._recover_stale_jobs()
+
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(worker_id))
+            for worker_id in range(worker_count)
+        ]
+        logger.info(f"요약 워커 {worker_count}개 시작")
+
+    async def stop(self):
+        """워커 종료 (앱 종료시 호출)"""
+        if not self._running:
+            return
+        self._running = False
+        self.notify()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._wakeup = None
+        logger.info("요약 워커 종료")
+
+    async def _worker_loop(self, worker_id: int):
+        while self._running:
+            self._wakeup.clear()
+            try:
+                job = await asyncio.to_thread(self._claim_next_job)
+            except Exception as e:
+                logger.error(f"요약 작업 조회 실패 (worker {worker_id}): {str(e)}")
+                job = None
+
+            if job is None:
+                # 다른 프로세스가 처리하다 중단된 작업은 한가할 때 임대 시간마다 확인
+                if time.monotonic() - self._last_recovery >= settings.SUMMARY_JOB_LEASE_SECONDS:
+                    try:
+                        await self._recover_stale_jobs()
+                    except Exception as e:
+                        logger.error(f"중단된 요약 작업 복구 실패: {str(e)}")
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=settings.SUMMARY_WORKER_POLL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heartbeat = asyncio.create_task(self._heartbeat(job["id"]))
+            try:
+                await self._process(job)
+            except Exception as e:
+                logger.error(f"요약 작업 처리 중 오류 - 작업 {job['id']}: {str(e)}")
+            finally:
+                heartbeat.cancel()
+
+    async def _heartbeat(self, job_id: int):
+        """처리하는 동안 임대 갱신 (LLM 호출이 임대 시간보다 길어져도 다른 프로세스가 가져가지 않도록)"""
+        interval = settings.SUMMARY_JOB_LEASE_SECONDS / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self._touch_job, job_id)
+            except Exception as e:
+                logger.warning(f"요약 작업 임대 갱신 실패 - 작업 {job_id}: {str(e)}")
+
+    async def _recover_stale_jobs(self):
+        self._last_recovery = time.monotonic()
+        recovered = await asyncio.to_thread(self._recover_running_jobs)
+        if recovered:
+            logger.info(f"중단된 요약 작업 {recovered}건 복구")
+
+    # ------------------------------------------------------------------
+    # 작업 처리
+    # ------------------------------------------------------------------
+
+    async def _process(self, job: Dict):
+        post_id = job["post_id"]
+        if job["post"] is None:
+            await self._finish(job, None, "게시물이 존재하지 않습니다.")
+            return
+
+        # 마지막 시도에서는 실패 대신 대체 요약을 받음
+        last_attempt = job["attempts"] >= job["max_attempts"]
+        try:
+            summary_data = await llm_service.generate_summary(
+                title=job["post"]["title"],
+                content=job["post"]["content"],
+                category=job["post"]["category"],
+                use_cache=not job["force_refresh"],
+                fallback=last_attempt,
+                priority=LLMPriority.BACKGROUND
+            )
+        except Exception as e:
+            delay = _backoff_delay(job["attempts"])
+            logger.warning(
+                f"게시물 {post_id} 요약 실패 ({job['attempts']}/{job['max_attempts']}), "
+                f"{delay:.1f}초 후 재시도: {str(e)}"
+            )
+            await asyncio.to_thread(self._retry_job, job, delay, str(e))
+            return
+
+        if await self._finish(job, summary_data, None):
+            logger.info(f"게시물 {post_id} 요약 작업 완료 - 작업 {job['id']}")
+
+    async def _finish(self, job: Dict, summary_data: Optional[Dict], error: Optional[str]) -> bool:
+        """
+        결과 저장 (실패하면 - 행 잠금 대기 시간 초과, DB 오류 등 - 롤백 후 백오프 재시도,
+        시도 횟수를 다 썼으면 작업/게시물을 실패로 표시). 성공 여부 반환
+        어느 경우든 대기 중인 롱 폴링 요청은 깨움
+        """
+        try:
+            await asyncio.to_thread(self._finish_job, job, summary_data, error)
+            return True
+        except Exception as e:
+            if job["attempts"] < job["max_attempts"]:
+                delay = _backoff_delay(job["attempts"])
+                logger.error(
+                    f"게시물 {job['post_id']} 요약 저장 실패 ({job['attempts']}/{job['max_attempts']}), "
+                    f"{delay:.1f}초 후 재시도: {str(e)}"
+                )
+                await asyncio.to_thread(self._retry_job, job, delay, str(e))
+            else:
+                logger.error(f"게시물 {job['post_id']} 요약 저장 실패 - 작업 {job['id']} 실패 처리: {str(e)}")
+                await asyncio.to_thread(self._fail_job, job, str(e))
+            return False
+        finally:
+            self._wake_post_waiters(job["post_id"])
+
+    def _claim_next_job(self) -> Optional[Dict]:
+        """실행 가능한 작업 하나를 선점하고 요약에 필요한 게시물 정보를 함께 반환"""
+        with SessionLocal() as db:
+            candidates = db.execute(
+                select(SummaryJob.id)
+                .where(SummaryJob.status == JobStatus.PENDING, SummaryJob.run_after <= utcnow())
+                .order_by(SummaryJob.run_after, SummaryJob.id)
+                .limit(5)
+            ).scalars().all()
+
+            for job_id in candidates:
+                # 다른 워커/프로세스와 경쟁하므로 조건부 UPDATE로 선점
+                claimed = db.execute(
+                    update(SummaryJob)
+                    .where(SummaryJob.id == job_id, SummaryJob.status == JobStatus.PENDING)
+                    .values(status=JobStatus.RUNNING, attempts=SummaryJob.attempts + 1, heartbeat_at=utcnow())
+                ).rowcount
+                db.commit()
+                if not claimed:
+                    continue
+
+                job = db.get(SummaryJob, job_id)
+                row = db.execute(
+                    select(Post.title, Post.content, Post.category_id)
+                    .where(Post.id == job.post_id)
+                ).first()
+                return {
+                    "id": job.id,
+                    "post_id": job.post_id,
+                    "attempts": job.attempts,
+                    "max_attempts": job.max_attempts,
+                    "force_refresh": job.force_refresh,
+                    "post": {
+                        "title": row.title,
+                        "content": row.content,
+                        "category": category_registry.name_of(row.category_id)
+                    } if row else None
+                }
+        return None
+
+    def _retry_job(self, job: Dict, delay: float, error: str):
+        with SessionLocal() as db:
+            db.execute(
+                update(SummaryJob)
+                .where(SummaryJob.id == job["id"], SummaryJob.status == JobStatus.RUNNING)
+                .values(
+                    status=JobStatus.PENDING,
+                    last_error=error[:2000],
+                    run_after=utcnow() + timedelta(seconds=delay)
+                )
+            )
+            db.commit()
+
+    def _fail_job(self, job: Dict, error: str):
+        """결과를 저장하지 못한 마지막 시도 - 작업과 게시물 요약 상태를 실패로"""
+        with SessionLocal() as db:
+            failed = db.execute(
+                update(SummaryJob)
+                .where(SummaryJob.id == job["id"], SummaryJob.status == JobStatus.RUNNING)
+                .values(status=JobStatus.FAILED, last_error=error[:2000], finished_at=utcnow())
+            ).rowcount
+            # 새 작업으로 대체되었으면 게시물 상태는 새 작업이 정함
+            if failed:
+                db.execute(
+                    update(Post)
+                    .where(Post.id == job["post_id"])
+                    .values(summary_status=SummaryStatus.FAILED)
+                )
+            db.commit()
+
+    def _finish_job(self, job: Dict, summary_data: Optional[Dict], error: Optional[str]):
+        from app.services.post_service import PostService
+
+        with SessionLocal() as db:
+            db_job = db.get(SummaryJob, job["id"])
+            post = db.get(Post, job["post_id"])
+
+            # 처리 중에 새 작업으로 대체되었으면 결과를 버림
+            superseded = db_job is None or db_job.status != JobStatus.RUNNING
+            if not superseded:
+                saved = None
+                if post is not None and summary_data is not None:
+                    summary = PostService.save_summary(db, post, summary_data)
+                    # 커밋 후 색인에 반영할 값 (커밋하면 ORM 객체가 만료됨)
+                    saved = (post.id, post.title, post.content, summary.search_text)
+                    failed = llm_service.is_fallback(summary_data)
+                else:
+                    failed = True
+                db_job.status = JobStatus.FAILED if failed else JobStatus.DONE
+                db_job.last_error = error or ("대체 요약 사용" if failed else None)
+                db_job.finished_at = utcnow()
+                db.commit()
+                if saved is not None:
+                    PostService.summary_saved(*saved)
+
+    def _touch_job(self, job_id: int):
+        with SessionLocal() as db:
+            db.execute(
+                update(SummaryJob)
+                .where(SummaryJob.id == job_id, SummaryJob.status == JobStatus.RUNNING)
+                .values(heartbeat_at=utcnow())
+            )
+            db.commit()
+
+    def _recover_running_jobs(self) -> int:
+        """임대 시간이 지나도록 heartbeat가 없는 처리 중 작업을 대기 상태로 (heartbeat_at 도입 전 작업 포함)"""
+        stale_before = utcnow() - timedelta(seconds=settings.SUMMARY_JOB_LEASE_SECONDS)
+        with SessionLocal() as db:
+            recovered = db.execute(
+                update(SummaryJob)
+                .where(
+                    SummaryJob.status == JobStatus.RUNNING,
+                    or_(SummaryJob.heartbeat_at.is_(None), SummaryJob.heartbeat_at < stale_before)
+                )
+                .values(status=JobStatus.PENDING, run_after=utcnow())
+            ).rowcount
+            db.commit()
+            return recovered
+
+    # ------------------------------------------------------------------
+    # 상태 조회
+    # ------------------------------------------------------------------
+
+    def get_latest_job(self, db: Session, post_id: int) -> Optional[SummaryJob]:
+        """게시물의 가장 최근 요약 작업"""
+        return db.query(SummaryJob).filter(
+            SummaryJob.post_id == post_id
+        ).order_by(SummaryJob.id.desc()).first()
+
+    async def wait_for_post(self, post_id: int, timeout: float):
+        """
+        게시물의 요약 작업이 끝날 때까지 대기 (롱 폴링)
+        다른 프로세스에서 처리된 작업은 timeout 이후 상태 조회로 확인됩니다.
+        """
+        event = self._post_waiters.get(post_id)
+        if event is None:
+            event = asyncio.Event()
+            self._post_waiters[post_id] = event
+        self._post_waiter_counts[post_id] = self._post_waiter_counts.get(post_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # 깨우지 않고 끝난 경우(시간 초과/취소) 마지막 대기자가 이벤트를 정리
+            if self._post_waiters.get(post_id) is event:
+                remaining = self._post_waiter_counts[post_id] - 1
+                if remaining:
+                    self._post_waiter_counts[post_id] = remaining
+                else:
+                    del self._post_waiters[post_id]
+                    del self._post_waiter_counts[post_id]
+
+    def _wake_post_waiters(self, post_id: int):
+        self._post_waiter_counts.pop(post_id, None)
+        event = self._post_waiters.pop(post_id, None)
+        if event is not None:
+            event.set()
+
+def _backoff_delay(attempts: int) -> float:
+    """지수 백오프 + 지터"""
+    base = settings.SUMMARY_JOB_BACKOFF_SECONDS * (2 ** max(0, attempts - 1))
+    return min(base, settings.SUMMARY_JOB_BACKOFF_MAX_SECONDS) * random.uniform(0.8, 1.2)
+
+summary_worker = SummaryWorkerPool()
@@ -0,0 +1,118 @@
+# backend/app/utils/chunking.py
+
+from typing import List, Tuple
+import re
+import zlib
+
+# 문장 끝 (마침표/물음표/느낌표 + 공백, 또는 줄바꿈)
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+# 조각 경계 판정에 쓰는 문단 앞부분 길이와 가장 긴 경계 주기
+BOUNDARY_PREFIX_CHARS = 64
+MAX_BOUNDARY_PERIOD = 1 << 16
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (토크나이저 없이)
+    영문/숫자는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+def split_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """
+    문단 → 문장 경계 순서로 텍스트를 나눠 max_tokens 이하 조각들로 묶음
+
+    조각 경계는 내용으로 정합니다 (content-defined chunking).
+    문단 앞부분 해시가 주기(2의 거듭제곱)의 배수인 문단 뒤를 경계 후보로 두고,
+    가장 긴 주기에서 시작해 예산을 넘는 구간만 주기를 절반으로 줄여 다시 나눕니다 (주기 1이면 문단마다).
+    경계가 다른 문단의 길이나 문서 전체 통계에 좌우되지 않으므로, 한 문단을 고치거나 늘려도
+    그 문단이 속한 조각만 바뀌고 나머지 조각(과 부분 요약 캐시 키)은 그대로입니다.
+    (문단 앞부분을 고쳐 해시가 바뀌거나 문단이 줄어 구간이 합쳐지면 이웃 조각 하나가 함께 바뀔 수 있음)
+    예산보다 긴 문단은 문장 단위로, 예산보다 긴 문장은 글자 수 기준으로 자릅니다.
+    """
+    paragraphs = []
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if paragraph:
+            paragraphs.append((paragraph, estimate_tokens(paragraph), paragraph_fingerprint(paragraph)))
+
+    chunks: List[str] = []
+    _pack_segment(paragraphs, MAX_BOUNDARY_PERIOD, max_tokens, chunks)
+    return chunks
+
+def _split_at_boundaries(paragraphs: List[Tuple[str, int, int]], period: int) -> List[List[Tuple[str, int, int]]]:
+    """해시가 period의 배수인 문단 뒤에서 자른 구간들"""
+    segments = []
+    current = []
+    for paragraph in paragraphs:
+        current.append(paragraph)
+        if paragraph[2] % period == 0:
+            segments.append(current)
+            current = []
+    if current:
+        segments.append(current)
+    return segments
+
+def _pack_segment(segment: List[Tuple[str, int, int]], period: int, max_tokens: int, chunks: List[str]):
+    """구간이 예산 안이면 한 조각으로, 넘으면 주기를 절반으로 줄인 경계로 나눠 조각 추가"""
+    if not segment:
+        return
+    if len(segment) == 1 and segment[0][1] > max_tokens:
+        chunks.extend(_split_paragraph(segment[0][0], max_tokens))
+        return
+    if sum(tokens for _, tokens, _ in segment) <= max_tokens:
+        chunks.append("\n\n".join(paragraph for paragraph, _, _ in segment))
+        return
+    period = max(1, period // 2)
+    for part in _split_at_boundaries(segment, period):
+        _pack_segment(part, period, max_tokens, chunks)
+
+def paragraph_fingerprint(paragraph: str) -> int:
+    """
+    경계 판정용 문단 해시 (프로세스와 무관하게 같은 값)
+    문단 앞부분만 사용하므로 문단 뒤쪽을 고치거나 덧붙여도 경계가 유지됩니다.
+    """
+    head = " ".join(paragraph[:BOUNDARY_PREFIX_CHARS].split())
+    return zlib.crc32(head.encode("utf-8"))
+
+def _split_paragraph(paragraph: str, max_tokens: int) -> List[str]:
+    """예산보다 긴 문단을 문장 단위로 분할"""
+    pieces: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for sentence in _SENTENCE_END.split(paragraph):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        for part in _split_hard(sentence, max_tokens):
+            tokens = estimate_tokens(part) + 1  # 문장 사이 공백
+            if current and current_tokens + tokens > max_tokens:
+                pieces.append(" ".join(current))
+                current = []
+                current_tokens = 0
+            current.append(part)
+            current_tokens += tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+def _split_hard(sentence: str, max_tokens: int) -> List[str]:
+    """예산보다 긴 문장을 글자 수 기준으로 분할"""
+    if estimate_tokens(sentence) <= max_tokens:
+        return [sentence]
+    parts = []
+    start = 0
+    ascii_chars = other_chars = 0
+    for index, ch in enumerate(sentence):
+        if ord(ch) < 128:
+            ascii_chars += 1
+        else:
+            other_chars += 1
+        if (ascii_chars + 3) // 4 + other_chars > max_tokens:
+            parts.append(sentence[start:index])
+            start = index
+            ascii_chars, other_chars = (1, 0) if ord(ch) < 128 else (0, 1)
+    parts.append(sentence[start:])
+    return parts
@@ -0,0 +1,83 @@
+# backend/app/utils/extractive.py
+
+from collections import Counter
+from typing import Dict, List
+import re
+
+# 문장 끝 (마침표/물음표/느낌표 + 공백, 또는 줄바꿈)
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+_WORD = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+# 단어 끝의 조사 (길이순 - 긴 것부터 제거)
+_PARTICLES = (
+    "에서는", "으로는", "에게서", "까지", "부터", "에서", "으로", "에게", "처럼", "보다",
+    "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도", "만"
+)
+_STOPWORDS = {
+    "그리고", "그러나", "하지만", "또한", "그래서", "이것", "그것", "저것", "있다", "없다",
+    "한다", "했다", "하는", "위해", "대한", "통해", "같은", "있는", "없는", "the", "and", "for", "with"
+}
+# 서술어 어미 (키워드로 쓰지 않음)
+_PREDICATE_ENDINGS = ("니다", "했다", "한다", "이다", "었다", "았다")
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence.strip()]
+
+def normalize_word(word: str) -> str:
+    """소문자 변환 후 끝의 조사 제거 (두 글자 이상 남을 때만)"""
+    word = word.lower()
+    for particle in _PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            return word[:-len(particle)]
+    return word
+
+def extract_words(text: str) -> List[str]:
+    words = (normalize_word(word) for word in _WORD.findall(text))
+    return [
+        word for word in words
+        if word not in _STOPWORDS and not word.endswith(_PREDICATE_ENDINGS)
+    ]
+
+def extractive_summary(
+    title: str, content: str,
+    summary_sentences: int = 3, highlight_count: int = 3, keyword_count: int = 6
+) -> Dict:
+    """
+    LLM 없이 본문 문장을 골라 만드는 요약 (요약 응답과 같은 형식)
+
+    - 단어 빈도(제목 단어 가중)로 문장 점수를 매기고 앞쪽 문장에 약간의 가산점
+    - 요약: 점수 상위 문장을 원문 순서대로 연결
+    - 하이라이트: 점수 상위 문장 (100자 이내)
+    - 키워드: 빈도 상위 단어 (제목 단어 우선)
+    """
+    sentences = split_sentences(content)
+    title_words = set(extract_words(title))
+    frequencies = Counter(extract_words(content))
+    for word in title_words:
+        frequencies[word] += 2
+
+    scored = []
+    for position, sentence in enumerate(sentences):
+        words = extract_words(sentence)
+        if not words:
+            continue
+        score = sum(frequencies[word] for word in words) / (len(words) ** 0.5)
+        score *= 1.0 + 0.5 / (position + 1)
+        scored.append((score, position, sentence))
+    ranked = sorted(scored, key=lambda item: (-item[0], item[1]))
+
+    chosen = sorted(ranked[:summary_sentences], key=lambda item: item[1])
+    summary = " ".join(sentence for _, _, sentence in chosen) or content[:200] or title
+    highlights = [
+        sentence if len(sentence) <= 100 else sentence[:99] + "…"
+        for _, _, sentence in ranked[:highlight_count]
+    ] or [title]
+    keywords = [word for word, _ in frequencies.most_common(keyword_count)] or [title]
+
+    # 문장 수가 적을수록 고를 여지가 없어 신뢰도를 낮게
+    confidence = 40.0 + min(len(scored), 10) * 2.0
+    return {
+        "summary": summary,
+        "highlights": highlights,
+        "keywords": keywords,
+        "confidence_score": confidence
+    }
@@ -0,0 +1,98 @@
+# backend/app/utils/helpers.py
+
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Tuple
+from fastapi.responses import StreamingResponse
+import base64
+import json
+import re
+import zlib
+
+_WHITESPACE = re.compile(r"\s+")
+
+def utcnow() -> datetime:
+    """
+    timezone 정보 없는 현재 UTC 시각
+    DB 종류(MySQL/SQLite)와 무관하게 DateTime 컬럼과 비교하기 위해 사용
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def encode_cursor(created_at: datetime, post_id: int) -> str:
+    """(created_at, id) 정렬 키를 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps([created_at.isoformat(), post_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, post_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(post_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+def make_excerpt(text: str, length: int) -> str:
+    """
+    본문 앞부분 발췌문 (공백 정리 후 length 글자 이내, 잘렸으면 단어 경계에서 자르고 '…' 추가)
+    """
+    text = _WHITESPACE.sub(" ", text or "").strip()
+    if len(text) <= length:
+        return text
+    cut = text[:length]
+    boundary = cut.rfind(" ")
+    if boundary >= length * 0.8:
+        cut = cut[:boundary]
+    return cut.rstrip() + "…"
+
+def sse_event(event: str, data: Any) -> str:
+    """Server-Sent Events 메시지 한 건 (data는 JSON 직렬화)"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+def event_stream_response(events: AsyncIterator[Dict]) -> StreamingResponse:
+    """{"event", "data"} 비동기 이터레이터를 SSE 응답으로 변환"""
+    async def body():
+        async for item in events:
+            yield sse_event(item["event"], item["data"])
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # 프록시(nginx) 버퍼링 비활성화
+        }
+    )
+
+def ndjson_stream_response(
+    records: AsyncIterator[Dict], filename: str, compress: bool = False, chunk_rows: int = 500
+) -> StreamingResponse:
+    """
+    레코드 비동기 이터레이터를 NDJSON 파일 다운로드 응답으로 변환
+
+    chunk_rows행씩 모아 한 번에 보내고, compress이면 gzip 스트림으로 압축합니다
+    (조각마다 flush하므로 받는 쪽도 바로 풀 수 있음). 메모리는 한 조각 분량만 사용합니다.
+    """
+    async def body():
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+        lines = []
+        async for record in records:
+            lines.append(json.dumps(record, ensure_ascii=False, default=str))
+            if len(lines) >= chunk_rows:
+                data = ("\n".join(lines) + "\n").encode("utf-8")
+                lines.clear()
+                yield compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH) if compressor else data
+        data = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+        yield compressor.compress(data) + compressor.flush() if compressor else data
+
+    if compress:
+        filename += ".gz"
+    return StreamingResponse(
+        body(),
+        media_type="application/gzip" if compress else "application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
@@ -0,0 +1,122 @@
+# backend/app/utils/json_stream.py
+
+from typing import Any, List, Optional, Tuple, Union
+import json
+
+JsonPath = Tuple[Union[str, int], ...]
+
+class _Frame:
+    __slots__ = ("is_object", "key", "index", "expect_key")
+
+    def __init__(self, is_object: bool):
+        self.is_object = is_object
+        self.key: Optional[str] = None
+        self.index = 0
+        self.expect_key = is_object
+
+class JsonStreamParser:
+    """
+    점진적 JSON 파서
+
+    LLM이 스트리밍으로 생성하는 JSON 텍스트를 조각 단위로 받아,
+    문자열/숫자/불리언 값이 완성되는 즉시 (경로, 값)을 돌려줍니다.
+
+        parser.feed('{"summary": "요약')       -> []
+        parser.feed('입니다", "keywords": ["a"') -> [(("summary",), "요약입니다"), (("keywords", 0), "a")]
+
+    첫 '{' 이전의 텍스트(```json 등)와 최상위 객체가 닫힌 뒤의 텍스트는 무시합니다.
+    문법 검증은 하지 않으므로 최종 결과는 전체 텍스트를 json.loads로 다시 확인해야 합니다.
+    """
+
+    def __init__(self):
+        self._stack: List[_Frame] = []
+        self._started = False
+        self._done = False
+        self._in_string = False
+        self._in_literal = False
+        self._escape = False
+        self._token: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        """최상위 객체가 닫혔는지 여부"""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[JsonPath, Any]]:
+        """텍스트 조각을 처리하고 새로 완성된 값 목록을 반환"""
+        events: List[Tuple[JsonPath, Any]] = []
+        for ch in chunk:
+            if self._done:
+                break
+
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._stack.append(_Frame(is_object=True))
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    self._token.append(ch)
+                elif ch == "\\":
+                    self._escape = True
+                    self._token.append(ch)
+                elif ch == '"':
+                    self._in_string = False
+                    self._finish_string(events)
+                else:
+                    self._token.append(ch)
+                continue
+
+            if self._in_literal:
+                if ch not in ",}] \t\r\n":
+                    self._token.append(ch)
+                    continue
+                self._in_literal = False
+                self._finish_literal(events)
+
+            if ch == '"':
+                self._in_string = True
+                self._token = []
+            elif ch == "{" or ch == "[":
+                self._stack.append(_Frame(is_object=ch == "{"))
+            elif ch == "}" or ch == "]":
+                self._stack.pop()
+                if not self._stack:
+                    self._done = True
+            elif ch == ":":
+                self._stack[-1].expect_key = False
+            elif ch == ",":
+                frame = self._stack[-1]
+                if frame.is_object:
+                    frame.expect_key = True
+                    frame.key = None
+                else:
+                    frame.index += 1
+            elif not ch.isspace():
+                self._in_literal = True
+                self._token = [ch]
+        return events
+
+    def _path(self) -> JsonPath:
+        return tuple(frame.key if frame.is_object else frame.index for frame in self._stack)
+
+    def _finish_string(self, events: List[Tuple[JsonPath, Any]]):
+        try:
+            value = json.loads('"' + "".join(self._token) + '"', strict=False)
+        except ValueError:
+            value = "".join(self._token)
+
+        frame = self._stack[-1]
+        if frame.is_object and frame.expect_key:
+            frame.key = value
+        else:
+            events.append((self._path(), value))
+
+    def _finish_literal(self, events: List[Tuple[JsonPath, Any]]):
+        try:
+            value = json.loads("".join(self._token))
+        except ValueError:
+            return
+        events.append((self._path(), value))
@@ -0,0 +1,96 @@
+# backend/app/utils/single_flight.py
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+
+class SupersededError(Exception):
+    """같은 호출자(owner)의 새 요청으로 대체되어 결과를 기다리지 않음"""
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+class SingleFlight:
+    """
+    진행 중인 동일 요청 합치기 (single-flight)
+
+    같은 key로 동시에 들어온 호출은 첫 호출이 시작한 작업 하나의 결과를 함께 받습니다.
+    - 기다리는 호출이 모두 취소되면(클라이언트 연결 종료 등) 작업도 취소
+    - owner를 지정하면 같은 owner의 이전 호출은 새 호출이 들어올 때 SupersededError로 끝남
+      (입력이 같으면 대체하지 않고 같은 작업을 함께 기다림)
+
+    결과 객체는 모든 호출자가 공유하므로 수정이 필요하면 호출하는 쪽에서 복사해야 합니다.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._owners: Dict[Hashable, Tuple[Hashable, asyncio.Event]] = {}
+
+        # 카운터
+        self.calls = 0        # 실제로 시작한 작업 수
+        self.coalesced = 0    # 진행 중인 작업에 합류해 절약한 호출 수
+        self.superseded = 0   # 새 요청으로 대체된 호출 수
+        self.cancelled = 0    # 기다리는 호출이 없어 취소한 작업 수
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        owner: Optional[Hashable] = None
+    ) -> Any:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.create_task(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _, key=key, flight=flight: self._forget(key, flight))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        flight.waiters += 1
+
+        superseded = None
+        if owner is not None:
+            previous = self._owners.get(owner)
+            if previous is not None and previous[0] != key:
+                previous[1].set()
+            superseded = asyncio.Event()
+            self._owners[owner] = (key, superseded)
+
+        try:
+            if superseded is None:
+                return await asyncio.shield(flight.task)
+
+            signal = asyncio.ensure_future(superseded.wait())
+            try:
+                await asyncio.wait({flight.task, signal}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                signal.cancel()
+            if flight.task.done():
+                return flight.task.result()
+            self.superseded += 1
+            raise SupersededError()
+        finally:
+            flight.waiters -= 1
+            if owner is not None and self._owners.get(owner, (None, None))[1] is superseded:
+                del self._owners[owner]
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                self.cancelled += 1
+
+    def _forget(self, key: Hashable, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> Dict:
+        requested = self.calls + self.coalesced
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "saved_rate": round(self.coalesced / requested, 4) if requested else 0.0,
+            "superseded": self.superseded,
+            "cancelled": self.cancelled,
+            "in_flight": len(self._flights)
+        }
@@ -0,0 +1,52 @@
+"""
+키워드 색인 채우기 스크립트
+기존 요약의 keywords(JSON)로 keywords / post_keywords 테이블을 다시 만듦
+
+사용법:
+    python backfill_keywords.py [--batch-size 1000]
+
+색인은 요약 저장시 자동으로 갱신되므로 보통은 한 번만 실행하면 됩니다.
+(색인이 비어 있으면 앱 시작시에도 자동으로 채웁니다)
+"""
+
+import sys
+import os
+import argparse
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import create_tables
+from app.services.keyword_service import keyword_index
+from app.services.stats_service import stats_service
+
+def main():
+    """메인 함수"""
+
+    parser = argparse.ArgumentParser(description="SeeQ 키워드 색인 채우기")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 처리할 요약 수 (기본 1000)")
+    args = parser.parse_args()
+
+    print("🚀 SeeQ 키워드 색인 채우기")
+    print("=" * 40)
+
+    started = time.perf_counter()
+    try:
+        create_tables()
+        processed = keyword_index.backfill(
+            batch_size=args.batch_size,
+            progress=lambda count: print(f"   요약 {count:,}건 처리")
+        )
+        # 키워드 추이 통계도 새 색인 기준으로 다시 계산
+        print("🔢 통계 집계 재계산...")
+        stats_service.rebuild()
+    except Exception as e:
+        print(f"❌ 키워드 색인 채우기 실패: {e}")
+        return False
+
+    print(f"\n🎉 완료! 요약 {processed:,}건 ({time.perf_counter() - started:.1f}초)")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,193 @@
+"""
+비동기 DB 세션 동시성 벤치마크
+
+같은 조회를 두 가지 방식으로 처리하는 엔드포인트의 초당 처리량을 비교합니다.
+- 변경 전: async def 핸들러 안에서 동기 Session 사용 (DB 왕복 동안 이벤트 루프 차단)
+  → 벤치마크 전용 /bench/sync/... 라우트로 재현
+- 변경 후: AsyncSession을 사용하는 실제 API (/api/v1/posts/...)
+
+SQLite는 같은 프로세스 안의 파일이라 DB 왕복 지연이 거의 없으므로
+--db-latency-ms 로 문장마다 네트워크 DB 왕복 지연을 흉내 냅니다.
+(동기 드라이버는 스레드를 막는 sleep, 비동기 드라이버는 await sleep)
+MySQL을 직접 측정하려면 DATABASE_URL을 지정하고 --db-latency-ms 0 으로 실행합니다.
+
+동시 요청 수가 커넥션 풀 크기(기본 5 + overflow 10)를 넘으면 변경 전 방식은
+커넥션을 기다리며 이벤트 루프를 막은 채로, 커넥션을 반납해야 할 다른 요청의
+정리 단계도 진행하지 못해 풀 타임아웃(30초)까지 멈춥니다. 그래서 기본값은 풀 크기 이하입니다.
+
+사용법:
+    cd backend
+    python benchmarks/bench_async_db.py --concurrency 10 --duration 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+APP_PORT = 8101
+
+def add_sync_baseline_routes(app):
+    """변경 전 방식(동기 세션)의 목록/상세 조회 라우트"""
+    from fastapi import APIRouter, Depends, HTTPException
+    from sqlalchemy import desc
+    from sqlalchemy.orm import Session, joinedload
+    from app.core.database import get_db
+    from app.models.post import Post
+    from app.schemas import PostDetail, PostList
+
+    router = APIRouter(prefix="/bench/sync")
+
+    @router.get("/posts", response_model=PostList)
+    async def sync_posts(limit: int = 20, db: Session = Depends(get_db)):
+        query = db.query(Post).options(joinedload(Post.category), joinedload(Post.summary))
+        total = query.count()
+        posts = query.order_by(desc(Post.created_at), desc(Post.id)).limit(limit).all()
+        return PostList(posts=posts, total=total, page=1, size=len(posts))
+
+    @router.get("/posts/{post_id}", response_model=PostDetail)
+    async def sync_post(post_id: int, db: Session = Depends(get_db)):
+        post = db.query(Post).options(
+            joinedload(Post.category), joinedload(Post.summary)
+        ).filter(Post.id == post_id).first()
+        if not post:
+            raise HTTPException(status_code=404)
+        return post
+
+    app.include_router(router)
+
+def inject_db_latency(latency: float):
+    """문장 실행마다 DB 왕복 지연 추가"""
+    import aiosqlite
+    from sqlalchemy import event
+    from app.core.database import engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def blocking_delay(*_):
+        time.sleep(latency)
+
+    original_execute = aiosqlite.Cursor.execute
+
+    async def delayed_execute(self, sql, parameters=None):
+        await asyncio.sleep(latency)
+        return await original_execute(self, sql, parameters)
+
+    aiosqlite.Cursor.execute = delayed_execute
+
+async def run_load(client, path_for, concurrency, duration):
+    """duration초 동안 concurrency개의 클라이언트가 반복 요청 → (초당 처리량, 실패 수)"""
+    import httpx
+
+    deadline = time.perf_counter() + duration
+    completed = 0
+    failed = 0
+
+    async def worker(worker_id):
+        nonlocal completed, failed
+        i = worker_id
+        while time.perf_counter() < deadline:
+            try:
+                response = await client.get(path_for(i))
+            except httpx.HTTPError:
+                failed += 1
+                continue
+            if response.status_code == 200:
+                completed += 1
+            else:
+                failed += 1
+            i += concurrency
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return completed / (time.perf_counter() - started), failed
+
+async def run_benchmark(args) -> bool:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{APP_PORT}", timeout=60, limits=limits) as client:
+        category = await client.post("/api/v1/categories/", json={"name": "벤치마크"})
+        category.raise_for_status()
+        response = await client.post("/api/v1/posts/bulk", json={"posts": [
+            {
+                "title": f"동시성 벤치마크 {i}",
+                "content": "비동기 세션 벤치마크 본문입니다. " * 20,
+                "category_id": category.json()["id"],
+                "auto_summarize": False
+            }
+            for i in range(args.posts)
+        ]})
+        response.raise_for_status()
+
+        scenarios = [
+            ("목록", "/bench/sync/posts?limit=20", "/api/v1/posts/?limit=20"),
+            ("상세", "/bench/sync/posts/{id}", "/api/v1/posts/{id}"),
+        ]
+        passed = True
+        for label, sync_path, async_path in scenarios:
+            print(f"\n▶ {label} 조회 (동시 {args.concurrency}, {args.duration:.0f}초)")
+            results = []
+            for name, path in (("동기 Session", sync_path), ("AsyncSession", async_path)):
+                rps, failed = await run_load(
+                    client,
+                    lambda i, path=path: path.format(id=i % args.posts + 1),
+                    args.concurrency,
+                    args.duration
+                )
+                results.append(rps)
+                print(f"   {name:<14} {rps:8.1f} req/s (실패 {failed})")
+                passed = passed and failed == 0
+            print(f"   → {results[1] / results[0]:.1f}배")
+            passed = passed and results[1] >= results[0]
+    return passed
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 DB 세션 동시성 벤치마크")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수 (커넥션 풀 크기 이하 권장)")
+    parser.add_argument("--duration", type=float, default=5.0, help="시나리오별 측정 시간(초)")
+    parser.add_argument("--posts", type=int, default=200, help="미리 생성할 게시물 수")
+    parser.add_argument("--db-latency-ms", type=float, default=2.0, help="문장별 DB 왕복 지연 흉내(ms, SQLite 전용)")
+    args = parser.parse_args()
+
+    print("🔧 SeeQ 비동기 DB 세션 벤치마크")
+    print("=" * 50)
+
+    if "DATABASE_URL" not in os.environ:
+        workdir = tempfile.mkdtemp(prefix="seeq_async_")
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'async.db')}"
+    os.environ["DEBUG"] = "False"
+    os.environ["SUMMARY_WORKER_COUNT"] = "0"
+
+    import logging
+    logging.disable(logging.INFO)
+
+    from fake_openai import BackgroundServer
+    from app.main import app
+
+    add_sync_baseline_routes(app)
+    if args.db_latency_ms and os.environ["DATABASE_URL"].startswith("sqlite"):
+        inject_db_latency(args.db_latency_ms / 1000)
+        print(f"DB 왕복 지연 {args.db_latency_ms}ms 적용")
+
+    api_server = BackgroundServer(app, port=APP_PORT)
+    api_server.start()
+    try:
+        passed = asyncio.run(run_benchmark(args))
+    finally:
+        api_server.stop()
+
+    print()
+    if passed:
+        print("✅ AsyncSession 처리량이 동기 Session 이상입니다.")
+    else:
+        print("❌ AsyncSession 처리량이 더 낮거나 실패한 요청이 있습니다.")
+    return passed
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
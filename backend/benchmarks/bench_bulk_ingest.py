@@ -0,0 +1,100 @@
+"""
+게시물 일괄 생성 처리량 벤치마크
+
+단건 POST /api/v1/posts/ 를 반복 호출하는 경우와
+POST /api/v1/posts/bulk 한 번으로 생성하는 경우의 초당 처리 건수를 비교합니다.
+요약은 가짜 OpenAI 엔드포인트를 사용하는 백그라운드 워커가 처리합니다.
+
+사용법:
+    cd backend
+    python benchmarks/bench_bulk_ingest.py --count 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+FAKE_OPENAI_PORT = 8100
+
+def make_post(category_id, i):
+    return {
+        "title": f"안경 메모 {i}",
+        "content": f"스마트 안경으로 캡처한 {i}번째 메모입니다. " * 10,
+        "category_id": category_id,
+        "auto_summarize": True
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="게시물 일괄 생성 처리량 벤치마크")
+    parser.add_argument("--count", type=int, default=500, help="생성할 게시물 수")
+    parser.add_argument("--batch-size", type=int, default=500, help="bulk 요청당 게시물 수")
+    parser.add_argument("--target", type=float, default=10.0, help="목표 처리량 배수")
+    args = parser.parse_args()
+
+    print("🔧 SeeQ 게시물 일괄 생성 벤치마크")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp(prefix="seeq_bulk_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bulk.db')}"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{FAKE_OPENAI_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["DEBUG"] = "False"
+
+    import logging
+    logging.disable(logging.INFO)
+
+    from fastapi.testclient import TestClient
+    from fake_openai import BackgroundServer, create_fake_openai_app
+    from app.main import app
+
+    fake_openai = BackgroundServer(create_fake_openai_app(0.5), port=FAKE_OPENAI_PORT)
+    fake_openai.start()
+
+    try:
+        with TestClient(app) as client:
+            category_id = client.post("/api/v1/categories/", json={"name": "벤치마크"}).json()["id"]
+
+            # 1. 단건 API 반복 호출
+            print(f"1️⃣ 단건 POST /posts {args.count}회...")
+            started = time.perf_counter()
+            for i in range(args.count):
+                response = client.post("/api/v1/posts/", json=make_post(category_id, i))
+                response.raise_for_status()
+            single_elapsed = time.perf_counter() - started
+            single_rate = args.count / single_elapsed
+            print(f"   {single_elapsed:.2f}s ({single_rate:.0f} posts/s)")
+
+            # 2. bulk API
+            print(f"\n2️⃣ POST /posts/bulk ({args.batch_size}개씩)...")
+            started = time.perf_counter()
+            created = 0
+            for offset in range(0, args.count, args.batch_size):
+                batch = [
+                    make_post(category_id, i)
+                    for i in range(offset, min(offset + args.batch_size, args.count))
+                ]
+                response = client.post("/api/v1/posts/bulk", json={"posts": batch})
+                response.raise_for_status()
+                created += response.json()["created"]
+            bulk_elapsed = time.perf_counter() - started
+            bulk_rate = created / bulk_elapsed
+            print(f"   {bulk_elapsed:.2f}s ({bulk_rate:.0f} posts/s)")
+    finally:
+        fake_openai.stop()
+
+    speedup = bulk_rate / single_rate
+    print(f"\n📊 처리량 {speedup:.1f}배")
+    if speedup >= args.target:
+        print(f"✅ 목표({args.target:.0f}배) 달성")
+        return True
+    print(f"❌ 목표({args.target:.0f}배) 미달")
+    return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
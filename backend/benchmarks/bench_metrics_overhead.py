@@ -0,0 +1,122 @@
+"""
+지표 수집 오버헤드 마이크로 벤치마크
+
+1. 기록 연산 하나의 비용 (Counter.inc, Histogram.observe)
+2. 같은 요청(GET /api/v1/posts/{id}, 응답 캐시 끔 - DB 조회 포함)을
+   지표 수집 켬/끔으로 번갈아 실행해 요청당 처리 시간 비교
+
+네트워크 잡음을 없애기 위해 httpx.ASGITransport로 앱을 프로세스 안에서 직접 호출합니다.
+
+사용법:
+    cd backend
+    python benchmarks/bench_metrics_overhead.py --requests 2000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+def measure_primitives():
+    from app.core.metrics import Counter, Histogram
+
+    counter = Counter("bench_total", "bench", ("route",))
+    histogram = Histogram("bench_seconds", "bench", ("method", "route", "status"))
+    loops = 200_000
+    inc_ns = timeit.timeit(lambda: counter.inc("/posts"), number=loops) / loops * 1e9
+    observe_ns = timeit.timeit(
+        lambda: histogram.observe(0.0123, "GET", "/posts/{post_id}", "200"), number=loops
+    ) / loops * 1e9
+    print(f"   Counter.inc          {inc_ns:8.0f} ns/회")
+    print(f"   Histogram.observe    {observe_ns:8.0f} ns/회")
+
+async def measure_requests(args):
+    import httpx
+    from app.core.database import Base, engine
+    from app.core.metrics import metrics
+    from app.main import app
+
+    # ASGITransport는 lifespan(startup)을 실행하지 않으므로 테이블을 직접 생성
+    Base.metadata.create_all(bind=engine)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        category = await client.post("/api/v1/categories/", json={"name": "지표"})
+        category.raise_for_status()
+        response = await client.post("/api/v1/posts/bulk", json={"posts": [
+            {
+                "title": f"지표 벤치마크 {i}",
+                "content": "지표 수집 오버헤드 측정용 본문입니다. " * 20,
+                "category_id": category.json()["id"],
+                "auto_summarize": False
+            }
+            for i in range(100)
+        ]})
+        response.raise_for_status()
+
+        async def run(enabled: bool) -> float:
+            metrics.enabled = enabled
+            started = time.perf_counter()
+            for i in range(args.requests):
+                response = await client.get(f"/api/v1/posts/{i % 100 + 1}")
+                assert response.status_code == 200
+            return (time.perf_counter() - started) / args.requests
+
+        await run(True)  # 예열
+        samples = {True: [], False: []}
+        for _ in range(args.rounds):
+            for enabled in (False, True):
+                samples[enabled].append(await run(enabled))
+        metrics.enabled = True
+
+    off = statistics.median(samples[False])
+    on = statistics.median(samples[True])
+    overhead = (on - off) / off * 100
+    print(f"   지표 끔             {off * 1e6:8.1f} µs/요청")
+    print(f"   지표 켬             {on * 1e6:8.1f} µs/요청")
+    print(f"   → 오버헤드 {overhead:+.2f}% ({(on - off) * 1e6:+.1f} µs/요청)")
+    return overhead
+
+def main():
+    parser = argparse.ArgumentParser(description="지표 수집 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000, help="라운드별 요청 수")
+    parser.add_argument("--rounds", type=int, default=5, help="켬/끔 번갈아 실행할 라운드 수")
+    parser.add_argument("--max-overhead", type=float, default=3.0, help="허용 오버헤드(%)")
+    args = parser.parse_args()
+
+    print("🔧 SeeQ 지표 수집 오버헤드 벤치마크")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp(prefix="seeq_metrics_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'metrics.db')}"
+    os.environ["RESPONSE_CACHE_ENABLED"] = "False"
+    os.environ["SUMMARY_WORKER_COUNT"] = "0"
+    os.environ["DEBUG"] = "False"
+
+    import logging
+    logging.disable(logging.INFO)
+
+    print("\n1️⃣ 기록 연산 비용")
+    measure_primitives()
+
+    print(f"\n2️⃣ 요청당 처리 시간 (라운드 {args.rounds}회 x {args.requests}건, 중앙값)")
+    overhead = asyncio.run(measure_requests(args))
+
+    print()
+    passed = overhead <= args.max_overhead
+    if passed:
+        print(f"✅ 오버헤드가 허용 범위({args.max_overhead:.0f}%) 이내입니다.")
+    else:
+        print(f"❌ 오버헤드가 허용 범위({args.max_overhead:.0f}%)를 넘습니다.")
+    return passed
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
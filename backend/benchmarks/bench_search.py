@@ -0,0 +1,156 @@
+"""
+검색 벤치마크 (기본 10만 건)
+
+임시 SQLite DB에 합성 한국어 게시물을 채운 뒤
+- 기존 방식: title/content ILIKE '%검색어%' (전체 스캔)
+- bigram 역색인: InvertedIndexSearch
+의 검색 지연을 비교합니다. MySQL FULLTEXT는 DATABASE_URL을 MySQL로 지정하고
+--backend mysql 로 실행하면 같은 방식으로 측정합니다 (데이터는 미리 적재 필요).
+
+사용법:
+    cd backend
+    python benchmarks/bench_search.py --posts 100000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+WORDS = [
+    "회의록", "프로젝트", "일정", "독서", "데미안", "인공지능", "머신러닝", "학습", "정리",
+    "요약", "스마트", "안경", "카메라", "메모", "아이디어", "점심", "운동", "여행", "계획",
+    "발표", "자료", "검토", "고객", "피드백", "개발", "배포", "테스트", "데이터", "분석",
+    "보고서", "강의", "복습", "문제", "해결", "토론", "주제", "소설", "철학", "역사", "경제"
+]
+QUERIES = ["회의록", "데미안 소설", "머신러닝 강의", "고객 피드백", "스마트 안경", "철학"]
+
+def build_vocabulary(rng, size):
+    """주제어 + 무작위 한글 단어, 지프 분포 가중치"""
+    vocabulary = list(WORDS)
+    while len(vocabulary) < size:
+        length = rng.choice([2, 2, 3, 3, 4])
+        vocabulary.append("".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(length)))
+    rng.shuffle(vocabulary)
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return vocabulary, weights
+
+def make_text(rng, vocabulary, weights, words):
+    chosen = rng.choices(vocabulary, weights=weights, k=words)
+    return " ".join(word + rng.choice(["을", "를", "의", "에서", "", "은"]) for word in chosen)
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2], result
+
+async def timed_async(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await fn()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples[len(samples) // 2], result
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 벤치마크")
+    parser.add_argument("--posts", type=int, default=100000, help="게시물 수")
+    parser.add_argument("--words", type=int, default=60, help="게시물당 단어 수")
+    parser.add_argument("--vocabulary", type=int, default=20000, help="어휘 크기")
+    parser.add_argument("--repeat", type=int, default=5, help="검색어별 반복 횟수")
+    parser.add_argument("--backend", default="memory", choices=["memory", "mysql"], help="측정할 색인")
+    args = parser.parse_args()
+
+    print("🔧 SeeQ 검색 벤치마크")
+    print("=" * 50)
+
+    if args.backend == "memory":
+        workdir = tempfile.mkdtemp(prefix="seeq_search_")
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'search.db')}"
+    os.environ["DEBUG"] = "False"
+    os.environ["SEARCH_BACKEND"] = args.backend
+
+    import logging
+    logging.disable(logging.INFO)
+
+    from sqlalchemy import desc, insert
+    from app.core.database import AsyncSessionLocal, Base, SessionLocal, engine
+    from app.models import Category, Post, PostStatus
+    from app.services.post_service import PostService
+    from app.services.search_service import search_service, ilike_condition
+
+    def ilike_search(db, query):
+        # 기존 get_posts_with_summaries 방식 (count + 정렬/페이징)
+        base = db.query(Post).filter(ilike_condition(query))
+        total = base.count()
+        return base.order_by(desc(Post.created_at)).limit(20).all(), total
+
+    if args.backend == "memory":
+        # 1. 데이터 적재
+        print(f"1️⃣ 게시물 {args.posts:,}건 생성...")
+        Base.metadata.create_all(bind=engine)
+        rng = random.Random(42)
+        vocabulary, weights = build_vocabulary(rng, args.vocabulary)
+        started = time.perf_counter()
+        with engine.begin() as connection:
+            connection.execute(insert(Category), [{"id": 1, "name": "기타"}])
+            batch = []
+            for i in range(args.posts):
+                batch.append({
+                    "title": make_text(rng, vocabulary, weights, 4),
+                    "content": make_text(rng, vocabulary, weights, args.words),
+                    "category_id": 1,
+                    "status": PostStatus.PUBLISHED
+                })
+                if len(batch) == 5000:
+                    connection.execute(insert(Post), batch)
+                    batch = []
+            if batch:
+                connection.execute(insert(Post), batch)
+        print(f"   {time.perf_counter() - started:.1f}s")
+
+    # 2. 색인 준비
+    print("\n2️⃣ 색인 준비...")
+    started = time.perf_counter()
+    search_service.prepare()
+    print(f"   {time.perf_counter() - started:.1f}s")
+
+    # 3. 검색 지연 비교
+    print("\n3️⃣ 검색 지연 (중앙값, 첫 페이지 20건)")
+
+    async def compare():
+        async with AsyncSessionLocal() as async_db:
+            with SessionLocal() as db:
+                for query in QUERIES:
+                    ilike_time, (_, ilike_total) = timed(
+                        lambda: ilike_search(db, query),
+                        args.repeat
+                    )
+                    index_time, (_, index_total, _) = await timed_async(
+                        lambda: PostService.get_posts_with_summaries(async_db, limit=20, search=query),
+                        args.repeat
+                    )
+                    print(
+                        f"   '{query}': ILIKE {ilike_time * 1000:.1f}ms ({ilike_total}건) | "
+                        f"{search_service.name} {index_time * 1000:.1f}ms ({index_total}건)"
+                    )
+
+    asyncio.run(compare())
+
+    print("\n🎉 벤치마크 완료")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
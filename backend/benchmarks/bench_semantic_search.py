@@ -0,0 +1,177 @@
+"""
+의미 검색 벤치마크 (기본 10만 건)
+
+임시 SQLite DB에 주제별 합성 한국어 게시물을 채운 뒤
+- 색인 구성 시간 (표본 학습 + 전체 벡터화)
+- 전체 비교(exact)와 IVF 근사 검색의 질의 지연 및 IVF recall@k
+- API 경로(PostService.semantic_search - 게시물 조회 포함) 지연
+- 게시물 하나 추가/갱신 (index_post) 지연
+을 측정합니다.
+
+사용법:
+    cd backend
+    python benchmarks/bench_semantic_search.py --posts 100000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+TOPICS = [
+    ["머신러닝", "딥러닝", "신경망", "학습", "모델", "데이터", "경사하강법", "정확도"],
+    ["회의록", "프로젝트", "일정", "배포", "고객", "피드백", "검토", "마감"],
+    ["독서", "소설", "데미안", "헤세", "성장", "자아", "문장", "작가"],
+    ["여행", "제주도", "숙소", "항공권", "맛집", "일정표", "바다", "사진"],
+    ["운동", "러닝", "근력", "식단", "체중", "스트레칭", "헬스장", "기록"],
+    ["경제", "금리", "주식", "환율", "투자", "물가", "채권", "시장"],
+    ["철학", "윤리", "존재", "칸트", "니체", "자유", "의지", "사유"],
+    ["요리", "레시피", "재료", "양념", "오븐", "파스타", "김치", "손질"],
+]
+QUERIES = ["머신러닝 모델 학습", "프로젝트 회의 일정", "소설 읽고 느낀 점", "제주 여행 숙소", "금리와 주식 시장", "니체 철학"]
+PARTICLES = ["을", "를", "의", "에서", "", "은", "과"]
+
+def make_text(rng, topic, noise, words):
+    """주제어 70% + 무작위 한글 단어 30%"""
+    chosen = []
+    for _ in range(words):
+        word = rng.choice(topic) if rng.random() < 0.7 else rng.choice(noise)
+        chosen.append(word + rng.choice(PARTICLES))
+    return " ".join(chosen)
+
+def percentile(samples, ratio):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+def measure(fn, queries, repeat):
+    samples = []
+    results = {}
+    for query in queries:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            results[query] = fn(query)
+            samples.append(time.perf_counter() - started)
+    return samples, results
+
+def report(label, samples):
+    print(
+        f"   {label}: p50 {percentile(samples, 0.5) * 1000:.2f}ms | "
+        f"p95 {percentile(samples, 0.95) * 1000:.2f}ms"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="의미 검색 벤치마크")
+    parser.add_argument("--posts", type=int, default=100000, help="게시물 수")
+    parser.add_argument("--words", type=int, default=60, help="게시물당 본문 단어 수")
+    parser.add_argument("--top-k", type=int, default=20, help="검색 결과 수")
+    parser.add_argument("--repeat", type=int, default=20, help="검색어별 반복 횟수")
+    args = parser.parse_args()
+
+    print("🔧 SeeQ 의미 검색 벤치마크")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp(prefix="seeq_semantic_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'semantic.db')}"
+    os.environ["DEBUG"] = "False"
+    os.environ["SEMANTIC_SEARCH_ENABLED"] = "True"
+    os.environ["SEMANTIC_REFIT_GROWTH"] = "0"
+
+    import logging
+    logging.disable(logging.INFO)
+
+    from sqlalchemy import insert
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal, Base, engine
+    from app.models import Category, Post, PostStatus
+    from app.services.post_service import PostService
+    from app.services.semantic_service import semantic_index
+
+    # 1. 데이터 적재
+    print(f"1️⃣ 게시물 {args.posts:,}건 생성...")
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(42)
+    noise = ["".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.choice([2, 3]))) for _ in range(5000)]
+    started = time.perf_counter()
+    with engine.begin() as connection:
+        connection.execute(insert(Category), [{"id": 1, "name": "기타"}])
+        batch = []
+        for _ in range(args.posts):
+            topic = rng.choice(TOPICS)
+            batch.append({
+                "title": make_text(rng, topic, noise, 4),
+                "content": make_text(rng, topic, noise, args.words),
+                "category_id": 1,
+                "status": PostStatus.PUBLISHED
+            })
+            if len(batch) == 5000:
+                connection.execute(insert(Post), batch)
+                batch = []
+        if batch:
+            connection.execute(insert(Post), batch)
+    print(f"   {time.perf_counter() - started:.1f}s")
+
+    # 2. 색인 구성 + 전체 비교 검색
+    print("\n2️⃣ 색인 구성 (전체 비교)...")
+    settings.SEMANTIC_INDEX = "exact"
+    started = time.perf_counter()
+    semantic_index.prepare()
+    print(f"   {time.perf_counter() - started:.1f}s - 게시물 {semantic_index.document_count:,}건, "
+          f"{settings.SEMANTIC_DIMENSION}차원 float32 ({semantic_index.document_count * settings.SEMANTIC_DIMENSION * 4 / 1e6:.0f}MB)")
+
+    print(f"\n3️⃣ 검색 지연 (상위 {args.top_k}건, 검색어 {len(QUERIES)}개 x {args.repeat}회)")
+    exact_samples, exact_results = measure(lambda query: semantic_index.search(query, args.top_k), QUERIES, args.repeat)
+    report("exact (행렬 곱 + argpartition)", exact_samples)
+
+    async def api_search(query):
+        async with AsyncSessionLocal() as db:
+            return await PostService.semantic_search(db, query, limit=args.top_k)
+
+    async def measure_api():
+        samples = []
+        for query in QUERIES:
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                await api_search(query)
+                samples.append(time.perf_counter() - started)
+        return samples
+
+    report("API 경로 (게시물 조회 포함)", asyncio.run(measure_api()))
+
+    # 3. IVF 근사 검색
+    print("\n4️⃣ 색인 구성 (IVF)...")
+    settings.SEMANTIC_INDEX = "ivf"
+    started = time.perf_counter()
+    semantic_index.prepare()
+    print(f"   {time.perf_counter() - started:.1f}s")
+
+    for probes in (4, 16, 32):
+        settings.SEMANTIC_IVF_PROBES = probes
+        ivf_samples, ivf_results = measure(lambda query: semantic_index.search(query, args.top_k), QUERIES, args.repeat)
+        recall = sum(
+            len({post_id for post_id, _ in ivf_results[query]} & {post_id for post_id, _ in exact_results[query]})
+            for query in QUERIES
+        ) / max(1, sum(len(exact_results[query]) for query in QUERIES))
+        report(f"IVF probes={probes} (recall@{args.top_k} {recall:.2f})", ivf_samples)
+
+    # 4. 증분 갱신
+    print("\n5️⃣ 게시물 색인 갱신 (index_post)")
+    samples = []
+    for post_id in range(1, 201):
+        topic = rng.choice(TOPICS)
+        started = time.perf_counter()
+        semantic_index.index_post(post_id, make_text(rng, topic, noise, 4), make_text(rng, topic, noise, args.words))
+        samples.append(time.perf_counter() - started)
+    report("index_post", samples)
+
+    print("\n🎉 벤치마크 완료")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
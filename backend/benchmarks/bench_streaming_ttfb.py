@@ -0,0 +1,135 @@
+"""
+스트리밍 응답 첫 바이트 시간(TTFB) 벤치마크
+
+가짜 OpenAI 엔드포인트(지연 시간 설정 가능)를 띄운 뒤
+/posts/preview-summary 와 /posts/preview-summary/stream,
+/ask-llm/ 과 /ask-llm/stream 의 첫 바이트 도착 시간과 전체 완료 시간을 비교합니다.
+
+사용법:
+    cd backend
+    python benchmarks/bench_streaming_ttfb.py --requests 10 --llm-latency 2.0
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+APP_PORT = 8101
+FAKE_OPENAI_PORT = 8100
+
+async def measure(client, path, payload):
+    """(첫 바이트 시간, 전체 완료 시간, 응답 본문)"""
+    started = time.perf_counter()
+    first_byte = None
+    body = []
+    async with client.stream("POST", path, json=payload) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_text():
+            if first_byte is None:
+                first_byte = time.perf_counter() - started
+            body.append(chunk)
+    return first_byte, time.perf_counter() - started, "".join(body)
+
+async def run_endpoint(client, label, path, make_payload, count):
+    ttfb_samples = []
+    total_samples = []
+    for i in range(count):
+        ttfb, total, _ = await measure(client, path, make_payload(i))
+        ttfb_samples.append(ttfb)
+        total_samples.append(total)
+    print(
+        f"   {label:<36} TTFB p50={statistics.median(ttfb_samples) * 1000:7.1f}ms  "
+        f"완료 p50={statistics.median(total_samples) * 1000:7.1f}ms"
+    )
+    return statistics.median(ttfb_samples)
+
+async def run_benchmark(args) -> bool:
+    import httpx
+
+    # 요약 캐시를 피하기 위해 요청마다 다른 내용 사용
+    def summary_payload(prefix):
+        return lambda i: {
+            "title": f"{prefix} 스트리밍 벤치마크 {i}",
+            "content": f"{prefix} 스트리밍 TTFB 측정용 본문 {i}입니다. " * 20,
+            "category": "기타"
+        }
+
+    base_url = f"http://127.0.0.1:{APP_PORT}/api/v1"
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        print("1️⃣ 요약 미리보기")
+        preview_ttfb = await run_endpoint(
+            client, "POST /posts/preview-summary", "/posts/preview-summary",
+            summary_payload("일반"), args.requests
+        )
+        stream_ttfb = await run_endpoint(
+            client, "POST /posts/preview-summary/stream", "/posts/preview-summary/stream",
+            summary_payload("스트림"), args.requests
+        )
+
+        print("\n2️⃣ 자유 질문")
+        await run_endpoint(
+            client, "POST /ask-llm/", "/ask-llm/",
+            lambda i: f"질문 {i}", args.requests
+        )
+        await run_endpoint(
+            client, "POST /ask-llm/stream", "/ask-llm/stream",
+            lambda i: f"질문 {i}", args.requests
+        )
+
+        # 스트리밍 결과가 일반 응답과 같은 최종 요약을 주는지 확인
+        _, _, body = await measure(client, "/posts/preview-summary/stream", summary_payload("검증")(0))
+        events = [line[len("event: "):] for line in body.splitlines() if line.startswith("event: ")]
+        print(f"\n   이벤트 순서: {' → '.join(events)}")
+
+    speedup = preview_ttfb / stream_ttfb
+    print(f"\n📊 요약 미리보기 TTFB {speedup:.1f}배 단축")
+    passed = speedup >= args.target and events[-1] == "done"
+    if passed:
+        print(f"✅ 목표({args.target:.0f}배) 달성")
+    else:
+        print(f"❌ 목표({args.target:.0f}배) 미달")
+    return passed
+
+def main():
+    parser = argparse.ArgumentParser(description="스트리밍 응답 TTFB 벤치마크")
+    parser.add_argument("--requests", type=int, default=10, help="엔드포인트별 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=2.0, help="가짜 LLM 전체 생성 시간(초)")
+    parser.add_argument("--target", type=float, default=2.0, help="목표 TTFB 단축 배수")
+    args = parser.parse_args()
+
+    print("🔧 SeeQ 스트리밍 TTFB 벤치마크")
+    print("=" * 50)
+
+    workdir = tempfile.mkdtemp(prefix="seeq_stream_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'stream.db')}"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{FAKE_OPENAI_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["DEBUG"] = "False"
+
+    import logging
+    logging.disable(logging.INFO)
+
+    from fake_openai import BackgroundServer, create_fake_openai_app
+    from app.main import app
+
+    fake_openai = BackgroundServer(create_fake_openai_app(args.llm_latency), port=FAKE_OPENAI_PORT)
+    api_server = BackgroundServer(app, port=APP_PORT)
+    fake_openai.start()
+    api_server.start()
+
+    try:
+        return asyncio.run(run_benchmark(args))
+    finally:
+        api_server.stop()
+        fake_openai.stop()
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,353 @@
+"""
+API 통합 벤치마크 (재현 가능한 결과 JSON 출력)
+
+1. 게시물/요약 N건을 DB에 직접 일괄 적재 (고정 시드 생성기 - 같은 시드면 같은 데이터)
+2. 가짜 OpenAI 엔드포인트(fake_openai.py, 지연 시간 설정 가능)를 OPENAI_BASE_URL로 연결
+3. FastAPI 앱을 httpx.ASGITransport로 프로세스 안에서 직접 호출 (네트워크/서버 설정 영향 없음)
+4. 시나리오별 처리량과 p50/p95/p99 지연 시간을 출력하고 JSON으로 저장
+
+시나리오:
+    list        GET  /posts/?page=..           (임의 페이지)
+    search      GET  /posts/?search=..         (자주 나오는 단어)
+    detail      GET  /posts/{id}               (임의 게시물)
+    create      POST /posts/                   (요약 작업 예약 포함, 워커는 기본 중지)
+    regenerate  POST /posts/{id}/regenerate-summary?force=true  (가짜 LLM 호출)
+
+기본은 임시 SQLite이며 --database-url로 MySQL 등을 지정할 수 있습니다.
+이미 게시물이 --posts건 이상 있는 DB면 적재를 건너뜁니다 (큰 데이터셋 재사용).
+응답 캐시는 기본으로 끄고 (DB 경로 측정), LLM 호출 한도(RPM/TPM)도 끕니다.
+
+사용법:
+    cd backend
+    python benchmarks/bench_suite.py --posts 10000 --output results.json
+    python benchmarks/bench_suite.py --posts 10000 --compare results.json
+    python benchmarks/bench_suite.py --database-url mysql+pymysql://user:pw@localhost/seeq_bench --posts 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+FAKE_OPENAI_PORT = 8102
+SCENARIOS = ("list", "search", "detail", "create", "regenerate")
+CATEGORY_NAMES = ("개발", "일상", "여행", "음식", "기타")
+VOCABULARY = (
+    "안경", "메모", "캡처", "요약", "검색", "데이터", "서버", "모델", "학습", "일정",
+    "회의", "여행", "사진", "음식", "카페", "독서", "운동", "영화", "음악", "코드",
+    "배포", "성능", "지연", "캐시", "색인", "쿼리", "분석", "기록", "아이디어", "정리"
+)
+SEARCH_TERMS = ("안경", "요약", "캐시", "여행", "성능")
+
+# ----------------------------------------------------------------------
+# 데이터 적재
+# ----------------------------------------------------------------------
+
+def generate_rows(rng: random.Random, start: int, count: int, category_ids, summary_ratio: float):
+    """게시물/요약 행 생성 (ID를 직접 지정해 요약이 게시물을 바로 참조)"""
+    from app.models.post import PostStatus, SummaryStatus
+    from app.services.search_service import build_summary_search_text
+
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    posts, summaries = [], []
+    for post_id in range(start, start + count):
+        words = rng.choices(VOCABULARY, k=rng.randint(60, 240))
+        has_summary = rng.random() < summary_ratio
+        posts.append({
+            "id": post_id,
+            "title": f"{' '.join(words[:4])} {post_id}",
+            "content": " ".join(words),
+            "category_id": rng.choice(category_ids),
+            "status": PostStatus.PUBLISHED,
+            "summary_status": SummaryStatus.READY if has_summary else None,
+            "created_at": base_time + timedelta(seconds=post_id)
+        })
+        if has_summary:
+            keywords = rng.sample(VOCABULARY, 5)
+            highlights = [f"{keyword} 관련 핵심 내용" for keyword in keywords[:3]]
+            summary = f"{' '.join(words[:12])}에 대한 요약입니다."
+            summaries.append({
+                "post_id": post_id,
+                "summary": summary,
+                "highlights": highlights,
+                "keywords": keywords,
+                "search_text": build_summary_search_text(summary, highlights, keywords),
+                "model_version": "seed",
+                "confidence_score": 80.0
+            })
+    return posts, summaries
+
+def seed(args) -> dict:
+    """게시물 N건 적재 (이미 N건 이상이면 건너뜀)"""
+    from sqlalchemy import func, insert, select
+    from app.core.database import Base, engine
+    from app.models.category import Category
+    from app.models.post import Post
+    from app.models.summary import Summary
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        existing = connection.execute(select(func.count(Post.id))).scalar_one()
+        if existing >= args.posts:
+            print(f"   기존 게시물 {existing:,}건 사용 (적재 건너뜀)")
+            return {"seeded": 0, "seconds": 0.0}
+        if existing:
+            raise SystemExit(f"❌ 게시물 {existing:,}건이 있는 DB입니다. 빈 DB 또는 {args.posts:,}건 이상인 DB를 사용하세요.")
+
+        names = dict(connection.execute(select(Category.name, Category.id)).all())
+        missing = [{"name": name} for name in CATEGORY_NAMES if name not in names]
+        if missing:
+            connection.execute(insert(Category), missing)
+        category_ids = list(connection.execute(select(Category.id)).scalars())
+
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    for start in range(1, args.posts + 1, args.batch_size):
+        count = min(args.batch_size, args.posts + 1 - start)
+        posts, summaries = generate_rows(rng, start, count, category_ids, args.summary_ratio)
+        with engine.begin() as connection:
+            connection.execute(insert(Post), posts)
+            if summaries:
+                connection.execute(insert(Summary), summaries)
+        done = start + count - 1
+        if done % (args.batch_size * 20) == 0 or done == args.posts:
+            print(f"   {done:,}/{args.posts:,}건")
+    seconds = time.perf_counter() - started
+    print(f"   적재 완료 - {args.posts / seconds:,.0f}건/초")
+    return {"seeded": args.posts, "seconds": round(seconds, 3)}
+
+# ----------------------------------------------------------------------
+# 측정
+# ----------------------------------------------------------------------
+
+def percentile(sorted_values, p: float) -> float:
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+def make_request(scenario: str, rng: random.Random, post_count: int, category_ids):
+    """(메서드, 경로, 본문)"""
+    if scenario == "list":
+        pages = max(1, min(post_count // 20, 500))
+        return "GET", f"/api/v1/posts/?page={rng.randint(1, pages)}&size=20", None
+    if scenario == "search":
+        return "GET", f"/api/v1/posts/?search={rng.choice(SEARCH_TERMS)}&size=20", None
+    if scenario == "detail":
+        return "GET", f"/api/v1/posts/{rng.randint(1, post_count)}", None
+    if scenario == "create":
+        words = rng.choices(VOCABULARY, k=80)
+        return "POST", "/api/v1/posts/", {
+            "title": f"벤치마크 생성 {' '.join(words[:3])}",
+            "content": " ".join(words),
+            "category_id": rng.choice(category_ids),
+            "auto_summarize": True
+        }
+    if scenario == "regenerate":
+        return "POST", f"/api/v1/posts/{rng.randint(1, post_count)}/regenerate-summary?force=true", None
+    raise ValueError(scenario)
+
+async def run_scenario(client, scenario: str, args, post_count: int, category_ids) -> dict:
+    rng = random.Random(f"{args.seed}:{scenario}")
+    requests = [make_request(scenario, rng, post_count, category_ids) for _ in range(args.requests)]
+    latencies = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < len(requests):
+            method, path, body = requests[next_index]
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                if response.status_code >= 400:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    # 예열 (커넥션 풀, 검색 색인 캐시 등)
+    for method, path, body in requests[:min(5, len(requests))]:
+        await client.request(method, path, json=body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3)
+    }
+
+async def run_benchmark(args) -> dict:
+    import httpx
+    from sqlalchemy import func, select
+    from app.core.database import engine
+    from app.models.category import Category
+    from app.models.post import Post
+    from app.main import app
+
+    with engine.connect() as connection:
+        post_count = connection.execute(select(func.max(Post.id))).scalar_one()
+        category_ids = list(connection.execute(select(Category.id)).scalars())
+
+    # ASGITransport는 lifespan을 실행하지 않으므로 시작/종료 이벤트를 직접 실행
+    await app.router.startup()
+    results = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            for scenario in args.scenarios:
+                result = await run_scenario(client, scenario, args, post_count, category_ids)
+                results[scenario] = result
+                print(
+                    f"   {scenario:<11}{result['throughput_rps']:>9.1f}{result['p50_ms']:>9.1f}"
+                    f"{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}{result['errors']:>7}"
+                )
+    finally:
+        await app.router.shutdown()
+    return results
+
+# ----------------------------------------------------------------------
+# 결과
+# ----------------------------------------------------------------------
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def print_comparison(results: dict, baseline_path: str):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\n📊 기준 결과와 비교 ({baseline_path}, {baseline['meta'].get('git_revision')})")
+    print(f"   {'시나리오':<9}{'처리량':>12}{'p95':>12}{'p99':>12}")
+    for scenario, result in results.items():
+        before = baseline["results"].get(scenario)
+        if before is None:
+            continue
+
+        def change(key):
+            return (result[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+
+        print(
+            f"   {scenario:<11}{change('throughput_rps'):>+11.1f}%"
+            f"{change('p95_ms'):>+11.1f}%{change('p99_ms'):>+11.1f}%"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="API 통합 벤치마크")
+    parser.add_argument("--posts", type=int, default=10000, help="적재할 게시물 수 (1만~100만)")
+    parser.add_argument("--summary-ratio", type=float, default=0.9, help="요약이 있는 게시물 비율")
+    parser.add_argument("--batch-size", type=int, default=5000, help="적재 배치 크기")
+    parser.add_argument("--database-url", default="", help="DB URL (기본: 임시 SQLite)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="실행할 시나리오 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="가짜 LLM 응답 지연 (초)")
+    parser.add_argument("--response-cache", action="store_true", help="응답 캐시 사용")
+    parser.add_argument("--seed", type=int, default=42, help="데이터/요청 생성 시드")
+    parser.add_argument("--label", default="", help="결과에 남길 실행 이름")
+    parser.add_argument("--output", default="", help="결과 JSON 파일")
+    parser.add_argument("--compare", default="", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}")
+
+    print("🔧 SeeQ API 통합 벤치마크")
+    print("=" * 50)
+
+    database_url = args.database_url or (
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='seeq_suite_'), 'suite.db')}"
+    )
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{FAKE_OPENAI_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["RESPONSE_CACHE_ENABLED"] = str(args.response_cache)
+    os.environ["SUMMARY_WORKER_COUNT"] = "0"
+    os.environ["LLM_RATE_LIMIT_RPM"] = "0"
+    os.environ["LLM_RATE_LIMIT_TPM"] = "0"
+    os.environ["DEBUG"] = "False"
+
+    import logging
+    logging.disable(logging.WARNING)
+
+    from sqlalchemy.engine import make_url
+    from fake_openai import BackgroundServer, create_fake_openai_app
+
+    backend = make_url(database_url).get_backend_name()
+    print(f"\n1️⃣ 데이터 적재 ({backend}, 게시물 {args.posts:,}건, 시드 {args.seed})")
+    seeding = seed(args)
+
+    print(f"\n2️⃣ 시나리오 실행 (요청 {args.requests}건, 동시 {args.concurrency}, LLM 지연 {args.llm_latency}초)")
+    print(f"   {'시나리오':<9}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'오류':>6}")
+    fake_openai = BackgroundServer(create_fake_openai_app(args.llm_latency), port=FAKE_OPENAI_PORT)
+    fake_openai.start()
+    try:
+        results = asyncio.run(run_benchmark(args))
+    finally:
+        fake_openai.stop()
+
+    report = {
+        "meta": {
+            "label": args.label,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": backend,
+            "posts": args.posts,
+            "summary_ratio": args.summary_ratio,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "llm_latency": args.llm_latency,
+            "response_cache": args.response_cache,
+            "seed": args.seed,
+            "seeding": seeding
+        },
+        "results": results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+    if args.compare:
+        print_comparison(results, args.compare)
+
+    failed = [scenario for scenario, result in results.items() if result["errors"]]
+    if failed:
+        print(f"\n❌ 오류가 있는 시나리오: {', '.join(failed)}")
+        return False
+    print("\n✅ 모든 시나리오 완료")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,109 @@
+"""
+긴 본문 조각 경계 안정성 점검 (부분 요약 캐시 재사용 확인)
+
+합성 한국어 문서를 split_into_chunks로 나눈 뒤 문단 하나씩 고쳐서
+(문단 뒤에 400자 덧붙이기 / 문단 가운데에 문장 끼워 넣기) 다시 나누고,
+고친 문단이 없는 조각이 그대로 남아 부분 요약 캐시 키가 재사용되는지 확인합니다.
+
+- 덧붙이기: 경계 해시(문단 앞부분)가 그대로인 경우 고친 문단이 없는 조각은 모두 그대로여야 함
+  (BOUNDARY_PREFIX_CHARS보다 짧은 문단은 해시가 바뀌므로 재사용률만 집계)
+- 끼워 넣기: 짧은 문단은 경계 해시가 바뀌어 이웃 조각과 합쳐지거나 나뉠 수 있어 재사용률만 보고
+덧붙이기에서 다른 조각이 하나라도 바뀌면 종료 코드 1로 끝나므로 CI에서 사용할 수 있습니다.
+
+사용법:
+    cd backend
+    python benchmarks/check_chunk_stability.py --documents 50
+"""
+
+import argparse
+import os
+import random
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from app.utils.chunking import paragraph_fingerprint, split_into_chunks
+
+# (이름, 문단 수, 문단 최소/최대 글자 수)
+LAYOUTS = [
+    ("보통 문단", 30, 150, 900),
+    ("짧은 문단", 80, 30, 200),
+    ("긴 문단", 20, 300, 1500),
+]
+
+def make_paragraph(rng, chars):
+    words = []
+    length = 0
+    while length < chars:
+        word = "".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 4)))
+        word += rng.choice(["다.", "요.", "", ""])
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+def untouched_chunks(chunks, paragraphs, indexes):
+    """indexes 문단을 하나도 포함하지 않는 조각"""
+    return [chunk for chunk in chunks if not any(paragraphs[index] in chunk for index in indexes)]
+
+def main():
+    parser = argparse.ArgumentParser(description="긴 본문 조각 경계 안정성 점검")
+    parser.add_argument("--documents", type=int, default=50, help="문서 구성별 합성 문서 수")
+    parser.add_argument("--max-tokens", type=int, default=2000, help="조각 토큰 예산")
+    args = parser.parse_args()
+
+    print("🔍 SeeQ 긴 본문 조각 경계 안정성 점검")
+    print("=" * 58)
+
+    rng = random.Random(42)
+    failures = 0
+    for name, paragraph_count, min_chars, max_chars in LAYOUTS:
+        edits = chunk_total = 0
+        append_kept = append_total = 0
+        insert_kept = insert_total = 0
+        layout_failures = 0
+        for _ in range(args.documents):
+            paragraphs = [make_paragraph(rng, rng.randint(min_chars, max_chars)) for _ in range(paragraph_count)]
+            chunks = split_into_chunks("\n\n".join(paragraphs), args.max_tokens)
+            chunk_total += len(chunks)
+
+            for index in range(paragraph_count):
+                edits += 1
+                # 1. 문단 뒤에 덧붙이기 - 다른 조각은 모두 그대로여야 함
+                edited = list(paragraphs)
+                edited[index] = paragraphs[index] + " " + make_paragraph(rng, 400)
+                new_chunks = set(split_into_chunks("\n\n".join(edited), args.max_tokens))
+                others = untouched_chunks(chunks, paragraphs, [index])
+                kept = sum(1 for chunk in others if chunk in new_chunks)
+                same_boundary = paragraph_fingerprint(edited[index]) == paragraph_fingerprint(paragraphs[index])
+                if same_boundary and kept < len(others):
+                    layout_failures += 1
+                append_kept += kept
+                append_total += len(others)
+
+                # 2. 문단 가운데에 문장 끼워 넣기 - 재사용률만 집계
+                edited = list(paragraphs)
+                middle = len(paragraphs[index]) // 2
+                edited[index] = paragraphs[index][:middle] + make_paragraph(rng, 60) + paragraphs[index][middle:]
+                new_chunks = set(split_into_chunks("\n\n".join(edited), args.max_tokens))
+                insert_kept += sum(1 for chunk in others if chunk in new_chunks)
+                insert_total += len(others)
+
+        failures += layout_failures
+        status = "✅" if not layout_failures else "❌"
+        print(
+            f"{status} {name:<8} 조각 평균 {chunk_total / args.documents:5.1f}개 | "
+            f"다른 조각 재사용 - 덧붙이기 {append_kept / max(1, append_total):.1%}, "
+            f"끼워 넣기 {insert_kept / max(1, insert_total):.1%} | 다른 조각 변경 {layout_failures}/{edits}"
+        )
+
+    print()
+    if failures:
+        print(f"❌ 문단 하나에 덧붙였는데 다른 조각이 바뀐 경우가 {failures}건 있습니다.")
+    else:
+        print("✅ 문단 하나에 덧붙여도 다른 조각은 그대로입니다.")
+    return failures == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
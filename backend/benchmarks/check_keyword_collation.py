@@ -0,0 +1,115 @@
+"""
+키워드 이름 콜레이션 점검 (악센트/전각을 구분하지 않는 DB에서 키워드 색인)
+
+MySQL 기본 콜레이션(utf8mb4_0900_ai_ci)은 "café"와 "cafe", "ｒｅｓｔ"와 "rest"를 같은 값으로 봅니다.
+keywords.name은 새로 만들면 바이너리 콜레이션이지만, 그 전에 만든 테이블에서도 요약 저장이
+실패하지 않아야 하므로 SQLite에 같은 규칙의 콜레이션을 등록해 keywords 테이블을 만들고
+서로 다른 표기의 키워드를 차례로 색인합니다.
+
+- 색인 중 예외가 없어야 함
+- DB가 같은 값으로 보는 표기는 같은 키워드 ID로 연결되어야 함 (게시물당 한 번만)
+하나라도 어긋나면 종료 코드 1로 끝나므로 CI에서 사용할 수 있습니다.
+
+사용법:
+    cd backend
+    python benchmarks/check_keyword_collation.py
+"""
+
+import os
+import sys
+import tempfile
+import unicodedata
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+# (게시물, 요약 키워드) - 같은 게시물 안에서 겹치는 표기도 포함
+CASES = [
+    ("기존 표기", ["cafe", "rest", "회의록"]),
+    ("악센트/전각 표기", ["café", "ｒｅｓｔ", "새 키워드"]),
+    ("한 요약 안의 두 표기", ["CAFÉ", "cafe", "Ｒest"]),
+]
+
+# DB가 같은 값으로 보는 표기끼리 같은 키워드여야 함
+EXPECTED_SAME = [("cafe", "café"), ("rest", "ｒｅｓｔ")]
+
+def accent_insensitive_key(value: str) -> str:
+    """utf8mb4_0900_ai_ci처럼 악센트/전각/대소문자를 무시한 비교 형태"""
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+def compare(left: str, right: str) -> int:
+    left, right = accent_insensitive_key(left), accent_insensitive_key(right)
+    return (left > right) - (left < right)
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="seeq_keyword_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'keyword.db')}"
+
+    import logging
+    logging.disable(logging.INFO)
+
+    from sqlalchemy import event, select, text
+    from app.core.database import Base, SessionLocal, engine
+    from app.models.category import Category
+    from app.models.keyword import Keyword, PostKeyword
+    from app.models.post import Post
+    from app.services.keyword_service import keyword_index
+
+    @event.listens_for(engine, "connect")
+    def register_collation(connection, _):
+        connection.create_collation("ai_ci", compare)
+
+    # keywords 테이블만 악센트를 구분하지 않는 콜레이션으로 (바이너리 콜레이션 이전 MySQL 테이블과 같은 동작)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE keywords (id INTEGER PRIMARY KEY, name VARCHAR(50) COLLATE ai_ci NOT NULL UNIQUE)"
+        ))
+    Base.metadata.create_all(bind=engine)
+
+    print("🔍 SeeQ 키워드 콜레이션 점검")
+    print("=" * 58)
+    failures = 0
+    with SessionLocal() as db:
+        category = Category(name="점검")
+        db.add(category)
+        db.flush()
+        for name, keywords in CASES:
+            post = Post(title=name, content="키워드 콜레이션 점검", category_id=category.id)
+            db.add(post)
+            db.flush()
+            try:
+                keyword_index.index_post(db, post.id, category.id, keywords)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                failures += 1
+                print(f"❌ {name:<16} 색인 실패: {type(e).__name__}: {e}")
+                continue
+            linked = db.execute(
+                select(Keyword.name)
+                .join(PostKeyword, PostKeyword.keyword_id == Keyword.id)
+                .where(PostKeyword.post_id == post.id)
+                .order_by(PostKeyword.position)
+            ).scalars().all()
+            print(f"✅ {name:<16} {keywords} → {linked}")
+
+        keyword_ids = dict(db.execute(select(Keyword.name, Keyword.id)).all())
+        for left, right in EXPECTED_SAME:
+            left_id = db.execute(select(Keyword.id).where(Keyword.name == left)).scalar()
+            right_id = db.execute(select(Keyword.id).where(Keyword.name == right)).scalar()
+            if left_id is None or left_id != right_id:
+                failures += 1
+                print(f"❌ '{left}'와 '{right}'가 다른 키워드입니다 ({left_id}, {right_id})")
+        print(f"   저장된 키워드 {len(keyword_ids)}개: {sorted(keyword_ids)}")
+
+    print()
+    if failures:
+        print(f"❌ 키워드 색인 점검 {failures}건 실패")
+    else:
+        print("✅ 다른 표기의 키워드도 같은 키워드 행으로 색인됩니다.")
+    return failures == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
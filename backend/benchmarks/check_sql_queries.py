@@ -0,0 +1,133 @@
+"""
+API별 SQL 문장 수 점검 (쿼리 수 회귀 확인)
+
+SQL_PROFILER_ENABLED로 앱을 띄워 주요 API를 한 번씩 호출하고
+응답 헤더(X-SQL-Queries, X-SQL-N-Plus-One)를 API별 허용치와 비교합니다.
+응답 캐시는 끄고 (항상 DB 경로), 요약은 요청하지 않습니다 (LLM 호출 없음).
+
+허용치를 넘거나 N+1 의심 패턴이 보이면 종료 코드 1로 끝나므로 CI에서 사용할 수 있습니다.
+문장별 상세 내역은 --report 파일(JSON Lines)에 기록됩니다.
+
+사용법:
+    cd backend
+    python benchmarks/check_sql_queries.py --report sql_profile.jsonl
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+# (이름, 메서드, 경로, 본문, 허용 문장 수)
+# 경로의 {post_id}/{category_id}는 준비 단계에서 만든 ID로 채움
+CHECKS = [
+    ("카테고리 목록", "GET", "/api/v1/categories/", None, 1),
+    ("카테고리 조회", "GET", "/api/v1/categories/{category_id}", None, 1),
+    ("카테고리 생성", "POST", "/api/v1/categories/", {"name": "점검용"}, 3),
+    ("게시물 목록", "GET", "/api/v1/posts/?size=20", None, 3),
+    ("게시물 목록 (compact)", "GET", "/api/v1/posts/?size=20&view=compact", None, 3),
+    ("게시물 목록 (카테고리)", "GET", "/api/v1/posts/?size=20&category_id={category_id}", None, 3),
+    ("게시물 목록 (검색)", "GET", "/api/v1/posts/?size=20&search=점검", None, 3),
+    ("게시물 조회", "GET", "/api/v1/posts/{post_id}", None, 2),
+    ("의미 검색", "GET", "/api/v1/posts/semantic-search?q=점검", None, 1),
+    ("요약 상태", "GET", "/api/v1/posts/{post_id}/summary-status", None, 2),
+    ("게시물 생성", "POST", "/api/v1/posts/", {
+        "title": "점검 게시물", "content": "쿼리 수 점검용 본문", "category_id": "{category_id}",
+        "auto_summarize": False
+    }, 4),
+    ("게시물 수정", "PUT", "/api/v1/posts/{post_id}", {"title": "점검 게시물 (수정)"}, 4),
+    ("게시물 삭제", "DELETE", "/api/v1/posts/{last_post_id}", None, 4),
+    ("카테고리 삭제", "DELETE", "/api/v1/categories/{empty_category_id}", None, 5),
+]
+
+def fill(value, ids):
+    if isinstance(value, str):
+        if value.startswith("{") and value.endswith("}") and value[1:-1] in ids:
+            return ids[value[1:-1]]
+        return value.format(**ids)
+    if isinstance(value, dict):
+        return {key: fill(item, ids) for key, item in value.items()}
+    return value
+
+async def run_checks(args):
+    import httpx
+    from app.core.database import Base, engine
+    from app.main import app
+
+    # ASGITransport는 lifespan(startup)을 실행하지 않으므로 테이블을 직접 생성
+    Base.metadata.create_all(bind=engine)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+        category = (await client.post("/api/v1/categories/", json={"name": "점검"})).json()
+        empty_category = (await client.post("/api/v1/categories/", json={"name": "빈 카테고리"})).json()
+        response = await client.post("/api/v1/posts/bulk", json={"posts": [
+            {
+                "title": f"점검 게시물 {i}",
+                "content": "쿼리 수 점검용 본문입니다. " * 10,
+                "category_id": category["id"],
+                "auto_summarize": False
+            }
+            for i in range(args.posts)
+        ]})
+        response.raise_for_status()
+        post_ids = [item["post_id"] for item in response.json()["results"]]
+        ids = {
+            "category_id": category["id"],
+            "empty_category_id": empty_category["id"],
+            "post_id": post_ids[0],
+            "last_post_id": post_ids[-1]
+        }
+
+        failures = 0
+        print(f"{'API':<24}{'상태':>6}{'문장':>6}{'허용':>6}{'시간(ms)':>10}{'N+1':>6}")
+        print("-" * 58)
+        for name, method, path, body, budget in CHECKS:
+            response = await client.request(method, fill(path, ids), json=fill(body, ids))
+            queries = int(response.headers["x-sql-queries"])
+            n_plus_one = int(response.headers["x-sql-n-plus-one"])
+            failed = response.status_code >= 400 or queries > budget or n_plus_one > 0
+            failures += failed
+            print(
+                f"{name:<24}{response.status_code:>6}{queries:>6}{budget:>6}"
+                f"{float(response.headers['x-sql-time-ms']):>10.2f}{n_plus_one:>6}"
+                f"{'  ❌' if failed else ''}"
+            )
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="API별 SQL 문장 수 점검")
+    parser.add_argument("--posts", type=int, default=30, help="준비할 게시물 수")
+    parser.add_argument("--report", default="", help="문장별 상세 내역 파일 (JSON Lines)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="seeq_sql_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'sql.db')}"
+    os.environ["SQL_PROFILER_ENABLED"] = "True"
+    os.environ["SQL_PROFILER_REPORT_PATH"] = os.path.abspath(args.report) if args.report else ""
+    os.environ["RESPONSE_CACHE_ENABLED"] = "False"
+    os.environ["SUMMARY_WORKER_COUNT"] = "0"
+    os.environ["DEBUG"] = "False"
+
+    import logging
+    logging.disable(logging.INFO)
+
+    print("🔍 SeeQ API별 SQL 문장 수 점검")
+    print("=" * 58)
+    failures = asyncio.run(run_checks(args))
+    print()
+    if failures:
+        print(f"❌ {failures}개 API가 허용치를 넘거나 N+1 의심 패턴이 있습니다.")
+    else:
+        print("✅ 모든 API가 허용치 이내입니다.")
+    if args.report:
+        print(f"   상세 내역: {args.report}")
+    return failures == 0
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
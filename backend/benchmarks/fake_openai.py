@@ -0,0 +1,114 @@
+"""
+로컬 가짜 OpenAI 엔드포인트
+
+/v1/chat/completions 를 흉내 내며, 설정한 지연 시간 뒤에
+항상 같은 형식의 요약 JSON을 돌려줍니다. 부하 테스트에서
+실제 OpenAI 대신 OPENAI_BASE_URL로 지정해서 사용합니다.
+
+stream=true 요청에는 첫 조각을 지연 시간의 FIRST_TOKEN_RATIO 만큼 뒤에 보내고,
+나머지 조각을 남은 시간 동안 나눠서 SSE로 보냅니다.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+FAKE_SUMMARY = {
+    "summary": "가짜 LLM이 생성한 요약입니다. 부하 테스트용 고정 응답입니다.",
+    "highlights": ["첫 번째 핵심 포인트", "두 번째 핵심 포인트", "세 번째 핵심 포인트"],
+    "keywords": ["부하", "테스트", "요약", "가짜", "LLM"],
+    "confidence_score": 90
+}
+
+FIRST_TOKEN_RATIO = 0.1
+STREAM_CHUNK_CHARS = 8
+
+def create_fake_openai_app(latency: float = 1.0) -> FastAPI:
+    """latency초 뒤에 응답하는 가짜 OpenAI 앱 생성"""
+
+    app = FastAPI()
+    app.state.latency = latency
+    app.state.calls = 0
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        app.state.calls += 1
+        content = json.dumps(FAKE_SUMMARY, ensure_ascii=False)
+
+        if body.get("stream"):
+            return StreamingResponse(
+                stream_chunks(body.get("model", "fake-model"), content, app.state.latency),
+                media_type="text/event-stream"
+            )
+
+        await asyncio.sleep(app.state.latency)
+        return {
+            "id": f"chatcmpl-fake-{app.state.calls}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake-model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
+        }
+
+    async def stream_chunks(model: str, content: str, latency: float):
+        pieces = [
+            content[i:i + STREAM_CHUNK_CHARS]
+            for i in range(0, len(content), STREAM_CHUNK_CHARS)
+        ]
+        interval = latency * (1 - FIRST_TOKEN_RATIO) / max(1, len(pieces) - 1)
+        chunk_id = f"chatcmpl-fake-{app.state.calls}"
+
+        await asyncio.sleep(latency * FIRST_TOKEN_RATIO)
+        for index, piece in enumerate(pieces):
+            if index:
+                await asyncio.sleep(interval)
+            chunk = {
+                "id": chunk_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]
+            }
+            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+        done = {
+            "id": chunk_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+        }
+        yield f"data: {json.dumps(done)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return app
+
+class BackgroundServer:
+    """uvicorn 서버를 별도 스레드에서 실행"""
+
+    def __init__(self, app, host: str = "127.0.0.1", port: int = 8100):
+        self.config = uvicorn.Config(app, host=host, port=port, log_level="warning")
+        self.server = uvicorn.Server(self.config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.05)
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
+
+if __name__ == "__main__":
+    uvicorn.run(create_fake_openai_app(), host="127.0.0.1", port=8100)
@@ -0,0 +1,139 @@
+"""
+LLM 호출 중 조회 지연 부하 테스트
+
+가짜 OpenAI 엔드포인트(지연 시간 설정 가능)를 띄운 뒤,
+요약 미리보기 요청을 다수 동시에 보내는 동안 GET /api/v1/posts/
+응답 시간이 평소와 같은 수준으로 유지되는지 확인합니다.
+
+사용법:
+    cd backend
+    python benchmarks/load_test_llm.py --summaries 50 --llm-latency 2.0
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+APP_PORT = 8101
+FAKE_OPENAI_PORT = 8100
+
+def percentile(samples, pct):
+    """단순 백분위수 계산"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def describe(label, samples):
+    print(
+        f"   {label}: n={len(samples)} "
+        f"p50={percentile(samples, 50) * 1000:.1f}ms "
+        f"p95={percentile(samples, 95) * 1000:.1f}ms "
+        f"max={max(samples) * 1000:.1f}ms"
+    )
+
+async def sample_reads(client, count, interval):
+    """GET /posts 응답 시간 샘플링"""
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await client.get("/api/v1/posts/", params={"limit": 20})
+        response.raise_for_status()
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(interval)
+    return samples
+
+async def run_load_test(args) -> bool:
+    import httpx
+
+    base_url = f"http://127.0.0.1:{APP_PORT}"
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        # 1. 테스트 데이터 준비
+        category = await client.post("/api/v1/categories/", json={"name": "부하테스트"})
+        category.raise_for_status()
+        category_id = category.json()["id"]
+        for i in range(args.posts):
+            response = await client.post("/api/v1/posts/", json={
+                "title": f"부하 테스트 게시물 {i}",
+                "content": "부하 테스트용 본문입니다. " * 20,
+                "category_id": category_id,
+                "auto_summarize": False
+            })
+            response.raise_for_status()
+
+        # 2. 기준 조회 지연
+        print("1️⃣ 기준 조회 지연 측정...")
+        baseline = await sample_reads(client, args.reads, 0.01)
+        describe("GET /posts (idle)", baseline)
+
+        # 3. 요약 다수 진행 중 조회 지연
+        print(f"\n2️⃣ 요약 {args.summaries}건 진행 중 조회 지연 측정...")
+        summary_started = time.perf_counter()
+        summary_tasks = [
+            asyncio.create_task(client.post("/api/v1/posts/preview-summary", json={
+                "title": f"요약 {i}",
+                "content": "요약 부하 테스트 본문입니다. " * 50,
+                "category": "기타"
+            }))
+            for i in range(args.summaries)
+        ]
+        await asyncio.sleep(0.05)
+        under_load = await sample_reads(client, args.reads, 0.01)
+        responses = await asyncio.gather(*summary_tasks)
+        summary_elapsed = time.perf_counter() - summary_started
+        describe("GET /posts (under load)", under_load)
+
+        ok = sum(1 for r in responses if r.status_code == 200)
+        print(f"   요약 {ok}/{len(responses)}건 성공, 소요 {summary_elapsed:.2f}s")
+
+    # 4. 판정: 부하 중 p95가 기준 p95 + 허용치 이내인지
+    allowed = percentile(baseline, 95) * args.tolerance + 0.05
+    passed = percentile(under_load, 95) <= allowed and ok == len(responses)
+    print()
+    if passed:
+        print("✅ 요약 진행 중에도 조회 지연이 유지되었습니다.")
+    else:
+        print(f"❌ 부하 중 조회 p95가 허용치({allowed * 1000:.1f}ms)를 넘었거나 요약이 실패했습니다.")
+    return passed
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 호출 중 조회 지연 부하 테스트")
+    parser.add_argument("--summaries", type=int, default=50, help="동시 요약 요청 수")
+    parser.add_argument("--llm-latency", type=float, default=2.0, help="가짜 LLM 응답 지연(초)")
+    parser.add_argument("--reads", type=int, default=50, help="조회 샘플 수")
+    parser.add_argument("--posts", type=int, default=20, help="미리 생성할 게시물 수")
+    parser.add_argument("--tolerance", type=float, default=3.0, help="기준 p95 대비 허용 배수")
+    args = parser.parse_args()
+
+    print("🔧 SeeQ LLM 부하 테스트")
+    print("=" * 50)
+
+    # 앱 import 전에 환경 설정 (가짜 OpenAI + 임시 SQLite)
+    workdir = tempfile.mkdtemp(prefix="seeq_load_")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'load.db')}"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{FAKE_OPENAI_PORT}/v1"
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+    os.environ["DEBUG"] = "False"
+
+    from fake_openai import BackgroundServer, create_fake_openai_app
+    from app.main import app
+
+    fake_openai = BackgroundServer(create_fake_openai_app(args.llm_latency), port=FAKE_OPENAI_PORT)
+    api_server = BackgroundServer(app, port=APP_PORT)
+    fake_openai.start()
+    api_server.start()
+
+    try:
+        return asyncio.run(run_load_test(args))
+    finally:
+        api_server.stop()
+        fake_openai.stop()
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
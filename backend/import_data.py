@@ -0,0 +1,109 @@
+"""
+대량 데이터 적재 스크립트
+JSONL/CSV(.gz 포함) 파일의 카테고리, 태그, 게시물, 요약을 배치 upsert로 적재
+
+사용법:
+    python import_data.py posts.jsonl
+    python import_data.py categories.csv posts.csv.gz --batch-size 10000
+    python import_data.py data.jsonl --kind posts --resume
+
+- 종류는 각 행의 type 필드(category/tag/post/summary) → --kind → 파일 이름 순서로 정합니다.
+- 게시물은 category(이름) 또는 category_id가 필요하고, summary 객체(또는 CSV의 summary/highlights/keywords
+  컬럼)가 있으면 요약도 함께 저장합니다. 목록 값은 JSON 배열이나 "a|b|c" 형식을 사용합니다.
+- 진행 위치는 --state 파일에 배치마다 기록되며 --resume으로 중단된 지점부터 이어서 적재합니다.
+- 적재 후 카테고리별 게시물 카운터, 통계 집계, 관련 게시물을 다시 계산합니다. 실행 중인 서버의 검색 색인/응답 캐시는
+  재시작해야 새 데이터가 반영됩니다.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import create_tables
+from app.services.count_service import post_count_service
+from app.services.import_service import KINDS, BulkImporter
+from app.services.related_service import related_service
+from app.services.semantic_service import semantic_index
+from app.services.stats_service import stats_service
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="SeeQ 대량 데이터 적재")
+    parser.add_argument("files", nargs="+", help="적재할 JSONL/CSV 파일 (.gz 가능)")
+    parser.add_argument("--kind", choices=KINDS, help="파일 전체의 데이터 종류 (기본: type 필드 또는 파일 이름으로 추정)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="한 번에 저장할 행 수 (기본 5000)")
+    parser.add_argument("--state", default=".import_state.json", help="진행 상태 파일 경로")
+    parser.add_argument("--resume", action="store_true", help="상태 파일의 위치부터 이어서 적재")
+    parser.add_argument("--max-errors", type=int, default=100, help="허용할 형식 오류 행 수 (넘으면 중단)")
+    return parser.parse_args()
+
+def print_progress(path: str, line: int, elapsed: float):
+    rate = line / elapsed if elapsed > 0 else 0
+    print(f"   {os.path.basename(path)}: {line:,}행 ({rate:,.0f}행/초)")
+
+def main():
+    """메인 함수"""
+
+    args = parse_args()
+
+    print("🚀 SeeQ 대량 데이터 적재")
+    print("=" * 40)
+
+    if not args.resume and os.path.exists(args.state):
+        os.remove(args.state)
+
+    importer = BulkImporter(
+        batch_size=args.batch_size,
+        state_path=args.state,
+        max_errors=args.max_errors,
+        progress=print_progress
+    )
+    if args.resume:
+        importer.load_state()
+        print(f"⏯️ 상태 파일에서 재개: {args.state}")
+
+    started = time.perf_counter()
+    try:
+        create_tables()
+
+        for index, path in enumerate(args.files, 1):
+            print(f"{index}️⃣ {path} 적재...")
+            imported = importer.import_file(path, args.kind)
+            print(f"✅ {imported:,}행 저장")
+
+        print("\n🔢 게시물 카운터 및 통계 집계 재계산...")
+        post_count_service.rebuild()
+        stats_service.rebuild()
+
+        # 관련 게시물은 본문 유사도에 의미 검색 벡터를 쓰므로 색인을 먼저 구성
+        print("🔗 관련 게시물 재계산...")
+        semantic_index.prepare()
+        related_service.rebuild()
+
+    except KeyboardInterrupt:
+        print(f"\n⏸️ 중단됨 - --resume으로 이어서 적재할 수 있습니다 (상태 파일: {args.state})")
+        return False
+    except Exception as e:
+        print(f"❌ 데이터 적재 실패: {e}")
+        print(f"   마지막 배치까지는 저장되었습니다 - 원인을 고친 뒤 --resume으로 재개하세요")
+        return False
+
+    elapsed = time.perf_counter() - started
+    total = sum(importer.counts.values())
+    print(f"\n🎉 적재 완료! ({elapsed:.1f}초, 평균 {total / elapsed if elapsed else 0:,.0f}행/초)")
+    for kind, count in importer.counts.items():
+        if count:
+            print(f"   {kind}: {count:,}행")
+    if importer.errors:
+        print(f"⚠️ 형식 오류로 건너뛴 행: {importer.errors:,}개")
+
+    if os.path.exists(args.state):
+        os.remove(args.state)
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
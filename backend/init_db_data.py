@@ -8,10 +8,26 @@ import os
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal, engine
+from app.core.database import SessionLocal, engine, upsert_rows
 from app.models import Category, Tag
 
+def _upsert_missing(db: Session, model, rows, label: str) -> int:
+    """이름 목록을 한 번에 조회하고 없는 행만 한 문장으로 추가 (기존 행은 그대로 둠)"""
+    names = [row["name"] for row in rows]
+    existing = set(db.execute(select(model.name).where(model.name.in_(names))).scalars())
+    
+    for name in names:
+        if name in existing:
+            print(f"⏭️ {label} 이미 존재: {name}")
+        else:
+            print(f"✅ {label} 생성: {name}")
+    
+    upsert_rows(db, model.__table__, rows, ["name"])
+    db.commit()
+    return len(names) - len(existing)
+
 def create_default_categories(db: Session):
     """기본 카테고리 생성"""
     
@@ -22,21 +38,8 @@ def create_default_categories(db: Session):
         {"name": "기타", "description": "기타 분류되지 않은 내용"}
     ]
     
-    created_count = 0
+    created_count = _upsert_missing(db, Category, categories_data, "카테고리")
     
-    for cat_data in categories_data:
-        # 이미 존재하는지 확인
-        existing = db.query(Category).filter(Category.name == cat_data["name"]).first()
-        
-        if not existing:
-            category = Category(**cat_data)
-            db.add(category)
-            created_count += 1
-            print(f"✅ 카테고리 생성: {cat_data['name']}")
-        else:
-            print(f"⏭️ 카테고리 이미 존재: {cat_data['name']}")
-    
-    db.commit()
     print(f"📝 총 {created_count}개 카테고리 생성")
 
 def create_default_tags(db: Session):
@@ -51,21 +54,8 @@ def create_default_tags(db: Session):
         {"name": "학습정리", "color": "#f0f4c3"}
     ]
     
-    created_count = 0
-    
-    for tag_data in tags_data:
-        # 이미 존재하는지 확인
-        existing = db.query(Tag).filter(Tag.name == tag_data["name"]).first()
-        
-        if not existing:
-            tag = Tag(**tag_data)
-            db.add(tag)
-            created_count += 1
-            print(f"✅ 태그 생성: {tag_data['name']}")
-        else:
-            print(f"⏭️ 태그 이미 존재: {tag_data['name']}")
+    created_count = _upsert_missing(db, Tag, tags_data, "태그")
     
-    db.commit()
     print(f"🏷️ 총 {created_count}개 태그 생성")
 
 def main():